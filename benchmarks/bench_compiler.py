@@ -0,0 +1,85 @@
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file
+# in the root directory of this source tree.
+
+# Parser benchmarks:
+#   - times every stage of the .lc front end (tokenize, parse, prepare) on generated melodies of growing size
+#   - prints the time per melody line, which stays about the same for every size as long as the parser scales linearly
+#   - results are saved as JSON and can be compared against an earlier run like the pipeline benchmarks
+#   - run from the root directory:
+#       python benchmarks/bench_compiler.py
+#       python benchmarks/bench_compiler.py --sizes 10000 100000 --compare benchmarks/results/compiler.json
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import lick_interpreter as li
+import lick_syntax as ls
+from bench_pipeline import compare_results, time_function
+import synthetic
+
+RESULTS_FILE = os.path.join(ROOT, "benchmarks", "results", "compiler.json")
+MELODIES = {"calls" : synthetic.melody_text, "blocks" : synthetic.control_flow_text}
+
+
+#   - returns the timed functions of all stages for one melody, every stage starts from the result of the stage before
+def stages(source):
+    tokens = ls.tokenize(source)
+    program = ls.Parser(tokens).program()
+    return [("tokenize", lambda: ls.tokenize(source)),
+            ("parse", lambda: ls.Parser(tokens).program()),
+            ("prepare", lambda: li.prepare(program)),
+            ("total", lambda: li.prepare(ls.parse(source)))]
+
+def run_benchmarks(sizes, repeat):
+    results = {"params" : {"sizes" : sizes},
+               "machine" : {"python" : platform.python_version(), "platform" : platform.platform()},
+               "date" : time.strftime("%Y-%m-%d %H:%M:%S"),
+               "benchmarks" : {}}
+    for melody, melody_text in MELODIES.items():
+        for size in sizes:
+            source, beats = melody_text(size)
+            lines = source.count("\n")
+            timings = []
+            for stage, function in stages(source):
+                result = time_function(function, repeat)
+                result["us_per_line"] = result["median"] / lines * 1e6
+                results["benchmarks"][f"{melody}/{size}/{stage}"] = result
+                timings.append(f"{stage} {result['median'] * 1000:8.1f}ms")
+            print(f"{melody:>6} {size:>7} statements ({lines:>7} lines): {'  '.join(timings)}  "
+                  f"= {results['benchmarks'][f'{melody}/{size}/total']['us_per_line']:6.1f}us/line")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks of the .lc parser.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000], help="statements of the generated melodies")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per benchmark")
+    parser.add_argument("-o", "--output", default=RESULTS_FILE, help="JSON file for the results")
+    parser.add_argument("--compare", help="JSON results of an earlier run")
+    parser.add_argument("--threshold", type=float, default=1.2, help="ratio above which a benchmark counts as slower")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.sizes, args.repeat)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"\nResults saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r") as file:
+            regressions = compare_results(results, json.load(file), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmarks got slower: {', '.join(regressions)}")
+            sys.exit(1)
@@ -0,0 +1,71 @@
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file
+# in the root directory of this source tree.
+
+# Micro-benchmark of the degree resolution:
+#   - compares parsing every degree of a notes string on every call with the cached degree lookup table of lick_writer
+#   - run from the root directory: python benchmarks/bench_degrees.py
+
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lick_writer as lw
+
+NOTES = [("[1, 3, 5, 7]", "ionian"), ("[1, 2, 3, 4, 5, 6, 7, 1va]", "dorian"), ("[-3, -5, 1, 3va, 5vb, 2.5, 1.25]", "mixolydian"),
+         ("[1, 1.5, 2, 2.5, 3, 3.75, 4, 5, 6, 7, 1va, 2va, -7, -5, 3vb]", "harmonic_minor"), ("[1, 2, 3, 4, 5, 6, 7, 8]", "whole_half_diminished")]
+REPEAT = 20000
+
+
+#   - reference implementation, splits the notes string and parses every degree on every call
+def string_to_list_uncached(note_str):
+    note_str = note_str.strip("[]")
+    return re.split(r',\s*(?=[^,])', note_str)
+
+#   - reference implementation, see string_to_list_uncached
+def degree_to_note_uncached(degree_list, scale):
+    notes = []
+    pitch_values = []
+    for degree in degree_list:
+        if degree.find("va") != -1:
+            note_value, pitch_value = lw.degree_function(degree[:degree.find("va")], scale)
+            notes.append(note_value + 12)
+            pitch_values.append(pitch_value)
+        elif degree.find("vb") != -1:
+            note_value, pitch_value = lw.degree_function(abs(float(degree[:degree.find("vb")])), scale)
+            notes.append(note_value  - 24)
+            pitch_values.append(pitch_value)
+        elif float(degree) > 0:
+            note_value, pitch_value = lw.degree_function(degree, scale)
+            notes.append(note_value)
+            pitch_values.append(pitch_value)
+        elif float(degree) < 0:
+            note_value, pitch_value =  lw.degree_function(abs(float(degree)), scale)
+            notes.append(note_value - 12)
+            pitch_values.append(pitch_value)
+        else:
+            print(f"Note Parameter Error! Check your entert note - {degree}")
+    return notes,pitch_values
+
+#   - helper
+#   - best time per call in microseconds
+def time_call(function, repeat=REPEAT):
+    return min(timeit.repeat(function, number=repeat, repeat=5)) / repeat * 1e6
+
+
+if __name__ == "__main__":
+    for note_str, scale in NOTES:
+        degree_list = lw.string_to_list(note_str)
+        reference = degree_to_note_uncached(string_to_list_uncached(note_str), scale)
+        if list(degree_list) != string_to_list_uncached(note_str) or lw.degree_to_note(degree_list, scale) != reference:
+            print(f"ERROR! The notes of {note_str} in {scale} differ from the reference!")
+            sys.exit(1)
+
+        uncached = time_call(lambda: degree_to_note_uncached(string_to_list_uncached(note_str), scale))
+        cached = time_call(lambda: lw.degree_to_note(lw.string_to_list(note_str), scale))
+        print(f"{len(degree_list):3} notes in {scale:>22}:  uncached {uncached:6.2f}us  cached {cached:6.2f}us  ({uncached / cached:4.1f}x)")
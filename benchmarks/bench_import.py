@@ -0,0 +1,61 @@
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file
+# in the root directory of this source tree.
+
+# Import-time benchmark:
+#   - measures the startup imports of the command line paths with python -X importtime
+#   - fails if a path imports a heavy module it does not need (e.g. numpy for "database show")
+#   - run from the root directory: python benchmarks/bench_import.py
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPEAT = 5
+
+# name, code that is run, modules the path must not import
+CASES = [("cli", "import lickCorea", ["numpy", "pretty_midi", "mido"]),
+         ("database", "import lick_reader; lick_reader.list_tags()", ["numpy", "pretty_midi", "mido"]),
+         ("parser", "import lick_parser", ["numpy", "pretty_midi", "mido"]),
+         ("writer", "import lick_writer", ["pretty_midi", "mido"])]
+
+
+#   - helper
+#   - runs code in a new interpreter and returns the imported modules with their cumulative import time in microseconds
+def import_times(code):
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().split("\n")[-1])
+    modules = {}
+    top_level_time = 0
+    for line in result.stderr.split("\n"):
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_time, cumulative_time, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative_time)
+        # nested imports are indented below the module that imported them
+        if not name[1:].startswith(" "):
+            top_level_time += int(cumulative_time)
+    return modules, top_level_time
+
+#   - measures one case and returns (best total import time in ms, forbidden modules that were imported)
+def measure(code, forbidden, repeat=REPEAT):
+    best_time = None
+    for i in range(0, repeat):
+        modules, top_level_time = import_times(code)
+        best_time = top_level_time if best_time is None else min(best_time, top_level_time)
+    return best_time / 1000, [name for name in forbidden if name in modules]
+
+
+if __name__ == "__main__":
+    failed = False
+    for name, code, forbidden in CASES:
+        milliseconds, imported = measure(code, forbidden)
+        status = "ok" if not imported else "FAILED, imports " + ", ".join(imported)
+        failed = failed or bool(imported)
+        print(f"{name:>10}: {milliseconds:8.1f}ms  {status}")
+    sys.exit(1 if failed else 0)
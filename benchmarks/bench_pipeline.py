@@ -0,0 +1,180 @@
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file
+# in the root directory of this source tree.
+
+# Pipeline benchmarks:
+#   - times every stage of writeLick and readLick separately on synthetic inputs of any size
+#   - results are saved as JSON and can be compared against the results of an earlier run
+#   - run from the root directory:
+#       python benchmarks/bench_pipeline.py -o baseline.json
+#       python benchmarks/bench_pipeline.py --compare baseline.json
+
+import argparse
+import io
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import lick_reader as lr
+import lick_writer as lw
+import lick_parser as lp
+import lick_interpreter as li
+import synthetic
+
+RESULTS_FILE = os.path.join(ROOT, "benchmarks", "results", "latest.json")
+# licks per chord vibe in the shards update_database appends to
+INGEST_LICKS = 20000
+
+
+# Benchmarks:
+#   - every benchmark gets the prepared inputs and returns the function that is timed
+#
+def bench_parse_lick(inputs):
+    def run():
+        # every round parses the melody again instead of taking it from the cache
+        lp._parsed_licks.clear()
+        lp.parse_lick("melody.lc")
+    return run
+
+def bench_interpret(inputs):
+    program = lp.parse_lick("melody.lc")
+
+    def run():
+        random.seed(0)
+        with redirect_stdout(io.StringIO()):
+            li.Interpreter("harmony.rb", "melody.mid").run(program)
+    return run
+
+def bench_create_shred(inputs):
+    midi_root_notes, chord_list, time_signature, tempo = lr.harmony_processor("harmony.rb")
+    return lambda: lw.create_shred(synthetic.STYLE_TAG, chord_list, midi_root_notes, 0, seed=1)
+
+def bench_read_split_midi_files(inputs):
+    return lambda: lr.read_split_midi_files("solo.mid", "harmony.rb")
+
+def bench_update_database(inputs):
+    new_licks = lr.read_split_midi_files("solo.mid", "harmony.rb")
+    # every round appends to the same large shards, adding licks must not get slower with the size of the shard
+    lr.write_database(synthetic.lick_database(INGEST_LICKS, seed=1, style_tag="ingest"))
+    return lambda: lr.update_database(new_licks, "ingest")
+
+def bench_write_midi_from_dict(inputs):
+    return lambda: lw.write_midi_from_dict(inputs["solo"], "write.mid")
+
+BENCHMARKS = [("parse_lick", bench_parse_lick),
+              ("interpret", bench_interpret),
+              ("create_shred", bench_create_shred),
+              ("read_split_midi_files", bench_read_split_midi_files),
+              ("update_database", bench_update_database),
+              ("write_midi_from_dict", bench_write_midi_from_dict)]
+
+
+# Runner:
+#
+#   - writes the synthetic harmony, melody, lick database and solo midi file to the current directory
+def prepare_inputs(bars, statements, licks_per_vibe):
+    melody, beats = synthetic.melody_text(statements)
+    bars = max(bars, math.ceil(beats / 4))
+    with open("melody.lc", "w") as file:
+        file.write(melody)
+    with open("harmony.rb", "w") as file:
+        file.write(synthetic.harmony_text(bars))
+    lr.write_database(synthetic.lick_database(licks_per_vibe))
+
+    solo = lw.NoteBuffer.from_dict(synthetic.solo_notes(bars * 4))
+    lw.write_midi_from_dict(solo, "solo.mid")
+    return {"bars" : bars, "beats" : bars * 4, "melody_beats" : beats, "solo" : solo}
+
+#   - runs a timed function once to warm up and then repeat times
+#   - returns the statistics in seconds
+def time_function(function, repeat):
+    function()
+    times = []
+    for i in range(0, repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return {"min" : min(times), "median" : statistics.median(times), "mean" : statistics.mean(times), "repeat" : repeat}
+
+#   - runs all selected benchmarks in a temporary directory and returns the results
+def run_benchmarks(bars, statements, licks_per_vibe, repeat, only=None):
+    results = {"params" : {"bars" : bars, "statements" : statements, "licks_per_vibe" : licks_per_vibe},
+               "machine" : {"python" : platform.python_version(), "platform" : platform.platform()},
+               "date" : time.strftime("%Y-%m-%d %H:%M:%S"),
+               "benchmarks" : {}}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            inputs = prepare_inputs(bars, statements, licks_per_vibe)
+            results["params"]["harmony_beats"] = inputs["beats"]
+            for name, benchmark in BENCHMARKS:
+                if only and name not in only:
+                    continue
+                results["benchmarks"][name] = time_function(benchmark(inputs), repeat)
+                print(f"{name:>22}: median {results['benchmarks'][name]['median'] * 1000:9.3f}ms  min {results['benchmarks'][name]['min'] * 1000:9.3f}ms")
+        finally:
+            os.chdir(cwd)
+    return results
+
+#   - prints the median of every benchmark against a baseline
+#   - returns the names of all benchmarks that got slower than threshold times the baseline
+def compare_results(results, baseline, threshold):
+    if results["params"] != baseline["params"]:
+        print(f"\nWARNING! The baseline was run with {baseline['params']}, not with {results['params']}!")
+    print(f"\n{'benchmark':>22}  {'baseline':>11}  {'current':>11}  ratio")
+    regressions = []
+    for name in results["benchmarks"]:
+        if name not in baseline["benchmarks"]:
+            continue
+        old = baseline["benchmarks"][name]["median"]
+        new = results["benchmarks"][name]["median"]
+        ratio = new / old if old > 0 else float("inf")
+        flag = ""
+        if ratio > threshold:
+            flag = "  SLOWER"
+            regressions.append(name)
+        elif ratio < 1 / threshold:
+            flag = "  faster"
+        print(f"{name:>22}  {old * 1000:9.3f}ms  {new * 1000:9.3f}ms  {ratio:5.2f}{flag}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks of the writeLick and readLick pipelines.")
+    parser.add_argument("--bars", type=int, default=64, help="bars of the synthetic harmony (at least as long as the melody)")
+    parser.add_argument("--statements", type=int, default=200, help="statements of the synthetic melody")
+    parser.add_argument("--licks", type=int, default=200, help="licks per chord vibe in the synthetic database")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark")
+    parser.add_argument("--only", nargs="*", help="names of the benchmarks to run")
+    parser.add_argument("-o", "--output", default=RESULTS_FILE, help="JSON file for the results")
+    parser.add_argument("--compare", help="JSON results of an earlier run")
+    parser.add_argument("--threshold", type=float, default=1.2, help="ratio above which a benchmark counts as slower")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.bars, args.statements, args.licks, args.repeat, args.only)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"\nResults saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r") as file:
+            regressions = compare_results(results, json.load(file), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmarks got slower: {', '.join(regressions)}")
+            sys.exit(1)
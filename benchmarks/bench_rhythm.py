@@ -0,0 +1,66 @@
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file
+# in the root directory of this source tree.
+
+# Micro-benchmark of the rhythm templates:
+#   - compares the uncached rhythm parser with the cached rhythm templates of lick_writer
+#   - run from the root directory: python benchmarks/bench_rhythm.py
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lick_writer as lw
+
+RHYTHMS = [(":__:::_:______:_", 8), (":.:.:.:.", 4), (":_:_:_:_", 4), ("::::", 2), (":___.___", 4)]
+REPEAT = 20000
+
+
+#   - reference implementation, parses the rhythm string on every call
+def rhythm_to_time_uncached(rhythm, temp_duration):
+    duration = temp_duration*0.5
+    rhythm_dict = { "time": [], "note_duration": []}
+    counter = 0
+    hold_parm = False
+
+    note_amount = rhythm.count(":") + rhythm.count(".") + rhythm.count("_")
+    note_lenght = duration/note_amount
+    rounded_note_lenght = round(note_lenght, 4)
+
+    for note_value in rhythm:
+        if note_value == ":":
+            note_time = counter * note_lenght
+            rounded_note_time = round(note_time,4)
+            rhythm_dict["time"].append(rounded_note_time)
+            rhythm_dict["note_duration"].append(rounded_note_lenght)
+            hold_parm = True
+        elif note_value == "_":
+            if hold_parm == True:
+                rhythm_dict["note_duration"][-1] += rounded_note_lenght
+        elif note_value == ".":
+            hold_parm = False
+        counter +=1
+    return rhythm_dict
+
+#   - helper
+#   - best time per call in microseconds
+def time_call(function, repeat=REPEAT):
+    return min(timeit.repeat(function, number=repeat, repeat=5)) / repeat * 1e6
+
+
+if __name__ == "__main__":
+    for rhythm, duration in RHYTHMS:
+        template = lw.rhythm_template(rhythm, duration)
+        reference = rhythm_to_time_uncached(rhythm, duration)
+        if list(template.time) != reference["time"] or list(template.note_duration) != reference["note_duration"]:
+            print(f"ERROR! Template of {rhythm} differs from the reference!")
+            sys.exit(1)
+
+        uncached = time_call(lambda: rhythm_to_time_uncached(rhythm, duration))
+        cached = time_call(lambda: lw.rhythm_template(rhythm, duration))
+        shifted = time_call(lambda: lw.rhythm_template(rhythm, duration).shifted(1.5))
+        print(f"{rhythm:>18} duration {duration}:  uncached {uncached:6.2f}us  template {cached:6.2f}us  template + shift {shifted:6.2f}us")
@@ -0,0 +1,57 @@
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file
+# in the root directory of this source tree.
+
+# Check of the database shards:
+#   - simulates an append that was cut off in the middle of a line and checks that the shard can still be read and appended to
+#   - runs on a temporary shard directory, the lick database is not touched
+#   - run from the root directory: python benchmarks/check_database.py
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import lick_reader as lr
+
+TAG = "check"
+
+
+#   - helper
+#   - lick of one note with the given pitch
+def lick(pitch):
+    return {"pitch": [pitch], "time": [0], "note_duration": [0.25], "volume": [100], "chord": ["min"], "pitchWheelValue": [0], "length": 1}
+
+#   - helper
+#   - prints the failed check and stops
+def check(condition, message):
+    if not condition:
+        print(f"ERROR! {message}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        lr.SHARD_DIRECTORY = directory
+        licks = [lick(60), lick(62)]
+        lr.write_shard(TAG, "min", licks)
+
+        # an append cut off in the middle of its line, as left by a crash or a full disk
+        with open(lr.shard_path(TAG, "min"), "a") as file:
+            file.write(json.dumps(lick(64))[:20])
+        check(lr.read_shard(TAG, "min") == licks, "the licks in front of a cut off line were not read")
+        check(lr.get_licks(TAG, "min", 1) is not None and len(lr.get_licks(TAG, "min", 1)) == 2, "the lick index of a torn shard is broken")
+
+        lr.append_shard(TAG, "min", [lick(65)])
+        check(lr.read_shard(TAG, "min") == licks + [lick(65)], "appending to a torn shard did not drop the cut off line")
+        with open(lr.shard_path(TAG, "min"), "r") as file:
+            check(file.read().endswith("\n"), "the appended shard does not end with a line break")
+        check(not os.path.exists(lr.shard_path(TAG, "min") + ".tmp"), "the temporary shard was left behind")
+
+        lr.update_database([lick(67), dict(lick(48), chord=["dom"])], TAG)
+        check(len(lr.read_shard(TAG, "min")) == 4 and len(lr.read_shard(TAG, "dom")) == 1, "update_database lost licks")
+    print("Database shards OK.")
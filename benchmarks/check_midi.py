@@ -0,0 +1,130 @@
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file
+# in the root directory of this source tree.
+
+# Check of the midi encoder:
+#   - writes random note buffers and shreds over the example harmonies with lick_midi.write_midi and with
+#     lick_writer.write_midi_with_pretty_midi, with all_pitch_bends both files must be equal byte for byte
+#   - without all_pitch_bends the encoder leaves out repeated pitch bends, the notes read back with pretty_midi must still be equal
+#   - the streaming encoder must write the same file as write_midi, also if a note buffer starts before notes that were
+#     already written (e.g. after a negative pause)
+#   - run from the root directory: python benchmarks/check_midi.py
+
+import os
+import random
+import sys
+import tempfile
+from bisect import bisect_right
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+import lick_midi as lm
+import lick_reader as lr
+import lick_writer as lw
+
+EXAMPLES = ["BlueBossa", "BackToEarth"]
+RANDOM_BUFFERS = 50
+RANDOM_STREAMS = 200
+SEED = 42
+
+
+#   - helper
+#   - random notes with overlaps, notes at the same time and microtonal pitch wheel values
+def random_notes(rng):
+    notes = {"pitch" : [], "time" : [], "note_duration" : [], "volume" : [], "pitchWheelValue" : []}
+    time = 0.0
+    for i in range(0, rng.randint(1, 1000)):
+        notes["pitch"].append(rng.randint(21, 108))
+        notes["time"].append(round(time, 4))
+        notes["note_duration"].append(rng.choice([0.0625, 0.125, 0.25, 0.3333, 0.5, 1.5]))
+        notes["volume"].append(rng.randint(1, 127))
+        notes["pitchWheelValue"].append(rng.choice([0, 0, 0, 0, 2048, -2048, 4095]))
+        time += rng.choice([0.0, 0.125, 0.25, 0.3333, 0.5])
+    return notes
+
+#   - helper
+#   - note buffers pushed at random time offsets, notes may start up to a beat before their offset
+def random_pushes(rng):
+    pushes = []
+    for i in range(0, rng.randint(1, 8)):
+        time_offset = rng.choice([0.0, 0.5, 1.0, 2.0, 3.0])
+        times = [max(0.0, time_offset + rng.choice([-0.5, 0.0, 0.25, 0.5])) for j in range(0, rng.randint(1, 4))]
+        notes = {"pitch" : [rng.randint(40, 80) for time in times], "time" : times, "note_duration" : [rng.choice([0.125, 0.5, 2.0]) for time in times],
+                 "volume" : [rng.randint(1, 127) for time in times], "pitchWheelValue" : [rng.choice([0, 0, 2048, -100]) for time in times]}
+        pushes.append((notes, time_offset))
+    return pushes
+
+#   - helper
+#   - streams note buffers into a midi file and returns its bytes, the notes of all buffers are written to reference_file
+def stream_bytes(pushes, file_name, reference_file):
+    midi_stream = lm.MidiStreamWriter(file_name)
+    for notes, time_offset in pushes:
+        midi_stream.push(notes, time_offset)
+    midi_stream.close()
+    all_notes = {key : [value for notes, time_offset in pushes for value in notes[key]] for key in pushes[0][0]}
+    lm.write_midi(all_notes, reference_file)
+    return read_bytes(file_name)
+
+#   - helper
+#   - notes of a midi file as (pitch, start, end, velocity) and the pitch wheel at the start of every note
+def read_notes(file_name):
+    import pretty_midi
+
+    instrument = pretty_midi.PrettyMIDI(file_name).instruments[0]
+    # bends at the same time keep their order in the file, the last one is the pitch wheel of the notes at that time
+    bends = sorted(((bend.time, bend.pitch) for bend in instrument.pitch_bends), key=lambda bend: bend[0])
+    bend_times = [time for time, pitch in bends]
+    notes = []
+    for note in instrument.notes:
+        index = bisect_right(bend_times, note.start)
+        notes.append((note.pitch, note.start, note.end, note.velocity, bends[index - 1][1] if index > 0 else 0))
+    return sorted(notes)
+
+#   - helper
+#   - reads a midi file as bytes
+def read_bytes(file_name):
+    with open(file_name, "rb") as file:
+        return file.read()
+
+
+if __name__ == "__main__":
+    rng = random.Random(SEED)
+    note_buffers = [(f"random buffer {i}", random_notes(rng)) for i in range(0, RANDOM_BUFFERS)]
+    for tag in lr.list_tags():
+        for name in EXAMPLES:
+            harmony = lr.load_harmony(os.path.join(ROOT, "examples", name, name + ".rb"))
+            shred = lw.shred_harmony(tag, harmony, 0, len(harmony), 0, seed=SEED)
+            if not isinstance(shred, int):
+                note_buffers.append((f"{tag} shred over {name}", shred))
+
+    with tempfile.TemporaryDirectory() as directory:
+        reference_file = os.path.join(directory, "reference.mid")
+        encoded_file = os.path.join(directory, "encoded.mid")
+        for name, notes in note_buffers:
+            lw.write_midi_with_pretty_midi(notes, reference_file)
+            lm.write_midi(notes, encoded_file, all_pitch_bends=True)
+            if read_bytes(encoded_file) != read_bytes(reference_file):
+                print(f"ERROR! The midi file of the {name} differs from the one of pretty_midi!")
+                sys.exit(1)
+            lm.write_midi(notes, encoded_file)
+            if read_notes(encoded_file) != read_notes(reference_file):
+                print(f"ERROR! The notes of the {name} differ from the ones of pretty_midi without all_pitch_bends!")
+                sys.exit(1)
+
+        # the minimal case: a note at 0.25 is pushed with the offset 2.0 after the notes up to 1.0 were written
+        note = lambda time: {"pitch" : [60], "time" : [time], "note_duration" : [0.25], "volume" : [100], "pitchWheelValue" : [0]}
+        streams = [[(note(0.0), 0.0), (note(1.0), 1.0), (note(0.25), 2.0)]] + [random_pushes(rng) for i in range(0, RANDOM_STREAMS)]
+        for pushes in streams:
+            if stream_bytes(pushes, encoded_file, reference_file) != read_bytes(reference_file):
+                print(f"ERROR! The streamed midi file of {[time_offset for notes, time_offset in pushes]} differs from the one of write_midi!")
+                sys.exit(1)
+        try:
+            lm.encode_variable_int(-1)
+            print("ERROR! A negative delta time was encoded!")
+            sys.exit(1)
+        except ValueError:
+            pass
+    print(f"Midi encoder OK: {len(note_buffers)} note buffers are equal to the pretty_midi files and {len(streams)} streams to write_midi.")
@@ -0,0 +1,131 @@
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file
+# in the root directory of this source tree.
+
+# Regression check of the lick splitter:
+#   - compares lick_reader.read_split_midi_files with the splitter it replaced, which rescanned the notes for every chord change
+#   - the example melodies are rendered over both example harmonies and every midi file is split with both harmonies,
+#     random midi files with overlapping notes (so their onsets are not sorted) are split as well
+#   - run from the root directory: python benchmarks/check_split.py
+
+import io
+import os
+import random
+import sys
+import tempfile
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+import lick_parser as lp
+import lick_reader as lr
+import lick_writer as lw
+
+EXAMPLES = ["BlueBossa", "BackToEarth"]
+RANDOM_FILES = 30
+SEED = 42
+
+
+#   - reference implementation, the splitter before the single forward pass
+def read_split_midi_files_reference(midiFileName, harmonyFileName):
+    import pretty_midi
+
+    lick_list = []
+    new_lick_dict = {"pitch" : [], "time" : [], "note_duration" : [], "volume" : [], "chord" : [], "pitchWheelValue" : []}
+    midi_data = pretty_midi.PrettyMIDI(midiFileName)
+
+    midiRootArray, function_list, read_time_signature, readtempo = lr.harmony_processor(harmonyFileName)
+
+    for note in midi_data.instruments[0].notes:
+        new_lick_dict["pitch"].append(note.pitch)
+        new_lick_dict["time"].append(note.start)
+        new_lick_dict["note_duration"].append(note.get_duration())
+        new_lick_dict["volume"].append(note.velocity)
+        new_lick_dict["pitchWheelValue"].append(0)
+
+    new_lick_dict["chord"] = function_list
+
+    #splitter part
+    split_mark_list = []
+    split_time_list = [0]
+    root_list = [midiRootArray[0]]
+    chord_cut = []
+    beat = 0
+    time_list = new_lick_dict["time"]
+    old_chord = new_lick_dict["chord"][0]
+    for chord in new_lick_dict["chord"]:
+        if chord != old_chord:
+            for time in time_list:
+                if time*2 < beat:
+                    pass
+                else:
+                    split_mark_list.append(time_list.index(time))
+                    split_time_list.append(beat/2)
+                    root_list.append(midiRootArray[beat])
+                    chord_cut.append(beat)
+                    break
+            old_chord = chord
+        beat += 1
+    split_mark_list.append(len(time_list))
+    chord_cut.append(beat)
+
+    old_split_mark = 0
+    old_chort_cut = 0
+    for i in range(0,len(split_mark_list)):
+        splitLick = {}
+        splitLick["pitch"] = [x - root_list[i] for x in new_lick_dict["pitch"][old_split_mark:split_mark_list[i]]]
+        splitLick["time"] = [x - split_time_list[i] for x in new_lick_dict["time"][old_split_mark:split_mark_list[i]]]
+        splitLick["note_duration"] = new_lick_dict["note_duration"][old_split_mark:split_mark_list[i]]
+        splitLick["volume"] = new_lick_dict["volume"][old_split_mark:split_mark_list[i]]
+        splitLick["chord"] = new_lick_dict["chord"][old_chort_cut:chord_cut[i]]
+        splitLick["pitchWheelValue"] = new_lick_dict["pitchWheelValue"][old_split_mark:split_mark_list[i]]
+        splitLick["length"] = len(splitLick["chord"])
+        lick_list.append(splitLick)
+        old_split_mark = split_mark_list[i]
+        old_chort_cut = chord_cut[i]
+
+    return lick_list
+
+#   - helper
+#   - midi file of random notes over the beats of a harmony, long notes overlap the next ones
+def random_midi(file_name, beats, rng):
+    notes = {"pitch" : [], "time" : [], "note_duration" : [], "volume" : [], "pitchWheelValue" : []}
+    time = 0.0
+    while time < beats / 2:
+        notes["pitch"].append(rng.randint(40, 90))
+        notes["time"].append(round(time, 4))
+        notes["note_duration"].append(rng.choice([0.125, 0.25, 0.5, 1.5, 3.0]))
+        notes["volume"].append(rng.randint(40, 127))
+        notes["pitchWheelValue"].append(0)
+        time += rng.choice([0.0, 0.125, 0.25, 0.5, 1.0])
+    lw.write_midi_from_dict(notes, file_name)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        harmonies = [os.path.join(ROOT, "examples", name, name + ".rb") for name in EXAMPLES]
+        midi_files = []
+        for name in EXAMPLES:
+            for harmony in harmonies:
+                midi_file = os.path.join(directory, f"{name}_{len(midi_files)}.mid")
+                with redirect_stdout(io.StringIO()):
+                    lp.run_lick(os.path.join(ROOT, "examples", name, name + ".lc"), harmony, midi_file, SEED)
+                midi_files.append(midi_file)
+        rng = random.Random(SEED)
+        for i in range(0, RANDOM_FILES):
+            midi_file = os.path.join(directory, f"random_{i}.mid")
+            random_midi(midi_file, len(lr.harmony_processor(harmonies[i % len(harmonies)])[0]), rng)
+            midi_files.append(midi_file)
+
+        licks = 0
+        for midi_file in midi_files:
+            for harmony in harmonies:
+                split = lr.read_split_midi_files(midi_file, harmony)
+                if split != read_split_midi_files_reference(midi_file, harmony):
+                    print(f"ERROR! The licks of {os.path.basename(midi_file)} split over {os.path.basename(harmony)} differ from the reference!")
+                    sys.exit(1)
+                licks += len(split)
+    print(f"Splitter OK: {len(midi_files) * len(harmonies)} splits with {licks} licks are identical to the reference.")
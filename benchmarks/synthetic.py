@@ -0,0 +1,105 @@
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file
+# in the root directory of this source tree.
+
+# Synthetic Inputs:
+#   - scalable harmonies, melodies and lick databases for the benchmarks
+#   - every generator takes a seed, so the inputs of two benchmark runs are identical
+
+import random
+
+CHORDS = ["Cm7", "F7", "Bbmaj7", "Ebmaj7", "Am7", "D7", "Gm7", "C7", "Fm", "Dbmaj7"]
+VIBES = ["min", "maj", "dom"]
+SCALE_FUNCTIONS = ["ionian", "dorian", "mixolydian", "aeolian", "locrian", "major", "harmonicMinor", "melodicMinor"]
+RANDOM_FUNCTIONS = ["randomDorian", "randomMixolydian", "randomAeolian", "randomMajor", "randomAltered"]
+RHYTHMS = [":.:.", "::::", ":_::", ":__:::_:", ":.::_:.:", ":::_"]
+STYLE_TAG = "bench"
+
+
+#   - harmony file with bars bars of 4/4, one or two chords per bar
+def harmony_text(bars, seed=0):
+    rng = random.Random(seed)
+    lines = ["4/4 : 120 BPM", ""]
+    for i in range(0, bars):
+        if rng.random() < 0.3:
+            cells = [rng.choice(CHORDS), "%", rng.choice(CHORDS), "%"]
+        else:
+            cells = [rng.choice(CHORDS), "%", "%", "%"]
+        lines.append("|| " + " | ".join(cells) + " ||")
+    return "\n".join(lines) + "\n"
+
+#   - melody file with statements calls of scale, random and shred functions
+#   - returns the melody and the number of beats it needs
+def melody_text(statements, seed=0, style_tag=STYLE_TAG):
+    rng = random.Random(seed)
+    lines = []
+    beats = 0
+    for i in range(0, statements):
+        kind = rng.random()
+        rhythm = rng.choice(RHYTHMS)
+        notes = rhythm.count(":")
+        duration = rng.choice([2, 4])
+        volume = ", ".join(["100"] * notes)
+        if kind < 0.6:
+            degrees = ", ".join(str(rng.choice([1, 2, 3, 4, 5, 6, 7, -3, -5, "3va", 1.5])) for j in range(0, notes))
+            lines.append(f'{rng.choice(SCALE_FUNCTIONS)}(rhythm="{rhythm}", duration={duration}, notes=[{degrees}], volume=[{volume}])')
+        elif kind < 0.85:
+            lines.append(f'{rng.choice(RANDOM_FUNCTIONS)}(rhythm="{rhythm}", duration={duration}, volume=[{volume}], '
+                         f'jump_prop=0.{rng.randint(1, 9)}, up_down_prop=0.{rng.randint(1, 9)})')
+        elif kind < 0.95:
+            duration = rng.choice([4, 8])
+            lines.append(f'shredMode(style="{style_tag}", duration={duration})')
+        else:
+            duration = 1
+            lines.append("pause(1)")
+        beats += duration
+    return "\n".join(lines) + "\n", beats
+
+#   - melody file like melody_text, with the statements in for and if blocks of up to block_size statements
+#   - every block runs exactly once, so the melody needs the same beats as its statements
+def control_flow_text(statements, block_size=8, seed=0, style_tag=STYLE_TAG):
+    melody, beats = melody_text(statements, seed, style_tag)
+    lines = melody.split("\n")[:-1]
+    blocks = []
+    for i in range(0, len(lines), block_size):
+        body = "\n    ".join(lines[i:i + block_size])
+        if (i // block_size) % 2 == 0:
+            blocks.append(f"for repeat in range(1) {{\n    {body}\n}}")
+        else:
+            blocks.append(f"if key_count == 0 and beat >= 0 {{\n    {body}\n}} else {{\n    pause(1)\n}}")
+    return "\n".join(blocks) + "\n", beats
+
+#   - one database lick of length beats on a chord vibe
+def lick(vibe, length, rng):
+    pitches = []
+    times = []
+    durations = []
+    for beat in range(0, length):
+        notes = rng.choice([1, 2, 2, 3, 4])
+        for i in range(0, notes):
+            times.append(beat / 2 + i / (2 * notes))
+            durations.append(1 / (2 * notes))
+            pitches.append(rng.randint(-5, 19))
+    return {"pitch" : pitches, "time" : times, "note_duration" : durations, "volume" : [rng.randint(60, 110) for pitch in pitches],
+            "chord" : [vibe] * length, "pitchWheelValue" : [0] * len(pitches), "length" : length}
+
+#   - lick database {tag : {vibe : licks}} with licks_per_vibe licks of 1 to 8 beats per chord vibe
+def lick_database(licks_per_vibe, seed=0, style_tag=STYLE_TAG):
+    rng = random.Random(seed)
+    return {style_tag : {vibe : [lick(vibe, rng.randint(1, 8), rng) for i in range(0, licks_per_vibe)] for vibe in VIBES}}
+
+#   - note dictonary of a solo over beats beats, e.g. for a midi file that is read with read_split_midi_files
+def solo_notes(beats, seed=0):
+    rng = random.Random(seed)
+    notes = {"pitch" : [], "time" : [], "note_duration" : [], "volume" : [], "pitchWheelValue" : []}
+    for beat in range(0, beats):
+        for i in range(0, 2):
+            notes["pitch"].append(rng.randint(48, 84))
+            notes["time"].append(beat / 2 + i / 4)
+            notes["note_duration"].append(0.2)
+            notes["volume"].append(rng.randint(60, 110))
+            notes["pitchWheelValue"].append(0)
+    return notes
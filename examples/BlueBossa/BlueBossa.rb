@@ -1,35 +1,35 @@
-4/4 : 150 BPM
-
-|| Cm7  | %     | %     | %     ||
-|| Cm7  | %     | %     | %     ||
-|| %    | %     | %     | %     ||
-|| Fm   | %     | %     | %     ||
-|| %    | %     | %     | %     ||
-|| Dm   | %     | %     | %     ||
-|| G7   | %     | %     | %     ||
-|| Cm   | %     | %     | %     ||
-|| %    | %     | %     | %     ||
-|| Ebm7 | %     | %     | %     ||
-|| Ab7  | %     | %     | %     ||
-|| Db   | %     | %     | %     ||
-|| %    | %     | %     | %     ||
-|| Dm   | %     | %     | %     ||
-|| G7   | %     | %     | %     ||
-|| Cm   | %     | %     | %     ||
-|| Dm   | %     | G7    | %     ||
-|| Cm7  | %     | %     | %     ||
-|| %    | %     | %     | %     ||
-|| Fm   | %     | %     | %     ||
-|| %    | %     | %     | %     ||
-|| Dm   | %     | %     | %     ||
-|| G7   | %     | %     | %     ||
-|| Cm   | %     | %     | %     ||
-|| %    | %     | %     | %     ||
-|| Ebm7 | %     | %     | %     ||
-|| Ab7  | %     | %     | %     ||
-|| Db   | %     | %     | %     ||
-|| %    | %     | %     | %     ||
-|| Dm   | %     | %     | %     ||
-|| G7   | %     | %     | %     ||
-|| Cm   | %     | %     | %     ||
-|| Dm   | %     | G7    | %     ||
+4/4 : 150 BPM
+
+|| Cm7  | %     | %     | %     ||
+|| Cm7  | %     | %     | %     ||
+|| %    | %     | %     | %     ||
+|| Fm   | %     | %     | %     ||
+|| %    | %     | %     | %     ||
+|| Dm   | %     | %     | %     ||
+|| G7   | %     | %     | %     ||
+|| Cm   | %     | %     | %     ||
+|| %    | %     | %     | %     ||
+|| Ebm7 | %     | %     | %     ||
+|| Ab7  | %     | %     | %     ||
+|| Db   | %     | %     | %     ||
+|| %    | %     | %     | %     ||
+|| Dm   | %     | %     | %     ||
+|| G7   | %     | %     | %     ||
+|| Cm   | %     | %     | %     ||
+|| Dm   | %     | G7    | %     ||
+|| Cm7  | %     | %     | %     ||
+|| %    | %     | %     | %     ||
+|| Fm   | %     | %     | %     ||
+|| %    | %     | %     | %     ||
+|| Dm   | %     | %     | %     ||
+|| G7   | %     | %     | %     ||
+|| Cm   | %     | %     | %     ||
+|| %    | %     | %     | %     ||
+|| Ebm7 | %     | %     | %     ||
+|| Ab7  | %     | %     | %     ||
+|| Db   | %     | %     | %     ||
+|| %    | %     | %     | %     ||
+|| Dm   | %     | %     | %     ||
+|| G7   | %     | %     | %     ||
+|| Cm   | %     | %     | %     ||
+|| Dm   | %     | G7    | %     ||
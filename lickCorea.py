@@ -1,73 +1,213 @@
-# Copyright (c) 2025, Michael Žutić, Oliver Köll
-# All rights reserved.
-#
-# This source code is licensed under the
-# MIT License found in the LICENSE.txt file 
-# in the root directory of this source tree.
-
-import sys
-import os
-import lick_reader as lr
-import lick_writer as lw
-import lick_parser as lp
-
-cmd_line_arg_01 = sys.argv[1]
-
-if cmd_line_arg_01 == "readLick":
-    midiHarmonyFileName = input("\nEnter Harmony-File name: ")
-    midiFileName = input("Enter MIDI-File name: ")
-    midiFileTag = input("Enter MIDI-File tag: ")
-
-    new_licks = lr.read_split_midi_files(midiFileName, midiHarmonyFileName)
-    lr.update_database(new_licks, midiFileTag)
-
-    print("\nYour lick has been successfully added to the database!\n")
-
-elif cmd_line_arg_01 == "readMutipleLicks":
-
-    filePath = input("\nEnter File-Path: ") 
-    fileName = input("Enter File name: ")
-    lickNumber = input("How many licks do you want to read: ")
-    midiFileTag = input("Enter MIDI-File tag: ")
-
-    for i in range(1,int(lickNumber)+1):
-        
-        midiFileName = filePath + "/" + fileName + f"{i}" + ".mid"
-        midiHarmonyFileName = filePath + "/" + fileName + f"{i}" + ".rb"
-        
-        new_licks = lr.read_split_midi_files(midiFileName, midiHarmonyFileName)
-        lr.update_database(new_licks, midiFileTag)
-
-    print("\nYour licks have been successfully added to the database!\n")
-
-elif cmd_line_arg_01 == "database":
-    while 1:
-        databaseOperation = input("\nDatabase Operation > ")
-        if databaseOperation == "clear":
-            lr.clear_database()
-            print("\nYour lick database has been successfully cleaned!")
-        elif databaseOperation == "show":
-            print("\nYour lick database has the following tags: ")
-            lr.show_database()
-        elif databaseOperation == "exit":
-            print("\n")
-            break
-        else:
-            print("Database Command is not known!")
-
-elif cmd_line_arg_01 == "writeLick":
-    
-    harmonyFileName = input("\nEnter Harmony-File name: ")
-    melodyFileName = input("Enter Melody-File name: ")
-    midiFileName = input("Enter MIDI-File name: ")
-
-    lp.formatAndWriteFile(melodyFileName, harmonyFileName, midiFileName)
-
-    with open("output.py","r") as file:
-        code = file.read()
-        exec(code)
-
-    os.remove("output.py")
-
-else:
-    print(f"ERROR! CMD Line Arg: {cmd_line_arg_01} is unknown!")
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file 
+# in the root directory of this source tree.
+
+import argparse
+import os
+import sys
+from contextlib import redirect_stdout
+
+# Subcommands:
+#   - every subcommand imports the modules it needs itself, so e.g. "database show" never imports numpy or pretty_midi
+#   - every subcommand runs without prompts when its options are given, missing values are asked for like before
+#
+#   - helper
+#   - returns the value of an option or asks for it
+def ask(value, prompt):
+    if value is None:
+        return input(prompt)
+    return value
+
+#   - helper
+#   - expands "-" to the file names read from stdin, one per line
+def expand_file_names(file_names):
+    expanded = []
+    for file_name in file_names:
+        if file_name == "-":
+            expanded.extend(line.strip() for line in sys.stdin if line.strip() != "")
+        else:
+            expanded.append(file_name)
+    return expanded
+
+def read_lick(args):
+    import lick_reader as lr
+    import lick_batch as lb
+
+    midiFileNames = expand_file_names(args.midi)
+    if len(midiFileNames) == 0:
+        midiHarmonyFileName = ask(args.harmony, "\nEnter Harmony-File name: ")
+        midiFileNames = [input("Enter MIDI-File name: ")]
+    else:
+        midiHarmonyFileName = args.harmony
+    midiFileTag = ask(args.tag, "Enter MIDI-File tag: ")
+
+    if len(midiFileNames) == 1:
+        harmonyFileName = midiHarmonyFileName or os.path.splitext(midiFileNames[0])[0] + ".rb"
+        new_licks = lr.read_split_midi_files(midiFileNames[0], harmonyFileName)
+        lr.update_database(new_licks, midiFileTag)
+        print("\nYour lick has been successfully added to the database!\n")
+    else:
+        # without --harmony every midi file is read with the harmony file of the same name
+        file_pairs = [(midiFileName, midiHarmonyFileName or os.path.splitext(midiFileName)[0] + ".rb") for midiFileName in midiFileNames]
+        lb.ingest_licks(file_pairs, midiFileTag, args.workers)
+        print("\nYour licks have been successfully added to the database!\n")
+
+def read_multiple_licks(args):
+    import lick_batch as lb
+
+    filePath = ask(args.path, "\nEnter File-Path: ")
+    fileName = ask(args.name, "Enter File name: ")
+    lickNumber = ask(args.count, "How many licks do you want to read: ")
+    midiFileTag = ask(args.tag, "Enter MIDI-File tag: ")
+
+    file_pairs = []
+    for i in range(1,int(lickNumber)+1):
+
+        midiFileName = filePath + "/" + fileName + f"{i}" + ".mid"
+        midiHarmonyFileName = filePath + "/" + fileName + f"{i}" + ".rb"
+        file_pairs.append((midiFileName, midiHarmonyFileName))
+
+    lb.ingest_licks(file_pairs, midiFileTag, args.workers)
+
+    print("\nYour licks have been successfully added to the database!\n")
+
+#   - helper for database
+#   - runs one database operation, returns False for exit
+def database_operation(lr, databaseOperation):
+    if databaseOperation == "clear":
+        lr.clear_database()
+        print("\nYour lick database has been successfully cleaned!")
+    elif databaseOperation == "migrate":
+        lr.migrate_database()
+        print("\nYour lick database has been successfully migrated into shards!")
+    elif databaseOperation == "show":
+        print("\nYour lick database has the following tags: ")
+        lr.show_database()
+    elif databaseOperation == "exit":
+        print("\n")
+        return False
+    else:
+        print("Database Command is not known!")
+    return True
+
+def database(args):
+    import lick_reader as lr
+
+    if len(args.operations) > 0:
+        for databaseOperation in args.operations:
+            database_operation(lr, databaseOperation)
+        return
+
+    while database_operation(lr, input("\nDatabase Operation > ")):
+        pass
+
+def write_lick(args):
+    import lick_parser as lp
+    import lick_interpreter as li
+
+    harmonyFileName = ask(args.harmony, "\nEnter Harmony-File name: ")
+    melodyFileName = ask(args.melody, "Enter Melody-File name: ")
+    midiFileName = ask(args.output, "Enter MIDI-File name: ")
+    seed = args.seed if args.seed is not None else args.seed_argument
+
+    try:
+        if midiFileName == "-":
+            # the midi file goes to stdout, so all messages go to stderr
+            output_file = sys.stdout.buffer
+            with redirect_stdout(sys.stderr):
+                rendered = lp.run_lick(melodyFileName, harmonyFileName, midiFileName, seed, args.incremental, output_file=output_file)
+            output_file.flush()
+        else:
+            rendered = lp.run_lick(melodyFileName, harmonyFileName, midiFileName, seed, args.incremental)
+    except li.LickRuntimeError as e:
+        print(f"Runtime Error in '{melodyFileName}', {e}", file=sys.stderr)
+        sys.exit(1)
+    # the melody could not be read or parsed, parse_lick already printed the error
+    if not rendered:
+        sys.exit(1)
+
+def render_batch(args):
+    import lick_batch as lb
+
+    max_workers = int(args.workers) if args.workers is not None and args.workers != "auto" else None
+
+    results = lb.render_batch(lb.read_manifest(args.manifest, args.seed), max_workers)
+    if any(result["status"] != "ok" for result in results):
+        sys.exit(1)
+
+def watch(args):
+    import lick_watch as lwa
+
+    lwa.watch_lick(args.melody, args.harmony, args.output, args.seed, not args.no_incremental)
+
+#   - command line arguments of all subcommands
+def create_parser():
+    parser = argparse.ArgumentParser(prog="lickCorea.py", description="Generate jazz licks from LickCorea melody and harmony files.")
+    parser.add_argument("--profile", metavar="FILE", help="write a profile of the stages and melody function calls to FILE (Chrome trace JSON), "
+                        "also enabled by the environment variable LICK_PROFILE=FILE")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    command = subparsers.add_parser("readLick", help="read midi licks into the shredMode database")
+    command.add_argument("midi", nargs="*", help="midi files, - reads the file names from stdin (asked for if missing)")
+    command.add_argument("--harmony", help="harmony file of all midi files (default: the .rb file of the same name)")
+    command.add_argument("--tag", help="style tag of the licks")
+    command.add_argument("--workers", type=int, help="number of worker processes for many files")
+    command.set_defaults(function=read_lick)
+
+    command = subparsers.add_parser("readMutipleLicks", help="read numbered midi licks <path>/<name><i>.mid into the database")
+    command.add_argument("--path", help="directory of the files")
+    command.add_argument("--name", help="file name without number and extension")
+    command.add_argument("--count", help="number of files")
+    command.add_argument("--tag", help="style tag of the licks")
+    command.add_argument("--workers", type=int, help="number of worker processes")
+    command.set_defaults(function=read_multiple_licks)
+
+    command = subparsers.add_parser("database", help="show, clear or migrate the lick database")
+    command.add_argument("operations", nargs="*", metavar="operation", help="show, clear or migrate (interactive without operation)")
+    command.set_defaults(function=database)
+
+    command = subparsers.add_parser("writeLick", help="render a melody file to a midi file")
+    command.add_argument("seed_argument", nargs="?", metavar="seed", help="render seed (same as --seed)")
+    command.add_argument("--harmony", help="harmony file (.rb)")
+    command.add_argument("--melody", help="melody file (.lc), - reads it from stdin")
+    command.add_argument("-o", "--output", help="midi file, - writes it to stdout")
+    command.add_argument("--seed", help="render seed for reproducible random functions")
+    command.add_argument("--incremental", action="store_true", help="reuse the notes of unchanged calls")
+    command.set_defaults(function=write_lick)
+
+    command = subparsers.add_parser("renderBatch", help="render many melody files across worker processes")
+    command.add_argument("manifest", help=".csv or .json manifest or glob pattern of .lc files")
+    command.add_argument("workers", nargs="?", help="number of worker processes or auto")
+    command.add_argument("seed", nargs="?", help="batch seed")
+    command.set_defaults(function=render_batch)
+
+    command = subparsers.add_parser("watch", help="render a melody file again on every save")
+    command.add_argument("melody", help="melody file (.lc)")
+    command.add_argument("harmony", help="harmony file (.rb)")
+    command.add_argument("output", help="midi file")
+    command.add_argument("seed", nargs="?", help="render seed")
+    command.add_argument("--no-incremental", action="store_true", help="render every call again")
+    command.set_defaults(function=watch)
+
+    return parser
+
+if __name__ == "__main__":
+    args = create_parser().parse_args()
+    if args.profile is None and not os.environ.get("LICK_PROFILE"):
+        args.function(args)
+    else:
+        import lick_profile as lprof
+        if args.profile is not None:
+            lprof.enable(args.profile)
+        else:
+            lprof.enable_from_environment()
+        try:
+            with lprof.span(args.command, "command"):
+                args.function(args)
+        finally:
+            # the report summary goes to stderr, stdout may be the midi file
+            with redirect_stdout(sys.stderr):
+                lprof.save()
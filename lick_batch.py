@@ -0,0 +1,135 @@
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file
+# in the root directory of this source tree.
+
+import csv
+import glob
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stderr, redirect_stdout
+import lick_reader as lr
+import lick_parser as lp
+
+
+# Manifest Functions:
+#   - functions for reading the list of render jobs
+#
+#   - reads a csv or json manifest with harmony, melody and output columns and an optional seed column
+#   - any other argument is used as glob pattern for .lc files, harmony and midi file share the name of the melody file
+#   - with a batch seed every job without its own seed gets a seed derived from the batch seed and its output file
+def read_manifest(manifest, batch_seed=None):
+    jobs = []
+    if manifest.endswith(".csv"):
+        with open(manifest, "r", newline="") as file:
+            rows = list(csv.DictReader(file))
+    elif manifest.endswith(".json"):
+        with open(manifest, "r") as file:
+            rows = json.load(file)
+    else:
+        rows = []
+        for melody_path in sorted(glob.glob(manifest)):
+            stem = os.path.splitext(melody_path)[0]
+            rows.append({"harmony" : stem + ".rb", "melody" : melody_path, "output" : stem + ".mid"})
+
+    for row in rows:
+        seed = row.get("seed")
+        if seed in (None, "") and batch_seed is not None:
+            seed = f"{batch_seed}/{row['output']}"
+        jobs.append({"harmony" : row["harmony"], "melody" : row["melody"], "output" : row["output"], "seed" : seed if seed != "" else None})
+    return jobs
+
+
+# Render Functions:
+#   - functions for rendering many jobs across a process pool
+#
+#   - helper for render_batch
+#   - loads the lick database and all harmony files once per worker process
+def init_worker(harmony_paths):
+    for tag in lr.list_tags():
+        lr.get_tag_index(tag)
+    for harmony_path in harmony_paths:
+        try:
+            lr.harmony_processor(harmony_path)
+        except OSError:
+            pass
+
+#   - renders one job and returns its timing and status
+#   - a melody that can not be read or parsed fails the job, even if a midi file of an earlier run exists
+def render_job(job):
+    result = {"melody" : job["melody"], "output" : job["output"], "status" : "ok", "message" : "", "seconds" : 0.0}
+    messages = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with redirect_stdout(messages), redirect_stderr(messages):
+            if not lp.run_lick(job["melody"], job["harmony"], job["output"], job.get("seed")):
+                result["status"] = "failed"
+    except SystemExit as e:
+        # a melody function that stops the render on invalid input, e.g. with sys.exit(message)
+        result["status"] = "failed"
+        if isinstance(e.code, str):
+            result["message"] = e.code
+        else:
+            last_message = messages.getvalue().strip().split("\n")[-1]
+            result["message"] = f"{last_message} (exit code {e.code})".strip()
+    except Exception as e:
+        result["status"] = "failed"
+        result["message"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = time.perf_counter() - start
+
+    if not result["message"]:
+        result["message"] = messages.getvalue().strip().split("\n")[-1]
+    if result["status"] == "ok" and not os.path.exists(job["output"]):
+        result["status"] = "failed"
+    return result
+
+#   - renders all jobs across a process pool and prints a report
+def render_batch(jobs, max_workers=None):
+    harmony_paths = sorted(set(job["harmony"] for job in jobs))
+    init_worker(harmony_paths)
+
+    results = []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker, initargs=(harmony_paths,)) as executor:
+        futures = [executor.submit(render_job, job) for job in jobs]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            print(f"[{result['status']:>6}] {result['seconds']:8.3f}s  {result['melody']} -> {result['output']}  {result['message']}")
+    total_time = time.perf_counter() - start
+
+    failed = [result for result in results if result["status"] != "ok"]
+    print(f"\nRendered {len(results) - len(failed)} of {len(results)} jobs in {total_time:.3f}s, {len(failed)} failed.")
+    return results
+
+
+# Ingest Functions:
+#   - functions for reading many midi licks into the database at once
+#
+#   - helper for ingest_licks
+#   - reads and splits one midi/harmony pair
+def read_lick_pair(pair):
+    midi_file_name, harmony_file_name = pair
+    return lr.read_split_midi_files(midi_file_name, harmony_file_name)
+
+#   - parses all midi/harmony pairs in worker processes and adds all licks to the database with a single write
+def ingest_licks(file_pairs, tag, max_workers=None):
+    start = time.perf_counter()
+    new_licks = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for licks in executor.map(read_lick_pair, file_pairs, chunksize=8):
+            new_licks.extend(licks)
+    parse_time = time.perf_counter() - start
+
+    lr.update_database(new_licks, tag)
+    total_time = time.perf_counter() - start
+
+    stats = {"files" : len(file_pairs), "licks" : len(new_licks), "parse_seconds" : parse_time, "seconds" : total_time}
+    print(f"\nRead {stats['files']} files with {stats['licks']} licks in {total_time:.3f}s (parsing {parse_time:.3f}s, "
+          f"{stats['files'] / total_time:.1f} files/s, {stats['licks'] / total_time:.1f} licks/s)")
+    return stats
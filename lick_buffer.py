@@ -0,0 +1,97 @@
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file
+# in the root directory of this source tree.
+
+from array import array
+
+# column name and array typecode of every note column, the typecodes are also valid numpy dtypes
+# numpy is only imported when a column is used as numpy array, so reading the database does not pay for importing it
+NOTE_COLUMNS = (("pitch", "i"),
+                ("time", "d"),
+                ("note_duration", "d"),
+                ("volume", "i"),
+                ("pitchWheelValue", "i"))
+
+
+# Note Buffer:
+#   - columnar note container used in the whole backend instead of a dictonary of python lists
+#   - every column is a typed array, appends are amortized and offsets are applied vectorized
+#   - columns can still be read like the old dictonary, e.g. note_buffer["pitch"]
+class NoteBuffer:
+
+    def __init__(self, pitch=(), time=(), note_duration=(), volume=(), pitchWheelValue=None):
+        self.pitch = array("i", pitch)
+        self.time = array("d", time)
+        self.note_duration = array("d", note_duration)
+        self.volume = array("i", volume)
+        if pitchWheelValue is None:
+            self.pitchWheelValue = array("i", bytes(4 * len(self.pitch)))
+        else:
+            self.pitchWheelValue = array("i", pitchWheelValue)
+
+    #   - creates a note buffer out of a note dictonary (e.g. a lick of the database)
+    @classmethod
+    def from_dict(cls, note_dict):
+        return cls(note_dict["pitch"], note_dict["time"], note_dict["note_duration"], note_dict["volume"], note_dict["pitchWheelValue"])
+
+    #   - returns the note buffer as dictonary of python lists
+    def to_dict(self):
+        return {name : self[name].tolist() for name, typecode in NOTE_COLUMNS}
+
+    def __len__(self):
+        return len(self.pitch)
+
+    def __getitem__(self, name):
+        return getattr(self, name)
+
+    def keys(self):
+        return [name for name, typecode in NOTE_COLUMNS]
+
+    #   - appends a single note
+    def append(self, pitch, time, note_duration, volume, pitch_wheel_value=0):
+        self.pitch.append(pitch)
+        self.time.append(time)
+        self.note_duration.append(note_duration)
+        self.volume.append(volume)
+        self.pitchWheelValue.append(pitch_wheel_value)
+
+    #   - appends all notes of another note buffer, view or note dictonary
+    #   - pitch_offset and time_offset are only added to the appended notes
+    def extend(self, notes, pitch_offset=0, time_offset=0.0):
+        start = len(self.pitch)
+        for name, typecode in NOTE_COLUMNS:
+            column = notes[name]
+            if isinstance(column, memoryview):
+                self[name].frombytes(column)
+            else:
+                self[name].extend(column)
+        if pitch_offset != 0:
+            self.transpose(pitch_offset, start)
+        if time_offset != 0:
+            self.shift(time_offset, start)
+        return self
+
+    #   - zero copy, read only view of the notes from start to stop
+    #   - the buffer can not grow while a view is alive
+    def view(self, start=0, stop=None):
+        return {name : memoryview(self[name])[start:stop] for name, typecode in NOTE_COLUMNS}
+
+    #   - returns a numpy array sharing the memory of a column
+    def column_array(self, name):
+        import numpy as np
+        return np.frombuffer(self[name], dtype=self[name].typecode)
+
+    #   - transposes all notes from start on by semitones
+    def transpose(self, semitones, start=0):
+        if len(self.pitch) > start:
+            self.column_array("pitch")[start:] += semitones
+        return self
+
+    #   - shifts all notes from start on by time_offset
+    def shift(self, time_offset, start=0):
+        if len(self.time) > start:
+            self.column_array("time")[start:] += time_offset
+        return self
@@ -0,0 +1,153 @@
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file
+# in the root directory of this source tree.
+
+import hashlib
+import inspect
+import json
+import os
+import random
+from functools import lru_cache
+import lick_reader as lr
+from lick_buffer import NoteBuffer
+import lick_profile as lprof
+
+FRAGMENT_DIRECTORY = ".lick_cache"
+
+
+# Fragment Cache:
+#   - keeps the notes every melody function call created on disk, so an edited melody file only recomputes the calls that changed
+#   - a call is fingerprinted by its function and its evaluated arguments:
+#       - scale and random functions are stored at root note 0 and time 0 and moved to their beat when they are reused,
+#         so a call stays cached when it moves to another beat or practice key
+#       - random functions are only cached with a seed (e.g. writeLick with a render seed)
+#       - shredMode also depends on its beat, the harmony slice it covers and the database shards of its style tag
+#
+#   - path of the fragment cache of a melody file
+def fragment_path(melody_path):
+    name = hashlib.sha256(os.path.abspath(melody_path).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(FRAGMENT_DIRECTORY, name + ".json")
+
+#   - helper for bind_arguments
+#   - names and defaults of the parameters of a function
+@lru_cache(maxsize=256)
+def function_parameters(function):
+    return tuple((name, parameter.default) for name, parameter in inspect.signature(function).parameters.items())
+
+#   - helper for FragmentCache
+#   - returns all arguments of a call by name, with the defaults of the function filled in
+def bind_arguments(function, args, kwargs):
+    parameters = function_parameters(function)
+    arguments = dict(zip([name for name, default in parameters], args))
+    arguments.update(kwargs)
+    for name, default in parameters:
+        if name not in arguments:
+            if default is inspect.Parameter.empty:
+                raise TypeError(f"{function.__name__}() is missing the argument '{name}'")
+            arguments[name] = default
+    return arguments
+
+#   - helper for FragmentCache
+#   - returns the fingerprint of a call and whether its notes are stored at root note 0 and time 0
+#   - returns None for calls that can not be cached
+#   - tag_stamps keeps the database stamp of every style tag during a render
+def fragment_key(function, arguments, tag_stamps):
+    arguments = dict(arguments)
+    seed = arguments.get("seed")
+    if "seed" in arguments and (seed is None or isinstance(seed, random.Random)):
+        return None, False
+
+    if function.__name__ == "shredMode":
+        style = arguments["style"]
+        if style not in tag_stamps:
+            tag_stamps[style] = lr.tag_stamp(style) if lr.has_style_tag(style) else None
+        if tag_stamps[style] is None:
+            return None, False
+        harmony = arguments.pop("harmony")
+        chords = arguments.pop("chords")
+        midi_root_notes = arguments.pop("midi_root_notes")
+        start = arguments["time_offset"]
+        stop = start + arguments["duration"]
+        if harmony is not None:
+            arguments["harmony"] = (harmony.midi_roots[start:stop], harmony.vibes[start:stop])
+        else:
+            arguments["harmony"] = (tuple(midi_root_notes[start:stop]), tuple(chords[start:stop]))
+        arguments["database"] = tag_stamps[style]
+        normalized = False
+    else:
+        del arguments["midi_root_note"]
+        del arguments["time_offset"]
+        normalized = True
+
+    fingerprint = repr((function.__name__, sorted(arguments.items())))
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest(), normalized
+
+class FragmentCache:
+
+    #   - without a path every call is passed through to its function
+    def __init__(self, path=None):
+        self.path = path
+        self.fragments = {}
+        self.used_fragments = {}
+        self.tag_stamps = {}
+        self.hits = 0
+        self.misses = 0
+        if path is not None and os.path.exists(path):
+            try:
+                with open(path, "r") as file:
+                    self.fragments = json.load(file)
+            except (OSError, ValueError):
+                print(f"The fragment cache {path} could not be read and is rebuilt!")
+
+    #   - calls a melody function, or reuses its notes if the same call was made before
+    def call(self, function, *args, **kwargs):
+        if not lprof.enabled():
+            return self.call_function(function, args, kwargs)
+        with lprof.span(function.__name__, "call", time_offset=kwargs.get("time_offset")):
+            return self.call_function(function, args, kwargs)
+
+    #   - helper for call
+    def call_function(self, function, args, kwargs):
+        if self.path is None:
+            return function(*args, **kwargs)
+
+        arguments = bind_arguments(function, args, kwargs)
+        key, normalized = fragment_key(function, arguments, self.tag_stamps)
+        if key is None:
+            return function(*args, **kwargs)
+
+        if key in self.fragments:
+            self.hits += 1
+            lprof.count("fragment_hits")
+        else:
+            self.misses += 1
+            lprof.count("fragment_misses")
+            if normalized:
+                notes = function(**dict(arguments, midi_root_note=0, time_offset=0))
+            else:
+                notes = function(**arguments)
+            # failed calls already printed their error and are not cached
+            if isinstance(notes, int):
+                return notes
+            self.fragments[key] = notes.to_dict()
+        self.used_fragments[key] = self.fragments[key]
+
+        notes = NoteBuffer.from_dict(self.fragments[key])
+        if normalized:
+            notes.transpose(arguments["midi_root_note"])
+            notes.shift(arguments["time_offset"])
+        return notes
+
+    #   - writes the fragments of this render to disk, fragments of calls that were not made again are dropped
+    #   - an unchanged cache is not written again
+    def save(self):
+        if self.path is None or (self.misses == 0 and len(self.used_fragments) == len(self.fragments)):
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w") as file:
+            json.dump(self.used_fragments, file)
+        os.replace(temp_path, self.path)
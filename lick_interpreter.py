@@ -0,0 +1,394 @@
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file
+# in the root directory of this source tree.
+
+import ast
+import operator
+import types
+import lick_reader as lr
+import lick_writer as lw
+import lick_fragments as lf
+import lick_syntax as ls
+
+# Interpreter:
+#   - renders a .lc program by walking its syntax tree (see lick_syntax), no python code is generated or executed
+#   - melody calls are prepared once after parsing: constant arguments are taken as they are and literal notes lists are resolved
+#     to semitones and pitch wheel values of their scale, so the engines of lick_writer get them ready to use:
+#       dorian(":.:.", 2, [1, 3va], [100, 90])   ->   lw.create_lick_from_notes(":.:.", 2, (2, 15), (0, 0), (100, 90), ...)
+#   - expressions are evaluated by the interpreter itself and only reach the variables of the melody, the builtins in NAMES
+#     and the methods of numbers, strings, lists and tuples, names and attributes starting with "_" are refused,
+#     so a .lc file can not import modules, open files or run any other python code
+#
+#   - functions the melody can call by name
+NAMES = {"abs" : abs, "all" : all, "any" : any, "bool" : bool, "enumerate" : enumerate, "float" : float, "int" : int,
+         "len" : len, "list" : list, "max" : max, "min" : min, "print" : print, "range" : range, "reversed" : reversed,
+         "round" : round, "sorted" : sorted, "str" : str, "sum" : sum, "tuple" : tuple, "zip" : zip}
+SAFE_FUNCTIONS = {id(function) for function in NAMES.values()}
+# values whose methods can be called, str.format is left out because its format strings can read any attribute
+SAFE_TYPES = (int, float, str, list, tuple)
+UNSAFE_ATTRIBUTES = {"format", "format_map"}
+BINARY_OPERATORS = {ast.Add : operator.add, ast.Sub : operator.sub, ast.Mult : operator.mul, ast.Div : operator.truediv,
+                    ast.FloorDiv : operator.floordiv, ast.Mod : operator.mod, ast.Pow : operator.pow}
+AUGMENTED_OPERATORS = {ast.Add : operator.iadd, ast.Sub : operator.isub, ast.Mult : operator.imul, ast.Div : operator.itruediv,
+                       ast.FloorDiv : operator.ifloordiv, ast.Mod : operator.imod, ast.Pow : operator.ipow}
+UNARY_OPERATORS = {ast.USub : operator.neg, ast.UAdd : operator.pos, ast.Not : operator.not_}
+COMPARISON_OPERATORS = {ast.Eq : operator.eq, ast.NotEq : operator.ne, ast.Lt : operator.lt, ast.LtE : operator.le,
+                        ast.Gt : operator.gt, ast.GtE : operator.ge, ast.Is : operator.is_, ast.IsNot : operator.is_not,
+                        ast.In : lambda left, right: left in right, ast.NotIn : lambda left, right: left not in right}
+# parameters of the .lc functions that have another name in the engines of lick_writer
+ENGINE_PARAMETERS = {"volume" : "volume_list"}
+# voice of all calls before the first voice() call
+DEFAULT_VOICE = "main"
+
+
+#   - error of a melody while it is rendered, e.g. an unknown variable or a refused attribute
+class LickRuntimeError(Exception):
+
+    def __init__(self, message, line):
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+
+#   - helper
+#   - ends the render when a melody call does not fit into the harmony anymore
+class HarmonyEnd(Exception):
+    pass
+
+#   - a melody call prepared for the interpreter
+#   - constants are the arguments known before the render, expressions the ones evaluated on every call
+#   - notes of scale functions are resolved, unless the notes list contains expressions (degrees is then the degree list)
+class PreparedCall:
+
+    def __init__(self, node):
+        self.name = node.name
+        self.line = node.line
+        self.scale = ls.SCALE_FUNCTIONS.get(node.name, ls.RANDOM_FUNCTIONS.get(node.name))
+        self.constants = {}
+        self.expressions = []
+        self.degrees = None
+        self.note_errors = ()
+        # random functions and shredMode get the next random generator of the render, unless the melody passes its own seed
+        self.seeded = (node.name in ls.RANDOM_FUNCTIONS or node.name == "shredMode") and "seed" not in node.arguments
+
+        for name, value in node.arguments.items():
+            name = ENGINE_PARAMETERS.get(name, name)
+            if isinstance(value, ls.DegreeList):
+                self.prepare_notes(value)
+            elif isinstance(value, ast.Constant):
+                self.constants[name] = value.value
+            else:
+                self.expressions.append((name, value))
+
+        if node.name in ls.SCALE_FUNCTIONS:
+            self.function = lw.create_lick_from_notes
+        elif node.name in ls.RANDOM_FUNCTIONS:
+            self.function = lw.create_rand_lick
+            self.constants["scale"] = self.scale
+        else:
+            # pause, transposeHarmony and shredMode, voice is handled by the interpreter itself
+            self.function = getattr(lw, node.name, None)
+
+    #   - resolves a literal notes list, degrees that are no valid note are reported on every call like lick_writer does
+    #   - a notes list with expressions, or one the scale can not resolve (e.g. cromatic), is resolved on every call
+    def prepare_notes(self, degrees):
+        if degrees.is_literal():
+            try:
+                resolved = [(degree, lw.resolve_degree(self.scale, degree)) for degree in degrees.degrees]
+            except (KeyError, ValueError):
+                resolved = None
+            if resolved is not None:
+                self.constants["notes"] = tuple(note[0] for degree, note in resolved if note is not None)
+                self.constants["pitch_values"] = tuple(note[1] for degree, note in resolved if note is not None)
+                self.note_errors = tuple(degree for degree, note in resolved if note is None)
+                return
+        self.degrees = degrees
+
+#   - prepares all melody calls of a program, the calls are kept on their syntax tree nodes
+def prepare(program):
+    statements = list(program.body)
+    while statements:
+        node = statements.pop()
+        if isinstance(node, ls.MelodyCall):
+            node.prepared = PreparedCall(node)
+        elif isinstance(node, ls.If):
+            for test, body in node.branches:
+                statements.extend(body)
+            statements.extend(node.orelse or [])
+        elif isinstance(node, (ls.PracticeMode, ls.While, ls.For)):
+            statements.extend(node.body)
+    return program
+
+
+class Interpreter:
+
+    #   - render_seed, fragment_path and output_file are handled like in run_lick
+    def __init__(self, harmony_path, output_path_midi, render_seed=None, fragment_path=None, output_file=None):
+        self.harmony_path = harmony_path
+        self.output_path_midi = output_path_midi
+        self.render_seed = render_seed
+        self.fragment_path = fragment_path
+        self.output_file = output_file
+        self.midi_stream = None
+        self.fragment_cache = None
+        self.statements = {ls.MelodyCall : self.melody_call, ls.PracticeMode : self.practice_mode, ls.If : self.if_statement,
+                           ls.While : self.while_statement, ls.For : self.for_statement, ls.Assign : self.assign,
+                           ls.AugAssign : self.augmented_assign, ls.ExprStatement : self.expression_statement, ls.Jump : self.jump}
+        self.evaluators = {ast.Constant : self.constant, ast.Name : self.name, ast.List : self.list, ast.Tuple : self.tuple,
+                           ast.Subscript : self.subscript, ast.Slice : self.slice, ast.Attribute : self.attribute, ast.Call : self.call,
+                           ast.BinOp : self.binary_operation, ast.UnaryOp : self.unary_operation, ast.BoolOp : self.bool_operation,
+                           ast.Compare : self.compare}
+
+    #   - renders a prepared program into the midi file
+    def run(self, program):
+        midi_root_notes, chord_list, read_time_signature, readtempo = lr.harmony_processor(self.harmony_path)
+        self.harmony = lr.load_harmony(self.harmony_path)
+        self.rng_streams = lw.RandomStreams(self.render_seed)
+        self.fragment_cache = lf.FragmentCache(self.fragment_path)
+        self.midi_stream = lw.open_midi_stream(self.output_path_midi if self.output_file is None else self.output_file,
+                                               tempo=readtempo, time_signature=read_time_signature)
+        # every voice has its own beat and track, beat always is the beat of the current voice
+        self.voices = {DEFAULT_VOICE : {"track" : 0, "beat" : 0, "program" : 0, "channel" : 0}}
+        self.voice = DEFAULT_VOICE
+        self.track = 0
+        # the state of the render are variables of the melody, e.g. "if beat < 16 { ... }"
+        self.variables = {"beat" : 0, "key_count" : 0, "midi_root_notes" : midi_root_notes, "chord_list" : chord_list,
+                          "read_time_signature" : read_time_signature, "readtempo" : readtempo, "max_len" : len(midi_root_notes)}
+        # a render that fails leaves no truncated midi file behind and no open file handle
+        try:
+            self.block(program.body)
+        except HarmonyEnd:
+            self.midi_stream.close()
+            print("Your created Lick was longer than the harmony file! The lick was successfully created until the end of the given harmony!")
+            return
+        except BaseException:
+            self.midi_stream.abort()
+            raise
+        self.midi_stream.close()
+        print("The lick was successfully created!")
+
+    # Statements:
+    #   - every statement returns None, or "break" and "continue" to the loop around it
+    #   - errors are raised as LickRuntimeError with the line of the statement they happened in
+    #
+    def block(self, statements):
+        for statement in statements:
+            try:
+                jump = self.statements[type(statement)](statement)
+            except (LickRuntimeError, HarmonyEnd):
+                raise
+            except Exception as e:
+                raise LickRuntimeError(f"{type(e).__name__}: {e}", statement.line) from e
+            if jump is not None:
+                return jump
+        return None
+
+    #   - pause, transposeHarmony and voice change the state of the render, all other calls create notes at the current beat
+    def melody_call(self, node):
+        call = node.prepared
+        arguments = dict(call.constants)
+        for name, expression in call.expressions:
+            arguments[name] = self.evaluate(expression)
+        if call.degrees is not None:
+            degrees = tuple(degree if isinstance(degree, str) else str(self.evaluate(degree)) for degree in call.degrees.degrees)
+        if call.seeded:
+            arguments["seed"] = self.rng_streams.next()
+
+        variables = self.variables
+        if call.name == "pause":
+            variables["beat"] += lw.pause(**arguments)
+            return None
+        if call.name == "transposeHarmony":
+            variables["midi_root_notes"] = lw.transposeHarmony(**arguments, midi_root_notes=variables["midi_root_notes"])
+            self.harmony = self.harmony.with_roots(variables["midi_root_notes"])
+            return None
+        if call.name == "voice":
+            self.switch_voice(**arguments)
+            return None
+
+        beat = variables["beat"]
+        duration = arguments["duration"]
+        if beat + duration > variables["max_len"]:
+            raise HarmonyEnd()
+        if call.name == "shredMode":
+            notes = self.fragment_cache.call(call.function, **arguments, chords=variables["chord_list"],
+                                             midi_root_notes=variables["midi_root_notes"], time_offset=beat, harmony=self.harmony)
+        else:
+            if call.degrees is not None:
+                arguments["notes"], arguments["pitch_values"] = lw.degree_to_note(degrees, call.scale)
+            for degree in call.note_errors:
+                lw.note_parameter_error(degree)
+            notes = self.fragment_cache.call(call.function, **arguments, midi_root_note=variables["midi_root_notes"][beat], time_offset=beat / 2)
+        self.midi_stream.push(notes, beat / 2, self.track)
+        variables["beat"] = beat + duration
+        return None
+
+    #   - the following calls play in the named voice, from the beat where the voice stopped
+    #   - a new voice starts at the first beat of the harmony on its own track, with its midi program and channel
+    #   - every voice needs its own channel, without a channel a new voice gets the lowest channel no other voice plays on
+    def switch_voice(self, name, program=None, channel=None):
+        if not isinstance(name, str):
+            raise TypeError(f"the name of a voice must be a string, not {type(name).__name__}")
+        self.voices[self.voice]["beat"] = self.variables["beat"]
+        if name not in self.voices:
+            if channel is None:
+                channel = self.midi_stream.free_channel()
+                if channel is None:
+                    raise ValueError(f"no free midi channel is left for the voice '{name}'")
+            elif channel in self.midi_stream.used_channels():
+                raise ValueError(f"the midi channel {channel} of the voice '{name}' is already played by another voice")
+            voice = lw.Voice(name, 0 if program is None else program, channel)
+            track = self.midi_stream.add_track(voice.channel, voice.program, voice.name)
+            if track == 0:
+                # the default voice had no notes and its track was given to the new voice
+                del self.voices[DEFAULT_VOICE]
+            self.voices[name] = {"track" : track, "beat" : 0, "program" : voice.program, "channel" : voice.channel}
+        elif (program is not None and program != self.voices[name]["program"]) or (channel is not None and channel != self.voices[name]["channel"]):
+            raise ValueError(f"the voice '{name}' already plays program {self.voices[name]['program']} on channel {self.voices[name]['channel']}")
+        self.voice = name
+        self.track = self.voices[name]["track"]
+        self.variables["beat"] = self.voices[name]["beat"]
+
+    #   - the harmony is repeated in all 12 keys and the rest of the block is played once per key
+    def practice_mode(self, node):
+        variables = self.variables
+        variables["midi_root_notes"], variables["chord_list"] = lw.enablePracticeMode(variables["midi_root_notes"], variables["chord_list"])
+        self.harmony = lr.Harmony(variables["midi_root_notes"], variables["chord_list"], variables["read_time_signature"], variables["readtempo"])
+        variables["max_len"] = len(variables["midi_root_notes"])
+        while variables["key_count"] < 12:
+            if self.block(node.body) == "break":
+                break
+            variables["key_count"] += 1
+        return None
+
+    def if_statement(self, node):
+        for test, body in node.branches:
+            if self.evaluate(test):
+                return self.block(body)
+        if node.orelse is not None:
+            return self.block(node.orelse)
+        return None
+
+    def while_statement(self, node):
+        while self.evaluate(node.test):
+            if self.block(node.body) == "break":
+                break
+        return None
+
+    def for_statement(self, node):
+        for value in self.evaluate(node.iter):
+            self.store(node.target, value)
+            if self.block(node.body) == "break":
+                break
+        return None
+
+    def assign(self, node):
+        value = self.evaluate(node.value)
+        for target in node.targets:
+            self.store(target, value)
+        return None
+
+    def augmented_assign(self, node):
+        target = node.target
+        function = AUGMENTED_OPERATORS[type(node.op)]
+        if isinstance(target, ast.Name):
+            self.variables[target.id] = function(self.name(target), self.evaluate(node.value))
+        elif isinstance(target, ast.Subscript):
+            value = self.evaluate(target.value)
+            index = self.evaluate(target.slice)
+            value[index] = function(value[index], self.evaluate(node.value))
+        else:
+            raise ValueError("attributes can not be assigned to")
+        return None
+
+    def expression_statement(self, node):
+        self.evaluate(node.value)
+        return None
+
+    def jump(self, node):
+        return None if node.kind == "pass" else node.kind
+
+    #   - helper
+    #   - assigns a value to a name, subscript or tuple of them
+    def store(self, target, value):
+        if isinstance(target, ast.Name):
+            self.variables[target.id] = value
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            values = list(value)
+            if len(values) != len(target.elts):
+                raise ValueError(f"expected {len(target.elts)} values to unpack, got {len(values)}")
+            for element, element_value in zip(target.elts, values):
+                self.store(element, element_value)
+        elif isinstance(target, ast.Subscript):
+            self.evaluate(target.value)[self.evaluate(target.slice)] = value
+        else:
+            raise ValueError("attributes can not be assigned to")
+
+    # Expressions:
+    #   - the python expressions of lick_syntax, evaluated directly on their syntax tree
+    #
+    def evaluate(self, node):
+        if type(node) is ast.Constant:
+            return node.value
+        return self.evaluators[type(node)](node)
+
+    def constant(self, node):
+        return node.value
+
+    def name(self, node):
+        name = node.id
+        if name in self.variables:
+            return self.variables[name]
+        if name in NAMES:
+            return NAMES[name]
+        raise NameError(f"name '{name}' is not defined")
+
+    def list(self, node):
+        return [self.evaluate(element) for element in node.elts]
+
+    def tuple(self, node):
+        return tuple(self.evaluate(element) for element in node.elts)
+
+    def subscript(self, node):
+        return self.evaluate(node.value)[self.evaluate(node.slice)]
+
+    def slice(self, node):
+        return slice(*[None if bound is None else self.evaluate(bound) for bound in (node.lower, node.upper, node.step)])
+
+    def attribute(self, node):
+        value = self.evaluate(node.value)
+        if node.attr.startswith("_") or node.attr in UNSAFE_ATTRIBUTES or not isinstance(value, SAFE_TYPES):
+            raise AttributeError(f"'{node.attr}' of {type(value).__name__} values can not be used in a melody")
+        return getattr(value, node.attr)
+
+    #   - only the functions in NAMES and the methods of SAFE_TYPES can be called
+    def call(self, node):
+        function = self.evaluate(node.func)
+        if id(function) not in SAFE_FUNCTIONS and not (isinstance(function, types.BuiltinMethodType) and isinstance(function.__self__, SAFE_TYPES)):
+            raise TypeError(f"{type(function).__name__} values can not be called in a melody")
+        return function(*[self.evaluate(argument) for argument in node.args],
+                        **{keyword.arg : self.evaluate(keyword.value) for keyword in node.keywords})
+
+    def binary_operation(self, node):
+        return BINARY_OPERATORS[type(node.op)](self.evaluate(node.left), self.evaluate(node.right))
+
+    def unary_operation(self, node):
+        return UNARY_OPERATORS[type(node.op)](self.evaluate(node.operand))
+
+    def bool_operation(self, node):
+        is_and = isinstance(node.op, ast.And)
+        for value_node in node.values:
+            value = self.evaluate(value_node)
+            if bool(value) != is_and:
+                return value
+        return value
+
+    def compare(self, node):
+        left = self.evaluate(node.left)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = self.evaluate(comparator)
+            if not COMPARISON_OPERATORS[type(op)](left, right):
+                return False
+            left = right
+        return True
@@ -0,0 +1,415 @@
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file
+# in the root directory of this source tree.
+
+import heapq
+import math
+import os
+import struct
+import time
+from operator import itemgetter
+import numpy as np
+import lick_profile as lprof
+
+# time base of the written files, identical to the defaults of pretty_midi:
+# 220 ticks per quarter note and note times in seconds at 120 BPM
+RESOLUTION = 220
+INITIAL_TEMPO = 120.0
+TICK_SCALE = 60.0/(INITIAL_TEMPO*RESOLUTION)
+
+# sort order of events on the same tick, same scores as pretty_midi uses
+PROGRAM_CHANGE_SCORE = 6 * 256 * 256
+PITCH_WHEEL_SCORE = 7 * 256 * 256
+NOTE_ON_SCORE = 10 * 256 * 256
+
+NOTE_ON = 0x90
+PROGRAM_CHANGE = 0xC0
+PITCH_WHEEL = 0xE0
+DRUM_CHANNEL = 9
+
+
+# Standard MIDI File Encoder:
+#   - writes note buffers straight to delta timed midi events without building pretty_midi or mido objects
+#
+#   - helper
+#   - encodes a number as midi variable length quantity
+def encode_variable_int(value):
+    if value < 0:
+        raise ValueError(f"A midi delta time can not be negative: {value}")
+    data = [value & 0x7F]
+    value >>= 7
+    while value:
+        data.append((value & 0x7F) | 0x80)
+        value >>= 7
+    return bytes(reversed(data))
+
+#   - helper
+#   - decodes the midi variable length quantity at position and returns it with the position behind it
+def decode_variable_int(data, position):
+    value = 0
+    while data[position] & 0x80:
+        value = (value << 7) | (data[position] & 0x7F)
+        position += 1
+    return (value << 7) | data[position], position + 1
+
+#   - helper
+#   - converts times in seconds to absolute ticks, rounded like pretty_midi does it
+def times_to_ticks(times):
+    times = np.asarray(times, dtype=np.float64)
+    return np.where(times > 0, np.rint(times / TICK_SCALE), 0).astype(np.int64).tolist()
+
+#   - helper
+#   - writes one chunk with its name and length
+def write_chunk(file, name, data):
+    file.write(name)
+    file.write(struct.pack(">L", len(data)))
+    file.write(data)
+
+#   - helper
+#   - the timing track with tempo and time signature, always the first track of the file
+def timing_track(time_signature):
+    numerator, denominator = time_signature
+    tempo = int(6e7/(60./(TICK_SCALE*RESOLUTION)))
+    data = bytearray()
+    data += b"\x00\xFF\x51\x03" + bytes([tempo >> 16, tempo >> 8 & 0xFF, tempo & 0xFF])
+    data += b"\x00\xFF\x58\x04" + bytes([numerator, int(math.log(denominator, 2)), 24, 8])
+    data += b"\x01\xFF\x2F\x00"
+    return bytes(data)
+
+#   - helper
+#   - meta event with the name of a track, e.g. the name of a voice
+def track_name_event(name):
+    data = name.encode("utf-8")
+    return b"\x00\xFF\x03" + encode_variable_int(len(data)) + data
+
+#   - helper
+#   - creates the unsorted (tick, score, status, data1, data2) events of a note buffer
+#   - note offs are note ons with velocity 0
+def note_events(note_dict, channel=0, program=0):
+    start_ticks = times_to_ticks(note_dict["time"])
+    end_ticks = times_to_ticks(np.asarray(note_dict["time"], dtype=np.float64) + np.asarray(note_dict["note_duration"], dtype=np.float64))
+
+    events = [(0, PROGRAM_CHANGE_SCORE, PROGRAM_CHANGE | channel, program, 0)]
+    for pitch, volume, start_tick, end_tick in zip(note_dict["pitch"], note_dict["volume"], start_ticks, end_ticks):
+        if not (0 <= pitch <= 127 and 0 <= volume <= 127):
+            raise ValueError(f"Note out of midi range: pitch {pitch}, volume {volume}")
+        events.append((start_tick, NOTE_ON_SCORE + pitch * 256 + volume, NOTE_ON | channel, pitch, volume))
+        events.append((end_tick, NOTE_ON_SCORE + pitch * 256, NOTE_ON | channel, pitch, 0))
+    for pitch_wheel_value, start_tick in zip(note_dict["pitchWheelValue"], start_ticks):
+        events.append((start_tick, PITCH_WHEEL_SCORE + pitch_wheel_value, PITCH_WHEEL | channel, pitch_wheel_value, 0))
+    return events
+
+#   - helper
+#   - drops every pitch bend of sorted events that does not change the pitch wheel
+#   - of several pitch bends on the same tick only the last one is in effect
+def drop_redundant_pitch_bends(events, pitch_wheel_value=0):
+    kept_events = []
+    for i in range(0, len(events)):
+        event = events[i]
+        if event[2] & 0xF0 == PITCH_WHEEL:
+            next_event = events[i + 1] if i + 1 < len(events) else None
+            if next_event is not None and next_event[0] == event[0] and next_event[2] & 0xF0 == PITCH_WHEEL:
+                continue
+            if event[3] == pitch_wheel_value:
+                continue
+            pitch_wheel_value = event[3]
+        kept_events.append(event)
+    return kept_events, pitch_wheel_value
+
+#   - helper
+#   - encodes sorted absolute events to track data with delta times and running status
+def encode_events(events, tick=0, running_status=None):
+    data = bytearray()
+    for event_tick, score, status, data_1, data_2 in events:
+        data += encode_variable_int(event_tick - tick)
+        tick = event_tick
+        if status != running_status:
+            data.append(status)
+            running_status = status
+        if status & 0xF0 == PITCH_WHEEL:
+            value = data_1 + 8192
+            data.append(value & 0x7F)
+            data.append(value >> 7)
+        elif status & 0xF0 == PROGRAM_CHANGE:
+            data.append(data_1)
+        else:
+            data.append(data_1)
+            data.append(data_2)
+    return data, tick, running_status
+
+#   - helper
+#   - decodes track data of encode_events back to its absolute (tick, score, status, data1, data2) events, meta events are skipped
+#   - pitch bends dropped by drop_redundant_pitch_bends are restored as one pitch bend at every note start, so the events can
+#     be merged with new ones and encoded again
+def decode_events(data):
+    events = []
+    position = 0
+    tick = 0
+    status = None
+    pitch_wheel_value = 0
+    bend_ticks = set()
+    while position < len(data):
+        delta, position = decode_variable_int(data, position)
+        tick += delta
+        if data[position] == 0xFF:
+            length, position = decode_variable_int(data, position + 2)
+            position += length
+            continue
+        if data[position] & 0x80:
+            status = data[position]
+            position += 1
+        if status & 0xF0 == PITCH_WHEEL:
+            pitch_wheel_value = (data[position] | data[position + 1] << 7) - 8192
+            events.append((tick, PITCH_WHEEL_SCORE + pitch_wheel_value, status, pitch_wheel_value, 0))
+            bend_ticks.add(tick)
+            position += 2
+        elif status & 0xF0 == PROGRAM_CHANGE:
+            events.append((tick, PROGRAM_CHANGE_SCORE, status, data[position], 0))
+            position += 1
+        else:
+            pitch, volume = data[position], data[position + 1]
+            events.append((tick, NOTE_ON_SCORE + pitch * 256 + volume, status, pitch, volume))
+            if volume != 0 and tick not in bend_ticks:
+                events.append((tick, PITCH_WHEEL_SCORE + pitch_wheel_value, PITCH_WHEEL | (status & 0x0F), pitch_wheel_value, 0))
+                bend_ticks.add(tick)
+            position += 2
+    return events
+
+#   - encodes a whole note buffer to the data of one track, a named track starts with its name
+def note_track(note_dict, channel=0, program=0, all_pitch_bends=False, name=None):
+    events = note_events(note_dict, channel, program)
+    events.sort(key=itemgetter(0, 1))
+    if not all_pitch_bends:
+        events, pitch_wheel_value = drop_redundant_pitch_bends(events)
+    data, tick, running_status = encode_events(events)
+    data += b"\x01\xFF\x2F\x00"
+    if name:
+        return track_name_event(name) + bytes(data)
+    return bytes(data)
+
+#   - writes a note buffer to a midi file (file name or binary file object)
+#   - with all_pitch_bends a pitch bend is written for every note and the file equals the one pretty_midi writes
+def write_midi(note_dict, output_file, time_signature=(4, 4), all_pitch_bends=False, channel=0, program=0):
+    write_midi_tracks([(note_dict, channel, program, None)], output_file, time_signature, all_pitch_bends)
+
+#   - writes several note buffers as tracks of one midi file
+#   - tracks are (note buffer, channel, program, name) tuples, the name may be None
+#   - every track needs its own channel, the pitch wheel of a channel is shared by all of its notes
+def write_midi_tracks(tracks, output_file, time_signature=(4, 4), all_pitch_bends=False):
+    channels = [channel for note_dict, channel, program, name in tracks]
+    if len(set(channels)) != len(channels):
+        raise ValueError(f"Every track needs its own midi channel, not {channels}!")
+    tracks = [timing_track(time_signature)] + [note_track(note_dict, channel, program, all_pitch_bends, name)
+                                               for note_dict, channel, program, name in tracks]
+    if isinstance(output_file, str):
+        with open(output_file, "wb") as file:
+            write_tracks(file, tracks)
+    else:
+        write_tracks(output_file, tracks)
+
+#   - writes the header chunk and all track chunks
+def write_tracks(file, tracks):
+    write_chunk(file, b"MThd", struct.pack(">hhh", 1, len(tracks), RESOLUTION))
+    for track in tracks:
+        write_chunk(file, b"MTrk", track)
+
+
+# Streaming Encoder:
+#   - writes the note tracks while the lick is still being created, so the notes never have to be kept in memory as a whole
+#   - every pushed note buffer starts at or after its time offset, so all events of its track before that offset are final and get encoded
+#   - a note buffer with notes before the encoded part of its track (e.g. after a negative pause) rewinds the track: its encoded
+#     data is decoded again, merged with the new notes and encoded from the start
+#   - the first track is written to the file right away, further tracks (e.g. the voices of a melody) are kept encoded
+#     until close and written behind it, so all tracks end up in one file that is written once
+#   - the written file is identical to the one of write_midi and write_midi_tracks
+#
+#   - helper for MidiStreamWriter
+#   - encoder state of one track
+class TrackStream:
+
+    def __init__(self, channel=0, program=0, name=None):
+        self.channel = channel
+        self.pending = [(0, PROGRAM_CHANGE_SCORE, PROGRAM_CHANGE | channel, program, 0)]
+        self.tick = 0
+        self.running_status = None
+        self.pitch_wheel_value = 0
+        self.encoded = False
+        # written in front of the first events
+        self.name_event = track_name_event(name) if name else b""
+        self.start = self.name_event
+
+    #   - adds the events of a note buffer, they are encoded once their tick is final
+    #   - returns False if events are before the encoded part of the track, nothing is added then and the track must be rewound
+    def push(self, note_dict):
+        events = note_events(note_dict, self.channel)[1:]
+        if self.encoded and events and min(event[0] for event in events) <= self.tick:
+            return False
+        for event in events:
+            heapq.heappush(self.pending, event)
+        return True
+
+    #   - takes back the decoded events of the encoded track data, they are encoded again with the next flush
+    def rewind(self, events):
+        self.pending.extend(events)
+        heapq.heapify(self.pending)
+        self.tick = 0
+        self.running_status = None
+        self.pitch_wheel_value = 0
+        self.encoded = False
+        self.start = self.name_event
+
+    #   - encodes all pending events before the given tick and returns their track data
+    def flush(self, tick=None):
+        events = []
+        while self.pending and (tick is None or self.pending[0][0] < tick):
+            events.append(heapq.heappop(self.pending))
+        events, self.pitch_wheel_value = drop_redundant_pitch_bends(events, self.pitch_wheel_value)
+        data, self.tick, self.running_status = encode_events(events, self.tick, self.running_status)
+        self.encoded = self.encoded or len(events) != 0
+        if self.start:
+            data[0:0] = self.start
+            self.start = b""
+        return data
+
+class MidiStreamWriter:
+
+    def __init__(self, output_file, time_signature=(4, 4), channel=0, program=0):
+        if isinstance(output_file, str):
+            # the first track is read back from the file if it has to be rewound
+            self.file = open(output_file, "w+b")
+            self.close_file = True
+            self.path = output_file
+        else:
+            self.file = output_file
+            self.close_file = False
+            self.path = None
+        self.time_signature = time_signature
+        # files the first track can not be read back from (e.g. stdout) keep it in memory like the other tracks
+        self.seekable = self.file.seekable() and self.file.readable()
+        self.tracks = [TrackStream(channel, program)]
+        # data of every track that is not written yet, the first track is written right away if the file is seekable
+        self.track_data = [bytearray()]
+        self.track_length = 0
+        # the first track can be given to add_track as long as no notes were pushed into it
+        self.first_track_free = True
+        self.closed = False
+        # time spent encoding and writing, for the stage timings of a render
+        self.write_seconds = 0.0
+
+        if self.seekable:
+            # the number of tracks and the length of the first track are patched on close
+            self.header_position = self.file.tell()
+            write_chunk(self.file, b"MThd", struct.pack(">hhh", 1, 2, RESOLUTION))
+            write_chunk(self.file, b"MTrk", timing_track(time_signature))
+            self.file.write(b"MTrk")
+            self.length_position = self.file.tell()
+            self.file.write(struct.pack(">L", 0))
+
+    #   - channels of the tracks, the first track does not hold its channel as long as it can be given to add_track
+    def used_channels(self):
+        return {stream.channel for track, stream in enumerate(self.tracks) if track != 0 or not self.first_track_free}
+
+    #   - lowest channel no track holds, the drum channel (10, or 9 counted from 0) is left out, None if all are held
+    def free_channel(self):
+        used_channels = self.used_channels()
+        return next((channel for channel in range(0, 16) if channel != DRUM_CHANNEL and channel not in used_channels), None)
+
+    #   - adds a track and returns its number for push
+    #   - as long as nothing was pushed, the first track is replaced, so a file of named tracks has no empty track in front
+    #   - every track needs its own channel, the pitch bends of one track would bend the notes of another track on its channel
+    def add_track(self, channel=0, program=0, name=None):
+        if channel in self.used_channels():
+            raise ValueError(f"The midi channel {channel} is already used by another track!")
+        if self.first_track_free:
+            self.first_track_free = False
+            self.tracks[0] = TrackStream(channel, program, name)
+            return 0
+        self.tracks.append(TrackStream(channel, program, name))
+        self.track_data.append(bytearray())
+        return len(self.tracks) - 1
+
+    #   - adds the notes of a note buffer to a track, which were created for the given time offset (in seconds)
+    def push(self, note_dict, time_offset=0.0, track=0):
+        # functions that failed already printed their error and returned -1
+        if isinstance(note_dict, int):
+            return
+        start = time.perf_counter()
+        self.first_track_free = False
+        stream = self.tracks[track]
+        if not stream.push(note_dict):
+            self.rewind(track)
+            stream.push(note_dict)
+        self.write(stream.flush(times_to_ticks([time_offset])[0]), track)
+        self.write_seconds += time.perf_counter() - start
+
+    #   - helper
+    #   - takes back the encoded data of a track and gives its events back to the track stream
+    def rewind(self, track):
+        if track == 0 and self.seekable:
+            data_position = self.length_position + 4
+            end_position = self.file.tell()
+            self.file.seek(data_position)
+            data = self.file.read(end_position - data_position)
+            self.file.seek(data_position)
+            self.file.truncate()
+        else:
+            data = bytes(self.track_data[track])
+            self.track_data[track] = bytearray()
+        self.track_length -= len(data)
+        self.tracks[track].rewind(decode_events(data))
+        lprof.count("midi_rewinds")
+
+    #   - helper
+    #   - writes track data to the file, or keeps it until close
+    def write(self, data, track=0):
+        self.track_length += len(data)
+        if track == 0 and self.seekable:
+            self.file.write(data)
+        else:
+            self.track_data[track] += data
+
+    #   - writes all remaining events and the end of every track
+    def close(self):
+        if self.closed:
+            return
+        start = time.perf_counter()
+        for track in range(0, len(self.tracks)):
+            self.write(self.tracks[track].flush(), track)
+            self.write(b"\x01\xFF\x2F\x00", track)
+        lprof.count("midi_bytes_written", self.track_length)
+        if self.seekable:
+            first_track_end = self.file.tell()
+            for data in self.track_data[1:]:
+                write_chunk(self.file, b"MTrk", bytes(data))
+            end_position = self.file.tell()
+            self.file.seek(self.length_position)
+            self.file.write(struct.pack(">L", first_track_end - self.length_position - 4))
+            if len(self.tracks) > 1:
+                # the number of tracks follows "MThd", the chunk length and the format
+                self.file.seek(self.header_position + 10)
+                self.file.write(struct.pack(">h", 1 + len(self.tracks)))
+            self.file.seek(end_position)
+        else:
+            write_tracks(self.file, [timing_track(self.time_signature)] + [bytes(data) for data in self.track_data])
+        self.file.flush()
+        if self.close_file:
+            self.file.close()
+        self.closed = True
+        self.write_seconds += time.perf_counter() - start
+        lprof.count("midi_write_ms", self.write_seconds * 1000)
+
+    #   - ends a stream whose render failed, a file opened by the writer is closed and removed so no truncated midi file is left
+    #   - a file object of the caller (e.g. stdout) is left open, it can not be taken back
+    def abort(self):
+        if self.closed:
+            return
+        self.closed = True
+        if self.close_file:
+            self.file.close()
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
@@ -0,0 +1,134 @@
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file
+# in the root directory of this source tree.
+
+import json
+import os
+import time
+
+PROFILE_VARIABLE = "LICK_PROFILE"
+
+
+# Profiler:
+#   - opt-in timing of the render stages (harmony parsing, melody parsing, database loading, shred selection, midi writing),
+#     of every melody function call and of counters like the database bytes read
+#   - enabled with "lickCorea.py --profile <file>" or the environment variable LICK_PROFILE=<file>
+#   - the report is a Chrome trace (chrome://tracing, ui.perfetto.dev) with a summary per span name and all counters added
+#   - while disabled span() returns a shared empty context and count() returns at once, so the hooks cost next to nothing
+#
+#   - process wide profiler, None while profiling is disabled
+_profiler = None
+
+class Profiler:
+
+    def __init__(self, path):
+        self.path = path
+        self.start = time.perf_counter()
+        self.events = []
+        self.counters = {}
+
+    #   - adds a finished span, times in seconds of perf_counter
+    def add_span(self, name, category, start, end, args):
+        self.events.append((name, category, start, end, args))
+
+    #   - adds value to a counter
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    #   - call count, total and longest time of every span name
+    def summary(self):
+        summary = {}
+        for name, category, start, end, args in self.events:
+            entry = summary.setdefault(name, {"category" : category, "calls" : 0, "total_ms" : 0.0, "max_ms" : 0.0})
+            entry["calls"] += 1
+            entry["total_ms"] += (end - start) * 1000
+            entry["max_ms"] = max(entry["max_ms"], (end - start) * 1000)
+        return dict(sorted(summary.items(), key=lambda item: -item[1]["total_ms"]))
+
+    #   - the report as Chrome trace dictonary, times in microseconds since the profiler was enabled
+    def report(self):
+        pid = os.getpid()
+        trace_events = []
+        for name, category, start, end, args in self.events:
+            trace_events.append({"name" : name, "cat" : category, "ph" : "X", "pid" : pid, "tid" : 0,
+                                 "ts" : (start - self.start) * 1e6, "dur" : (end - start) * 1e6, "args" : args})
+        end = (time.perf_counter() - self.start) * 1e6
+        for name in self.counters:
+            trace_events.append({"name" : name, "cat" : "counter", "ph" : "C", "pid" : pid, "tid" : 0, "ts" : end,
+                                 "args" : {name : self.counters[name]}})
+        return {"traceEvents" : trace_events, "displayTimeUnit" : "ms", "summary" : self.summary(), "counters" : dict(self.counters)}
+
+    #   - writes the report to the profile file
+    def save(self):
+        with open(self.path, "w") as file:
+            json.dump(self.report(), file, indent=1)
+
+class Span:
+
+    def __init__(self, profiler, name, category, args):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.add_span(self.name, self.category, self.start, time.perf_counter(), self.args)
+        return False
+
+class NoSpan:
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+NO_SPAN = NoSpan()
+
+#   - starts profiling, the report is written to path by save()
+def enable(path):
+    global _profiler
+    _profiler = Profiler(path)
+    return _profiler
+
+#   - starts profiling if the environment variable is set, returns the profile file or None
+def enable_from_environment():
+    path = os.environ.get(PROFILE_VARIABLE)
+    if path:
+        enable(path)
+    return path or None
+
+#   - stops profiling and writes the report, prints the slowest spans
+def save(top=8):
+    global _profiler
+    profiler = _profiler
+    _profiler = None
+    if profiler is None:
+        return
+    profiler.save()
+    print(f"Profile written to {profiler.path}:")
+    for name, entry in list(profiler.summary().items())[:top]:
+        print(f"\t{name:<24} {entry['calls']:>6} calls {entry['total_ms']:10.2f}ms")
+    for name in sorted(profiler.counters):
+        print(f"\t{name:<24} {profiler.counters[name]:>10g}")
+
+def enabled():
+    return _profiler is not None
+
+#   - times the code of a with block as a span with the given name, category and arguments
+def span(name, category="stage", **args):
+    if _profiler is None:
+        return NO_SPAN
+    return Span(_profiler, name, category, args)
+
+#   - adds value to a counter of the report
+def count(name, value=1):
+    if _profiler is not None:
+        _profiler.count(name, value)
@@ -1,211 +1,425 @@
-# Copyright (c) 2025, Michael Žutić, Oliver Köll
-# All rights reserved.
-#
-# This source code is licensed under the
-# MIT License found in the LICENSE.txt file 
-# in the root directory of this source tree.
-
-import pretty_midi
-import json
-
-DATABASE = "database/lick_database.json"
-BACKUP_DATABASE = "database/lick_database_backup.json"
-
-# Harmony File Functions:
-#   - functions for reading and processing the Harmony File
-#
-#   - helper
-#   - turns chord into one out of three possible chord forms
-def chord_to_vibe(chord):
-    match chord:
-        case "":
-            return "maj"
-        case "maj7":
-            return "maj"
-        case "m":
-            return "min"
-        case "m7":
-            return "min"
-        case "7":
-            return "dom"
-
-#   - splits a chord (char) into the midi note of the root of the chord and the cord function
-def char_chord_processor(chord):
-    midi_note = 0
-    sign_parameter = 0
-    root = chord[0]
-    if len(chord) != 1: 
-        if chord[1] == "b":
-            sign_parameter = -1
-            function = chord_to_vibe(chord[2:])
-        elif chord[1] == "#":
-            sign_parameter = 1
-            function = chord_to_vibe(chord[2:])
-        else:
-            sign_parameter = 0
-            function = chord_to_vibe(chord[1:])
-    else:
-        sign_parameter = 0
-        function = "maj"
-
-    match root:
-        case "C":
-            midi_note = 60 + sign_parameter
-        case "D":
-            midi_note = 62 + sign_parameter
-        case "E":
-            midi_note = 64 + sign_parameter
-        case "F":
-            midi_note = 65 + sign_parameter
-        case "G":
-            midi_note = 55 + sign_parameter
-        case "A":
-            midi_note = 57 + sign_parameter
-        case "B":
-            midi_note = 59 + sign_parameter
-
-    return midi_note, function
-
-#   - takes file name and creates a list of characters out of it
-def read_harmony_file(file_name):
-    harmony_array = []
-    time_signature_flag = 1
-
-    with open(file_name, 'r') as file:
-        for line in file:
-            if time_signature_flag == 1:
-                numerator = int(line.strip()[:line.find("/")])
-                denominator = int(line.strip()[line.find("/")+1:line.find(":")])
-                tempo = int(line.strip()[line.find(":")+1:line.find("BPM")])
-                harmony_array.append([numerator,denominator,tempo]) 
-                time_signature_flag = 0
-            elif line.find("|") == -1:
-                pass
-            else:
-                for chord in line.split("|"):
-                    if chord.strip() == "":
-                        pass
-                    elif chord.strip() == "%":
-                        harmony_array.append(harmony_array[-1])   
-                    else:
-                        harmony_array.append(chord.strip())   
-    return harmony_array
-
-#   - takes harmony file and extracts the root notes, the chord functions and the root diffrences
-def harmony_processor(file_name):
-    read_harmony_file_out = read_harmony_file(file_name)
-    signature_file = read_harmony_file_out[0]
-    harmony_array = read_harmony_file_out[1:]
-
-    time_signature = (signature_file[0], signature_file[1])
-    tempo = signature_file[2]
-
-    midiRootArray = []
-    function_list = []
-
-    for chord in harmony_array:
-        midi_note, function = char_chord_processor(chord)
-        midiRootArray.append(midi_note)
-        function_list.append(function)
-        
-    return midiRootArray, function_list, time_signature, tempo  
-
-
-###Lick Reader Functions###
-#   - read and split midi files into chord based licks
-def read_split_midi_files(midiFileName, harmonyFileName):
-    lick_list = []
-    new_lick_dict = {"pitch" : [], "time" : [], "note_duration" : [], "volume" : [], "chord" : [], "pitchWheelValue" : []}
-    midi_data = pretty_midi.PrettyMIDI(midiFileName)
-
-    midiRootArray, function_list, read_time_signature, readtempo = harmony_processor(harmonyFileName)
-
-    for note in midi_data.instruments[0].notes:
-        new_lick_dict["pitch"].append(note.pitch)
-        new_lick_dict["time"].append(note.start)
-        new_lick_dict["note_duration"].append(note.get_duration())
-        new_lick_dict["volume"].append(note.velocity)
-        new_lick_dict["pitchWheelValue"].append(0)
-
-    new_lick_dict["chord"] = function_list
-
-    #splitter part
-    split_mark_list = []
-    split_time_list = [0]
-    root_list = [midiRootArray[0]]
-    chord_cut = []
-    beat = 0
-    time_list = new_lick_dict["time"]
-    old_chord = new_lick_dict["chord"][0]
-    for chord in new_lick_dict["chord"]:
-        if chord != old_chord:
-            for time in time_list:
-                if time*2 < beat:
-                    pass
-                else:
-                    split_mark_list.append(time_list.index(time))
-                    split_time_list.append(beat/2)
-                    root_list.append(midiRootArray[beat])
-                    chord_cut.append(beat)
-                    break
-            old_chord = chord
-        beat += 1
-    split_mark_list.append(len(time_list))
-    chord_cut.append(beat)
-
-    old_split_mark = 0
-    old_chort_cut = 0
-    for i in range(0,len(split_mark_list)):
-        splitLick = {}
-        splitLick["pitch"] = [x - root_list[i] for x in new_lick_dict["pitch"][old_split_mark:split_mark_list[i]]]
-        splitLick["time"] = [x - split_time_list[i] for x in new_lick_dict["time"][old_split_mark:split_mark_list[i]]]
-        splitLick["note_duration"] = new_lick_dict["note_duration"][old_split_mark:split_mark_list[i]]
-        splitLick["volume"] = new_lick_dict["volume"][old_split_mark:split_mark_list[i]]
-        splitLick["chord"] = new_lick_dict["chord"][old_chort_cut:chord_cut[i]]
-        splitLick["pitchWheelValue"] = new_lick_dict["pitchWheelValue"][old_split_mark:split_mark_list[i]]
-        splitLick["length"] = len(splitLick["chord"])
-        lick_list.append(splitLick)
-        old_split_mark = split_mark_list[i]
-        old_chort_cut = chord_cut[i]
-
-    return lick_list
-
-
-# Database Operations:
-# - functions for handeling the database
-#
-#   - sets database to backup state
-def clear_database():
-    with open(BACKUP_DATABASE, "r") as bfile:
-        backup_database = json.load(bfile)
-    lick_database = backup_database
-    with open(DATABASE, "w") as file:
-        json.dump(lick_database, file, indent=4)  # 'indent=4' für lesbares Format
-
-#   - reads outdatabase and returns it in a dictonary
-def load_database():
-    with open(DATABASE, "r") as file:
-        lick_database = json.load(file)
-    return lick_database
-
-#   - displays statistic of database
-def show_database():
-    lick_database = load_database()
-    for key in lick_database.keys():
-        print(f"Tag: {key}:")
-        for chord_type in lick_database[key].keys():
-            print(f"\t{chord_type}:\t{len(lick_database[key][chord_type])}")  
-
-#   - updates several new licks to the database
-def update_database(new_licks, tag):
-    lick_database = load_database()
-
-    if tag not in lick_database:
-        lick_database[tag] = {   "min" : [{"pitch": [0], "time": [0],"note_duration": [0.01],"volume": [0],"chord": ["min"],"pitchWheelValue": [0],"length": 1}],
-                                "maj" : [{"pitch": [0], "time": [0],"note_duration": [0.01],"volume": [0],"chord": ["maj"],"pitchWheelValue": [0],"length": 1}],
-                                "dom" : [{"pitch": [0], "time": [0],"note_duration": [0.01],"volume": [0],"chord": ["dom"],"pitchWheelValue": [0],"length": 1}]}
-    for lick in new_licks:
-        lick_database[tag][lick["chord"][0]].append(lick)
-    
-    with open(DATABASE, "w") as file:
-        json.dump(lick_database, file, indent=4)
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file 
+# in the root directory of this source tree.
+
+import json
+import os
+import shutil
+import copy
+from lick_buffer import NoteBuffer
+import lick_profile as lprof
+
+DATABASE = "database/lick_database.json"
+BACKUP_DATABASE = "database/lick_database_backup.json"
+SHARD_DIRECTORY = "database/licks"
+SHARD_EXTENSION = ".jsonl"
+
+# Harmony File Functions:
+#   - functions for reading and processing the Harmony File
+#
+#   - helper
+#   - turns chord into one out of three possible chord forms
+def chord_to_vibe(chord):
+    match chord:
+        case "":
+            return "maj"
+        case "maj7":
+            return "maj"
+        case "m":
+            return "min"
+        case "m7":
+            return "min"
+        case "7":
+            return "dom"
+
+#   - splits a chord (char) into the midi note of the root of the chord and the cord function
+def char_chord_processor(chord):
+    midi_note = 0
+    sign_parameter = 0
+    root = chord[0]
+    if len(chord) != 1: 
+        if chord[1] == "b":
+            sign_parameter = -1
+            function = chord_to_vibe(chord[2:])
+        elif chord[1] == "#":
+            sign_parameter = 1
+            function = chord_to_vibe(chord[2:])
+        else:
+            sign_parameter = 0
+            function = chord_to_vibe(chord[1:])
+    else:
+        sign_parameter = 0
+        function = "maj"
+
+    match root:
+        case "C":
+            midi_note = 60 + sign_parameter
+        case "D":
+            midi_note = 62 + sign_parameter
+        case "E":
+            midi_note = 64 + sign_parameter
+        case "F":
+            midi_note = 65 + sign_parameter
+        case "G":
+            midi_note = 55 + sign_parameter
+        case "A":
+            midi_note = 57 + sign_parameter
+        case "B":
+            midi_note = 59 + sign_parameter
+
+    return midi_note, function
+
+#   - takes file name and creates a list of characters out of it
+def read_harmony_file(file_name):
+    harmony_array = []
+    time_signature_flag = 1
+
+    with open(file_name, 'r') as file:
+        for line in file:
+            if time_signature_flag == 1:
+                numerator = int(line.strip()[:line.find("/")])
+                denominator = int(line.strip()[line.find("/")+1:line.find(":")])
+                tempo = int(line.strip()[line.find(":")+1:line.find("BPM")])
+                harmony_array.append([numerator,denominator,tempo]) 
+                time_signature_flag = 0
+            elif line.find("|") == -1:
+                pass
+            else:
+                for chord in line.split("|"):
+                    if chord.strip() == "":
+                        pass
+                    elif chord.strip() == "%":
+                        harmony_array.append(harmony_array[-1])   
+                    else:
+                        harmony_array.append(chord.strip())   
+    return harmony_array
+
+#   - parsed harmony files, keyed by file name and modification time
+_harmony_cache = {}
+
+#   - takes harmony file and extracts the root notes, the chord functions and the root diffrences
+#   - files that did not change since the last call are taken from the cache
+def harmony_processor(file_name):
+    harmony = load_harmony(file_name)
+    return list(harmony.midi_roots), list(harmony.vibes), harmony.time_signature, harmony.tempo
+
+#   - returns the parsed harmony of a harmony file
+#   - the harmony is cached until the file changes, so renders that reuse a harmony file only parse it once
+def load_harmony(file_name):
+    stamp = os.stat(file_name).st_mtime_ns
+    if file_name not in _harmony_cache or _harmony_cache[file_name][0] != stamp:
+        with lprof.span("parse_harmony", file=file_name):
+            _harmony_cache[file_name] = (stamp, Harmony(*parse_harmony(file_name)))
+    return _harmony_cache[file_name][1]
+
+#   - helper for harmony_processor
+#   - reads and parses the harmony file
+def parse_harmony(file_name):
+    read_harmony_file_out = read_harmony_file(file_name)
+    signature_file = read_harmony_file_out[0]
+    harmony_array = read_harmony_file_out[1:]
+
+    time_signature = (signature_file[0], signature_file[1])
+    tempo = signature_file[2]
+
+    midiRootArray = []
+    function_list = []
+
+    for chord in harmony_array:
+        midi_note, function = char_chord_processor(chord)
+        midiRootArray.append(midi_note)
+        function_list.append(function)
+        
+    return midiRootArray, function_list, time_signature, tempo  
+
+
+# Harmony:
+#   - parsed harmony with one root note and chord vibe per beat
+#   - beats in a row with the same chord vibe form a chord run, the runs are indexed once, so the chord runs of any
+#     beat range are found without scanning the beats before it
+class Harmony:
+
+    def __init__(self, midi_roots, vibes, time_signature=(4, 4), tempo=120):
+        self.midi_roots = tuple(midi_roots)
+        self.vibes = tuple(vibes)
+        self.time_signature = time_signature
+        self.tempo = tempo
+
+        # run_starts[r] is the first beat of chord run r (with the end of the harmony as last entry),
+        # beat_runs[b] is the chord run of beat b
+        self.run_starts = []
+        self.beat_runs = []
+        for beat in range(0, len(self.vibes)):
+            if beat == 0 or self.vibes[beat] != self.vibes[beat - 1]:
+                self.run_starts.append(beat)
+            self.beat_runs.append(len(self.run_starts) - 1)
+        self.run_starts.append(len(self.vibes))
+
+    def __len__(self):
+        return len(self.vibes)
+
+    #   - returns (chord vibe, length) of all chord runs from beat start to stop, the first and last run are cut at start and stop
+    def chord_runs(self, start, stop):
+        runs = []
+        if start >= stop:
+            return runs
+        for run in range(self.beat_runs[start], self.beat_runs[stop - 1] + 1):
+            run_start = max(self.run_starts[run], start)
+            run_stop = min(self.run_starts[run + 1], stop)
+            runs.append((self.vibes[run_start], run_stop - run_start))
+        return runs
+
+    #   - returns the harmony with other root notes and the same chord vibes (e.g. after transposeHarmony)
+    def with_roots(self, midi_roots):
+        harmony = copy.copy(self)
+        harmony.midi_roots = tuple(midi_roots)
+        return harmony
+
+
+###Lick Reader Functions###
+#   - read and split midi files into chord based licks
+def read_split_midi_files(midiFileName, harmonyFileName):
+    lick_list = []
+    new_lick_dict = {"pitch" : [], "time" : [], "note_duration" : [], "volume" : [], "chord" : [], "pitchWheelValue" : []}
+    import pretty_midi
+    midi_data = pretty_midi.PrettyMIDI(midiFileName)
+
+    harmony = load_harmony(harmonyFileName)
+    midiRootArray, function_list = harmony.midi_roots, list(harmony.vibes)
+
+    for note in midi_data.instruments[0].notes:
+        new_lick_dict["pitch"].append(note.pitch)
+        new_lick_dict["time"].append(note.start)
+        new_lick_dict["note_duration"].append(note.get_duration())
+        new_lick_dict["volume"].append(note.velocity)
+        new_lick_dict["pitchWheelValue"].append(0)
+
+    new_lick_dict["chord"] = function_list
+
+    #splitter part
+    split_mark_list = []
+    split_time_list = [0]
+    root_list = [midiRootArray[0]]
+    chord_cut = []
+    beat = 0
+    time_list = new_lick_dict["time"]
+    old_chord = new_lick_dict["chord"][0]
+    # the first note at or after a chord change can only move forward with the beat, so one pass over the notes is enough
+    note_index = 0
+    for chord in new_lick_dict["chord"]:
+        if chord != old_chord:
+            while note_index < len(time_list) and time_list[note_index]*2 < beat:
+                note_index += 1
+            if note_index < len(time_list):
+                split_mark_list.append(note_index)
+                split_time_list.append(beat/2)
+                root_list.append(midiRootArray[beat])
+                chord_cut.append(beat)
+            old_chord = chord
+        beat += 1
+    split_mark_list.append(len(time_list))
+    chord_cut.append(beat)
+
+    old_split_mark = 0
+    old_chort_cut = 0
+    for i in range(0,len(split_mark_list)):
+        splitLick = {}
+        splitLick["pitch"] = [x - root_list[i] for x in new_lick_dict["pitch"][old_split_mark:split_mark_list[i]]]
+        splitLick["time"] = [x - split_time_list[i] for x in new_lick_dict["time"][old_split_mark:split_mark_list[i]]]
+        splitLick["note_duration"] = new_lick_dict["note_duration"][old_split_mark:split_mark_list[i]]
+        splitLick["volume"] = new_lick_dict["volume"][old_split_mark:split_mark_list[i]]
+        splitLick["chord"] = new_lick_dict["chord"][old_chort_cut:chord_cut[i]]
+        splitLick["pitchWheelValue"] = new_lick_dict["pitchWheelValue"][old_split_mark:split_mark_list[i]]
+        splitLick["length"] = len(splitLick["chord"])
+        lick_list.append(splitLick)
+        old_split_mark = split_mark_list[i]
+        old_chort_cut = chord_cut[i]
+
+    return lick_list
+
+
+# Database Operations:
+# - functions for handeling the database
+#
+# - the database is stored in shards, one JSON Lines file per style tag and chord vibe:
+#       database/licks/<tag>/<chord vibe>.jsonl
+#   appending licks only touches the affected shards and a shredMode call only loads the shards of its style tag.
+#   the old single file database is migrated into shards the first time the database is used.
+#
+#   - path of the shard holding all licks of a style tag and chord vibe
+def shard_path(tag, chord_type):
+    return os.path.join(SHARD_DIRECTORY, tag, chord_type + SHARD_EXTENSION)
+
+#   - writes the licks of one shard to a temporary file and swaps it in, readers never see a half written shard
+def write_shard(tag, chord_type, licks):
+    os.makedirs(os.path.join(SHARD_DIRECTORY, tag), exist_ok=True)
+    temp_file_name = shard_path(tag, chord_type) + ".tmp"
+    with open(temp_file_name, "w") as file:
+        for lick in licks:
+            file.write(json.dumps(lick) + "\n")
+    os.replace(temp_file_name, shard_path(tag, chord_type))
+
+#   - helper for append_shard
+#   - cuts off a last line without line break, left by an append that was cut off, so new licks start on a line of their own
+def repair_shard_tail(file):
+    end = file.seek(0, os.SEEK_END)
+    position = end
+    while position > 0:
+        block_start = max(0, position - 4096)
+        file.seek(block_start)
+        line_break = file.read(position - block_start).rfind(b"\n")
+        if line_break != -1:
+            position = block_start + line_break + 1
+            break
+        position = block_start
+    if position != end:
+        file.truncate(position)
+
+#   - appends licks to the end of a shard, only the new licks are written
+#   - the licks are written at once, an append that is cut off only leaves a torn last line, which read_shard skips
+#     and the next append cuts off
+def append_shard(tag, chord_type, licks):
+    os.makedirs(os.path.join(SHARD_DIRECTORY, tag), exist_ok=True)
+    with open(shard_path(tag, chord_type), "a+b") as file:
+        repair_shard_tail(file)
+        file.write("".join(json.dumps(lick) + "\n" for lick in licks).encode("utf-8"))
+
+#   - reads all licks of a shard
+#   - a last line without line break that is no valid JSON was cut off while appending and is skipped
+def read_shard(tag, chord_type):
+    with lprof.span("read_shard", "database", tag=tag, chord=chord_type), open(shard_path(tag, chord_type), "r") as file:
+        lprof.count("database_bytes_read", os.fstat(file.fileno()).st_size)
+        lines = file.read().split("\n")
+    licks = [json.loads(line) for line in lines[:-1] if line.strip()]
+    if lines[-1].strip():
+        try:
+            licks.append(json.loads(lines[-1]))
+        except ValueError:
+            print(f"Warning: skipped a cut off lick at the end of {shard_path(tag, chord_type)}")
+    return licks
+
+#   - writes a whole database dictonary into shards
+def write_database(lick_database):
+    for tag in lick_database:
+        for chord_type in lick_database[tag]:
+            write_shard(tag, chord_type, lick_database[tag][chord_type])
+
+#   - one shot migration of a single file database into shards
+def migrate_database(file_name=DATABASE):
+    with open(file_name, "r") as file:
+        lick_database = json.load(file)
+    write_database(lick_database)
+
+#   - helper for all database operations
+#   - migrates the single file database if no shards exist yet
+def check_shards():
+    if not os.path.isdir(SHARD_DIRECTORY) and os.path.exists(DATABASE):
+        migrate_database(DATABASE)
+
+#   - sets database to backup state
+def clear_database():
+    if os.path.isdir(SHARD_DIRECTORY):
+        shutil.rmtree(SHARD_DIRECTORY)
+    migrate_database(BACKUP_DATABASE)
+
+#   - returns all style tags of the database
+def list_tags():
+    check_shards()
+    if not os.path.isdir(SHARD_DIRECTORY):
+        return []
+    return sorted(tag for tag in os.listdir(SHARD_DIRECTORY) if os.path.isdir(os.path.join(SHARD_DIRECTORY, tag)))
+
+#   - returns all chord vibes stored for a style tag
+def list_chord_types(tag):
+    return sorted(file_name[:-len(SHARD_EXTENSION)] for file_name in os.listdir(os.path.join(SHARD_DIRECTORY, tag))
+                  if file_name.endswith(SHARD_EXTENSION))
+
+#   - reads all shards of one style tag
+def load_tag(tag):
+    return {chord_type : read_shard(tag, chord_type) for chord_type in list_chord_types(tag)}
+
+#   - reads outdatabase and returns it in a dictonary
+def load_database():
+    return {tag : load_tag(tag) for tag in list_tags()}
+
+#   - process wide lick index per style tag, rebuilt only when one of the shards of the tag changes on disk
+_lick_index = {}
+
+#   - helper for get_tag_index
+#   - mtime and size of all shards of a style tag, used to detect changes
+def tag_stamp(tag):
+    stamp = []
+    for chord_type in list_chord_types(tag):
+        stat = os.stat(shard_path(tag, chord_type))
+        stamp.append((chord_type, stat.st_mtime_ns, stat.st_size))
+    return tuple(stamp)
+
+#   - buckets the licks of one style tag by (chord vibe, length) as note buffers and counts the lick lengths per chord vibe
+#   - every bucket is also indexed by the first pitch of its licks, sorted for bisect queries (licks without notes are left out)
+#   - only licks with notes are counted, so a solo is never split into a length that has no lick to play
+def build_lick_index(tag_database):
+    licks = {}
+    lengths = {}
+    for chord_type in tag_database:
+        tag_lengths = lengths.setdefault(chord_type, {})
+        for lick in tag_database[chord_type]:
+            note_buffer = NoteBuffer.from_dict(lick)
+            licks.setdefault((chord_type, lick["length"]), []).append(note_buffer)
+            if len(note_buffer) != 0:
+                tag_lengths[lick["length"]] = tag_lengths.get(lick["length"], 0) + 1
+
+    pitch_index = {}
+    for bucket in licks:
+        sorted_licks = sorted((lick for lick in licks[bucket] if len(lick) != 0), key=lambda lick: lick["pitch"][0])
+        pitch_index[bucket] = ([lick["pitch"][0] for lick in sorted_licks], sorted_licks)
+    return {"licks" : licks, "lengths" : lengths, "pitch_index" : pitch_index}
+
+#   - loads the shards of a style tag lazily once and returns the cached index
+def get_tag_index(tag):
+    stamp = tag_stamp(tag)
+    if tag not in _lick_index or _lick_index[tag]["stamp"] != stamp:
+        with lprof.span("load_tag_index", "database", tag=tag):
+            _lick_index[tag] = build_lick_index(load_tag(tag))
+        _lick_index[tag]["stamp"] = stamp
+    return _lick_index[tag]
+
+#   - returns all licks of a style tag, chord vibe and length
+def get_licks(style_tag, chord_type, length):
+    return get_tag_index(style_tag)["licks"].get((chord_type, length), [])
+
+#   - returns the sorted first pitches and the matching licks of a style tag, chord vibe and length
+def get_pitch_index(style_tag, chord_type, length):
+    return get_tag_index(style_tag)["pitch_index"].get((chord_type, length), ([], []))
+
+#   - returns the lick length histogram of a style tag and chord vibe
+def get_lick_lengths(style_tag, chord_type):
+    return get_tag_index(style_tag)["lengths"].get(chord_type, {})
+
+#   - checks if a style tag exists in the database
+def has_style_tag(style_tag):
+    check_shards()
+    return os.path.isdir(os.path.join(SHARD_DIRECTORY, style_tag))
+
+#   - displays statistic of database
+def show_database():
+    for tag in list_tags():
+        print(f"Tag: {tag}:")
+        for chord_type in list_chord_types(tag):
+            with open(shard_path(tag, chord_type), "rb") as file:
+                lick_count = sum(1 for line in file if line.strip())
+            print(f"\t{chord_type}:\t{lick_count}")  
+
+#   - updates several new licks to the database
+def update_database(new_licks, tag):
+    if not has_style_tag(tag):
+        for chord_type in ("min", "maj", "dom"):
+            write_shard(tag, chord_type, [{"pitch": [0], "time": [0],"note_duration": [0.01],"volume": [0],"chord": [chord_type],"pitchWheelValue": [0],"length": 1}])
+
+    shard_licks = {}
+    for lick in new_licks:
+        shard_licks.setdefault(lick["chord"][0], []).append(lick)
+    for chord_type in shard_licks:
+        append_shard(tag, chord_type, shard_licks[chord_type])
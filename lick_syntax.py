@@ -0,0 +1,705 @@
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file
+# in the root directory of this source tree.
+
+import ast
+import gc
+import re
+
+# melody functions of the .lc language and their parameters, in the order they can be passed without names
+SCALE_FUNCTIONS = {"ionian" : "ionian", "dorian" : "dorian", "phrygian" : "phrygian", "lydian" : "lydian",
+                   "mixolydian" : "mixolydian", "aeolian" : "aeolian", "locrian" : "locrian", "major" : "major",
+                   "harmonicMinor" : "harmonic_minor", "melodicMinor" : "melodic_minor", "cromatic" : "cromatic",
+                   "wholeHalfDiminished" : "whole_half_diminished", "halfWholeDiminished" : "half_whole_diminished",
+                   "wholeTone" : "whole_tone", "minorBlues" : "minor_blues", "majorBlues" : "major_blues", "altered" : "altered"}
+# every scale function has a random function, e.g. dorian and randomDorian
+RANDOM_FUNCTIONS = {"random" + name[0].upper() + name[1:] : scale for name, scale in SCALE_FUNCTIONS.items()}
+SCALE_PARAMETERS = ("rhythm", "duration", "notes", "volume")
+RANDOM_PARAMETERS = ("rhythm", "duration", "volume", "jump_prop", "up_down_prop", "seed")
+SPECIAL_PARAMETERS = {"shredMode" : ("style", "duration", "seed"),
+                      "pause" : ("duration",),
+                      "transposeHarmony" : ("transpose_by",),
+                      "enablePracticeMode" : (),
+                      "voice" : ("name", "program", "channel")}
+# parameters that can be left out of a call
+OPTIONAL_PARAMETERS = {"seed", "program", "channel"}
+
+#   - returns the parameters of a melody function, None for any other name
+def melody_parameters(name):
+    if name in SCALE_FUNCTIONS:
+        return SCALE_PARAMETERS
+    if name in RANDOM_FUNCTIONS:
+        return RANDOM_PARAMETERS
+    return SPECIAL_PARAMETERS.get(name)
+
+
+# Tokenizer:
+#   - splits a whole .lc file into tokens in one pass over the text
+#   - newlines inside () and [] are ignored, so calls and lists can span several lines
+#   - degrees with an octave (e.g. 3va, 2vb) are tokens of their own, they are only valid in notes lists
+#
+class LickSyntaxError(Exception):
+
+    def __init__(self, message, line=None, column=None):
+        self.line = line
+        self.column = column
+        if line is not None:
+            message = f"line {line}, column {column}: {message}"
+        super().__init__(message)
+
+# every token is a tuple (kind, value, line, column), the kinds are newline, string, degree, number, numbers, name, op and end
+# whitespace in front of a token is part of its match, so it never becomes a token of its own
+# a list of plain numbers and degrees on one line (e.g. [100, 90, 90] or [5, -3, 1va]) is one numbers token, volume and notes lists
+# make up most of a melody file and are never split into their items and commas
+TOKEN_PATTERN = re.compile(r"""[ \t\r\f]*(?:
+     (?P<newline>\n)
+    |(?P<continuation>\\\n)
+    |(?P<comment>\#[^\n]*)
+    |(?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+    |(?P<numbers>\[[ \t]*[-+]?\d+(?:\.\d+)?(?:va|vb)?(?:[ \t]*,[ \t]*[-+]?\d+(?:\.\d+)?(?:va|vb)?)*[ \t]*\])
+    |(?P<degree>\d+(?:\.\d+)?(?:va|vb)(?!\w))
+    |(?P<number>(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?)
+    |(?P<name>[A-Za-z_]\w*)
+    |(?P<op>\*\*=?|//=?|==|!=|<=|>=|[-+*/%]=|[-+*/%<>=()\[\]{},;:.])
+    |(?P<error>.)
+    |$)""", re.VERBOSE)
+
+def tokenize(source):
+    tokens = []
+    append = tokens.append
+    line = 1
+    line_start = 0
+    depth = 0
+    for match in TOKEN_PATTERN.finditer(source):
+        kind = match.lastgroup
+        if kind is None:
+            # whitespace at the end of the file
+            continue
+        value = match.group(kind)
+        if kind == "newline" or kind == "continuation":
+            if depth == 0 and kind == "newline":
+                append(("newline", "\n", line, match.end() - line_start))
+            line += 1
+            line_start = match.end()
+        elif kind == "op":
+            if value == "(" or value == "[":
+                depth += 1
+            elif (value == ")" or value == "]") and depth > 0:
+                depth -= 1
+            append(("op", value, line, match.end() - len(value) - line_start + 1))
+        elif kind == "comment":
+            pass
+        elif kind == "error":
+            raise LickSyntaxError(f"unexpected character {value!r}", line, match.end() - line_start)
+        else:
+            append((kind, value, line, match.end() - len(value) - line_start + 1))
+    # the parser looks up to two tokens ahead, so the end token is repeated
+    tokens.extend([("end", "", line, 1)] * 3)
+    return tokens
+
+
+# Syntax Tree:
+#   - statements of a .lc program, expressions are python ast expressions
+#   - melody function calls keep their arguments by parameter name, notes lists are degree lists
+#
+class Program:
+
+    def __init__(self, body):
+        self.body = body
+
+class MelodyCall:
+
+    def __init__(self, name, arguments, line):
+        self.name = name
+        self.arguments = arguments
+        self.line = line
+
+#   - degrees of a notes list: the text of every literal degree (e.g. "3va", "-7", "1.5") or an expression
+class DegreeList:
+
+    def __init__(self, degrees, line):
+        self.degrees = degrees
+        self.line = line
+
+    def is_literal(self):
+        return all(isinstance(degree, str) for degree in self.degrees)
+
+#   - all statements after enablePracticeMode in the same block, played once in every key
+class PracticeMode:
+
+    def __init__(self, body, line):
+        self.body = body
+        self.line = line
+
+#   - branches are (test, body) pairs of the if and all elif parts, orelse is the body of else
+class If:
+
+    def __init__(self, branches, orelse, line):
+        self.branches = branches
+        self.orelse = orelse
+        self.line = line
+
+class While:
+
+    def __init__(self, test, body, line):
+        self.test = test
+        self.body = body
+        self.line = line
+
+class For:
+
+    def __init__(self, target, iter, body, line):
+        self.target = target
+        self.iter = iter
+        self.body = body
+        self.line = line
+
+class Assign:
+
+    def __init__(self, targets, value, line):
+        self.targets = targets
+        self.value = value
+        self.line = line
+
+class AugAssign:
+
+    def __init__(self, target, op, value, line):
+        self.target = target
+        self.op = op
+        self.value = value
+        self.line = line
+
+class ExprStatement:
+
+    def __init__(self, value, line):
+        self.value = value
+        self.line = line
+
+#   - break, continue or pass
+class Jump:
+
+    def __init__(self, kind, line):
+        self.kind = kind
+        self.line = line
+
+
+# Parser:
+#   - recursive descent parser from tokens to the syntax tree, every token is looked at once
+#   - blocks are written in braces, conditions may be written in parentheses:
+#       while (count < 4) { dorian(...); count += 1 }
+#   - currentChord is the chord vibe of the current beat
+#   - the parser keeps the kind, value, line and column of the current token, string tokens keep their quotes,
+#     so comparing the value alone tells operators and names apart from all other tokens
+#
+BINARY_OPERATORS = {"+" : ast.Add, "-" : ast.Sub, "*" : ast.Mult, "/" : ast.Div, "//" : ast.FloorDiv, "%" : ast.Mod, "**" : ast.Pow}
+AUGMENTED_OPERATORS = {op + "=" : operator for op, operator in BINARY_OPERATORS.items()}
+COMPARISON_OPERATORS = {"==" : ast.Eq, "!=" : ast.NotEq, "<" : ast.Lt, "<=" : ast.LtE, ">" : ast.Gt, ">=" : ast.GtE, "in" : ast.In, "is" : ast.Is}
+KEYWORD_CONSTANTS = {"True" : True, "False" : False, "None" : None}
+KEYWORDS = {"if", "elif", "else", "while", "for", "in", "not", "and", "or", "is", "break", "continue", "pass"}
+# values of the tokens that can follow a complete expression, a single number, string or name in front of them needs no further parsing
+EXPRESSION_ENDS = {",", ")", "]", "}", "{", ";", "=", ":", "\n", ""}
+STATEMENT_ENDS = {";", "}", "\n", ""}
+
+#   - helper
+#   - returns the items of a numbers token, e.g. "[1, -3va]" -> ["1", "-3va"]
+def number_items(value):
+    return [item.strip() for item in value[1:-1].split(",")]
+
+#   - helper
+#   - value of a string token, only strings with escapes need python's literal parser (e.g. rhythms never have one)
+def string_value(value):
+    if "\\" in value:
+        return ast.literal_eval(value)
+    return value[1:-1]
+
+#   - helper
+#   - value of a number token
+def number_value(value):
+    return float(value) if "." in value or "e" in value or "E" in value else int(value)
+
+#   - helper
+#   - sets the source position of an ast node
+def located(node, line, column):
+    node.lineno = node.end_lineno = line
+    node.col_offset = node.end_col_offset = column - 1
+    return node
+
+class Parser:
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        # the end token is repeated, the parser stops at its first copy
+        self.last = len(tokens) - 3
+        # number of loops around the current statement, break and continue are only allowed inside of one
+        self.loops = 0
+        self.position = -1
+        self.advance()
+
+    #   - moves to the next token and returns the value of the current one
+    def advance(self):
+        value = self.value if self.position >= 0 else None
+        if self.position < self.last:
+            self.position += 1
+        self.kind, self.value, self.line, self.column = self.tokens[self.position]
+        return value
+
+    #   - value of a token after the current one
+    def peek(self, offset=1):
+        return self.tokens[self.position + offset][1]
+
+    def accept(self, value):
+        if self.value == value:
+            self.advance()
+            return True
+        return False
+
+    def expect(self, value):
+        if self.value != value:
+            self.error(f"expected '{value}'")
+        self.advance()
+
+    #   - raises a syntax error at the current or the given position, by default the message names the current token
+    def error(self, message, line=None, column=None):
+        if line is None:
+            line = self.line
+            column = self.column
+            message += ", found " + ("the end of the file" if self.kind == "end" else "a new line" if self.kind == "newline" else f"'{self.value}'")
+        raise LickSyntaxError(message, line, column)
+
+    def skip_separators(self):
+        while self.value == "\n" or self.value == ";":
+            self.advance()
+
+    def skip_newlines(self):
+        while self.value == "\n":
+            self.advance()
+
+    #   - program := statements end
+    def program(self):
+        body = self.statements()
+        if self.kind != "end":
+            self.error("unexpected '}'")
+        return Program(body)
+
+    #   - statements of a block, up to the closing brace or the end of the file
+    def statements(self):
+        body = []
+        self.skip_separators()
+        while self.kind != "end" and self.value != "}":
+            statement = self.statement()
+            if isinstance(statement, MelodyCall) and statement.name == "enablePracticeMode":
+                self.end_of_statement()
+                # practice mode repeats the rest of the block like a loop, once per key
+                self.loops += 1
+                body.append(PracticeMode(self.statements(), statement.line))
+                self.loops -= 1
+                break
+            body.append(statement)
+            if not isinstance(statement, (If, While, For)):
+                self.end_of_statement()
+            self.skip_separators()
+        return body
+
+    def end_of_statement(self):
+        if self.value not in STATEMENT_ENDS:
+            self.error("expected the end of the statement")
+
+    #   - block := "{" statements "}"
+    def block(self):
+        self.skip_newlines()
+        self.expect("{")
+        body = self.statements()
+        self.expect("}")
+        return body
+
+    #   - body of a while or for loop
+    def loop_block(self):
+        self.loops += 1
+        body = self.block()
+        self.loops -= 1
+        return body
+
+    #   - condition of if, elif and while, an optional colon is accepted like in python
+    def condition(self):
+        test = self.expression()
+        self.accept(":")
+        return test
+
+    def statement(self):
+        line, column = self.line, self.column
+        if self.kind == "name":
+            value = self.value
+            if value == "if":
+                return self.if_statement()
+            if value == "while":
+                self.advance()
+                test = self.condition()
+                return While(test, self.loop_block(), line)
+            if value == "for":
+                return self.for_statement()
+            if value in ("break", "continue", "pass"):
+                if value != "pass" and self.loops == 0:
+                    self.error(f"'{value}' outside of a loop", line, column)
+                self.advance()
+                return Jump(value, line)
+            if value in ("elif", "else"):
+                self.error(f"'{value}' without 'if'", line, column)
+            if self.peek() == "(" and melody_parameters(value) is not None:
+                return self.melody_call()
+        if self.value == "{":
+            self.error("blocks need an if, elif, else, while or for", line, column)
+
+        value = self.expression_list()
+        if self.value == "=":
+            targets = [self.store(value)]
+            while self.accept("="):
+                value = self.expression_list()
+                if self.value == "=":
+                    targets.append(self.store(value))
+            return Assign(targets, value, line)
+        if self.value in AUGMENTED_OPERATORS and self.kind == "op":
+            op = AUGMENTED_OPERATORS[self.advance()]()
+            if not isinstance(value, (ast.Name, ast.Subscript, ast.Attribute)):
+                self.error("this can not be assigned to", line, column)
+            return AugAssign(self.store(value), op, self.expression_list(), line)
+        return ExprStatement(value, line)
+
+    #   - if := "if" condition block {"elif" condition block} ["else" block]
+    def if_statement(self):
+        line = self.line
+        self.advance()
+        branches = [(self.condition(), self.block())]
+        orelse = None
+        while True:
+            # elif and else may follow the closing brace on the next line
+            position = self.position
+            self.skip_newlines()
+            if self.accept("elif"):
+                branches.append((self.condition(), self.block()))
+            elif self.accept("else"):
+                self.accept(":")
+                orelse = self.block()
+                break
+            else:
+                self.position = position - 1
+                self.advance()
+                break
+        return If(branches, orelse, line)
+
+    #   - for := "for" target "in" expression block, optionally in parentheses
+    def for_statement(self):
+        line, column = self.line, self.column
+        self.advance()
+        header = self.expression_list()
+        self.accept(":")
+        # the header is parsed as one expression, "i in range(3)" is a comparison that is split again
+        last = header.elts[-1] if isinstance(header, ast.Tuple) and header.elts else header
+        if not (isinstance(last, ast.Compare) and len(last.ops) == 1 and isinstance(last.ops[0], ast.In)):
+            self.error("expected 'for <name> in <values>'", line, column)
+        if isinstance(header, ast.Tuple):
+            target = located(ast.Tuple(elts=header.elts[:-1] + [last.left], ctx=ast.Store()), header.lineno, header.col_offset + 1)
+        else:
+            target = last.left
+        return For(self.store(target), last.comparators[0], self.loop_block(), line)
+
+    #   - helper
+    #   - turns an expression into an assignment target
+    def store(self, node):
+        if isinstance(node, ast.Name):
+            if node.id in KEYWORDS:
+                self.error(f"'{node.id}' can not be assigned to", node.lineno, node.col_offset + 1)
+        elif isinstance(node, (ast.Tuple, ast.List)):
+            for element in node.elts:
+                self.store(element)
+        elif not isinstance(node, (ast.Subscript, ast.Attribute)):
+            self.error("this can not be assigned to", node.lineno, node.col_offset + 1)
+        node.ctx = ast.Store()
+        return node
+
+    #   - melody_call := name "(" [argument {"," argument}] ")"
+    #   - positional arguments are named by the parameters of the function
+    def melody_call(self):
+        line, column = self.line, self.column
+        function = self.advance()
+        parameters = melody_parameters(function)
+        arguments = {}
+        named = False
+        self.expect("(")
+        while self.value != ")":
+            argument_line, argument_column = self.line, self.column
+            if self.kind == "name" and self.peek() == "=":
+                name = self.advance()
+                self.advance()
+                named = True
+                if name not in parameters:
+                    self.error(f"{function}() has no parameter '{name}'", argument_line, argument_column)
+            else:
+                if named:
+                    self.error("positional argument after a named argument", argument_line, argument_column)
+                if len(arguments) >= len(parameters):
+                    self.error(f"{function}() takes {len(parameters)} arguments", argument_line, argument_column)
+                name = parameters[len(arguments)]
+            if name in arguments:
+                self.error(f"{function}() got the argument '{name}' twice", argument_line, argument_column)
+            if name == "notes" and (self.value == "[" or self.kind == "numbers"):
+                arguments[name] = self.degree_list()
+            elif self.kind == "numbers" and self.peek() in (",", ")"):
+                # constant lists (e.g. volume lists) are passed as tuple, they are never changed by the melody functions
+                arguments[name] = located(ast.Constant(value=tuple(self.numbers(self.advance(), argument_line, argument_column))), argument_line, argument_column)
+            else:
+                arguments[name] = self.expression()
+            if not self.accept(","):
+                break
+        self.expect(")")
+        for name in parameters:
+            if name not in arguments and name not in OPTIONAL_PARAMETERS:
+                self.error(f"{function}() is missing the argument '{name}'", line, column)
+        return MelodyCall(function, arguments, line)
+
+    #   - degree_list := "[" [degree {"," degree}] "]"
+    #   - a degree is a number with an optional sign and octave (e.g. -7, 1.5, 3va) or an expression (e.g. a variable)
+    def degree_list(self):
+        line = self.line
+        if self.kind == "numbers" and self.peek() in (",", ")"):
+            return DegreeList(number_items(self.advance()), line)
+        self.expect("[")
+        degrees = []
+        while self.value != "]":
+            sign = self.value if self.value == "-" or self.value == "+" else ""
+            kind = self.tokens[self.position + 1][0] if sign else self.kind
+            if kind in ("number", "degree") and self.peek(2 if sign else 1) in (",", "]"):
+                if sign:
+                    self.advance()
+                degrees.append(sign + self.advance())
+            else:
+                degrees.append(self.expression())
+            if not self.accept(","):
+                break
+        self.expect("]")
+        return DegreeList(degrees, line)
+
+    #   - helper
+    #   - values of a numbers token outside of a notes list, where degrees with an octave are not allowed
+    def numbers(self, value, line, column):
+        items = number_items(value)
+        for item in items:
+            if item.endswith("va") or item.endswith("vb"):
+                self.error(f"the degree {item} can only be used in a notes list", line, column)
+        return [number_value(item) for item in items]
+
+    # Expressions:
+    #   - python expressions from lowest to highest precedence
+    #
+    #   - expression_list := expression {"," expression}, more than one expression is a tuple
+    def expression_list(self):
+        line, column = self.line, self.column
+        value = self.expression()
+        if self.value != ",":
+            return value
+        elements = [value]
+        while self.accept(","):
+            if self.value in STATEMENT_ENDS or self.value == "=" or self.value == ")":
+                break
+            elements.append(self.expression())
+        return located(ast.Tuple(elts=elements, ctx=ast.Load()), line, column)
+
+    def expression(self):
+        # a single number, string or name is by far the most common expression, e.g. every entry of a volume list
+        if self.peek() in EXPRESSION_ENDS and self.kind != "op":
+            return self.atom()
+        line, column = self.line, self.column
+        value = self.and_expression()
+        if self.value == "or":
+            values = [value]
+            while self.accept("or"):
+                values.append(self.and_expression())
+            value = located(ast.BoolOp(op=ast.Or(), values=values), line, column)
+        return value
+
+    def and_expression(self):
+        line, column = self.line, self.column
+        value = self.not_expression()
+        if self.value == "and":
+            values = [value]
+            while self.accept("and"):
+                values.append(self.not_expression())
+            value = located(ast.BoolOp(op=ast.And(), values=values), line, column)
+        return value
+
+    def not_expression(self):
+        line, column = self.line, self.column
+        if self.accept("not"):
+            return located(ast.UnaryOp(op=ast.Not(), operand=self.not_expression()), line, column)
+        return self.comparison()
+
+    def comparison(self):
+        line, column = self.line, self.column
+        left = self.sum()
+        ops = []
+        comparators = []
+        while True:
+            if self.value == "not" and self.peek() == "in":
+                self.advance()
+                self.advance()
+                ops.append(ast.NotIn())
+            elif self.value == "is" and self.peek() == "not":
+                self.advance()
+                self.advance()
+                ops.append(ast.IsNot())
+            elif self.value in COMPARISON_OPERATORS:
+                ops.append(COMPARISON_OPERATORS[self.advance()]())
+            else:
+                break
+            comparators.append(self.sum())
+        if ops:
+            return located(ast.Compare(left=left, ops=ops, comparators=comparators), line, column)
+        return left
+
+    def sum(self):
+        line, column = self.line, self.column
+        value = self.term()
+        while self.value == "+" or self.value == "-":
+            op = BINARY_OPERATORS[self.advance()]()
+            value = located(ast.BinOp(left=value, op=op, right=self.term()), line, column)
+        return value
+
+    def term(self):
+        line, column = self.line, self.column
+        value = self.factor()
+        while self.value in ("*", "/", "//", "%"):
+            op = BINARY_OPERATORS[self.advance()]()
+            value = located(ast.BinOp(left=value, op=op, right=self.factor()), line, column)
+        return value
+
+    def factor(self):
+        line, column = self.line, self.column
+        if self.value == "-" or self.value == "+":
+            op = ast.USub() if self.advance() == "-" else ast.UAdd()
+            return located(ast.UnaryOp(op=op, operand=self.factor()), line, column)
+        return self.power()
+
+    def power(self):
+        line, column = self.line, self.column
+        value = self.postfix()
+        if self.accept("**"):
+            value = located(ast.BinOp(left=value, op=ast.Pow(), right=self.factor()), line, column)
+        return value
+
+    #   - calls, subscripts and attributes
+    def postfix(self):
+        line, column = self.line, self.column
+        value = self.atom()
+        while True:
+            if self.value == "(":
+                value = self.call(value, line, column)
+            elif self.value == "[":
+                self.advance()
+                index = self.subscript()
+                self.expect("]")
+                value = located(ast.Subscript(value=value, slice=index, ctx=ast.Load()), line, column)
+            elif self.kind == "numbers":
+                # a[1] is tokenized like a list of numbers
+                index_line, index_column = self.line, self.column
+                numbers = [located(ast.Constant(value=number), index_line, index_column) for number in self.numbers(self.advance(), index_line, index_column)]
+                index = numbers[0] if len(numbers) == 1 else located(ast.Tuple(elts=numbers, ctx=ast.Load()), line, column)
+                value = located(ast.Subscript(value=value, slice=index, ctx=ast.Load()), line, column)
+            elif self.value == ".":
+                self.advance()
+                if self.kind != "name":
+                    self.error("expected a name after '.'")
+                value = located(ast.Attribute(value=value, attr=self.advance(), ctx=ast.Load()), line, column)
+            else:
+                return value
+
+    def call(self, function, line, column):
+        self.expect("(")
+        args = []
+        keywords = []
+        while self.value != ")":
+            if self.kind == "name" and self.peek() == "=":
+                keyword_line, keyword_column = self.line, self.column
+                name = self.advance()
+                self.advance()
+                keywords.append(located(ast.keyword(arg=name, value=self.expression()), keyword_line, keyword_column))
+            elif keywords:
+                self.error("positional argument after a named argument")
+            else:
+                args.append(self.expression())
+            if not self.accept(","):
+                break
+        self.expect(")")
+        return located(ast.Call(func=function, args=args, keywords=keywords), line, column)
+
+    #   - index or slice of a subscript
+    def subscript(self):
+        line, column = self.line, self.column
+        bounds = [None, None, None]
+        for i in range(0, 3):
+            if self.value != ":" and self.value != "]":
+                bounds[i] = self.expression()
+            if i == 0 and self.value != ":":
+                return bounds[0]
+            if i == 2 or not self.accept(":"):
+                break
+        return located(ast.Slice(lower=bounds[0], upper=bounds[1], step=bounds[2]), line, column)
+
+    def atom(self):
+        kind, line, column = self.kind, self.line, self.column
+        value = self.advance()
+        if kind == "number":
+            return located(ast.Constant(value=number_value(value)), line, column)
+        if kind == "numbers":
+            elements = [located(ast.Constant(value=number), line, column) for number in self.numbers(value, line, column)]
+            return located(ast.List(elts=elements, ctx=ast.Load()), line, column)
+        if kind == "string":
+            string = string_value(value)
+            while self.kind == "string":
+                # adjacent strings are joined like in python
+                string += string_value(self.advance())
+            return located(ast.Constant(value=string), line, column)
+        if kind == "name":
+            if value in KEYWORD_CONSTANTS:
+                return located(ast.Constant(value=KEYWORD_CONSTANTS[value]), line, column)
+            if value == "currentChord":
+                chord = ast.Subscript(value=located(ast.Name(id="chord_list", ctx=ast.Load()), line, column),
+                                      slice=located(ast.Name(id="beat", ctx=ast.Load()), line, column), ctx=ast.Load())
+                return located(chord, line, column)
+            if value in KEYWORDS:
+                self.error("expected an expression", line, column)
+            if self.value == "(" and melody_parameters(value) is not None:
+                self.error(f"{value}() can only be used as a statement", line, column)
+            return located(ast.Name(id=value, ctx=ast.Load()), line, column)
+        if kind == "degree":
+            self.error(f"the degree {value} can only be used in a notes list", line, column)
+        if value == "(":
+            if self.accept(")"):
+                return located(ast.Tuple(elts=[], ctx=ast.Load()), line, column)
+            value = self.expression_list()
+            self.expect(")")
+            return value
+        if value == "[":
+            elements = []
+            while self.value != "]":
+                elements.append(self.expression())
+                if not self.accept(","):
+                    break
+            self.expect("]")
+            return located(ast.List(elts=elements, ctx=ast.Load()), line, column)
+        if value == "{":
+            self.error("dictonaries are not supported, '{' opens a block", line, column)
+        self.error("expected an expression", line, column)
+
+#   - parses the source of a .lc file into its syntax tree
+#   - the syntax tree has no reference cycles, so the garbage collector is paused while it is built,
+#     otherwise it would walk all the new nodes again and again on long melodies
+def parse(source):
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        return Parser(tokenize(source)).program()
+    finally:
+        if collecting:
+            gc.enable()
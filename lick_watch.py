@@ -0,0 +1,67 @@
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file
+# in the root directory of this source tree.
+
+import os
+import time
+import lick_reader as lr
+import lick_parser as lp
+
+POLL_INTERVAL = 0.05
+
+
+# Watch Functions:
+#   - keeps one process warm and renders a melody again every time the melody or harmony file is saved
+#   - the modules, the lick database and the harmony stay loaded between renders, so a render only pays for the changed melody
+#
+#   - helper for watch_lick
+#   - modification time and size of a file, None while it does not exist (e.g. during an editor's atomic save)
+def file_stamp(file_name):
+    try:
+        stat = os.stat(file_name)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+#   - helper for watch_lick
+#   - imports the render modules and loads the lick database and the harmony before the first render
+def warm_up(harmony_path):
+    import lick_interpreter
+    for tag in lr.list_tags():
+        lr.get_tag_index(tag)
+    try:
+        lr.load_harmony(harmony_path)
+    except OSError:
+        pass
+
+#   - renders the melody once and prints the stage timings
+def render_once(melody_path, harmony_path, output_path_midi, seed=None, incremental=True):
+    stats = {}
+    try:
+        lp.run_lick(melody_path, harmony_path, output_path_midi, seed, incremental, stats)
+    except SystemExit:
+        pass
+    except Exception as e:
+        print(f"Render failed! {type(e).__name__}: {e}")
+    if stats:
+        print(f"[{time.strftime('%H:%M:%S')}] {output_path_midi}: parse {stats['parse']*1000:.1f}ms, execute {stats['execute']*1000:.1f}ms, "
+              f"write {stats['write']*1000:.1f}ms, total {stats['total']*1000:.1f}ms")
+    return stats
+
+#   - watches a melody and harmony file by polling and renders the midi file after every change, until Ctrl+C
+def watch_lick(melody_path, harmony_path, output_path_midi, seed=None, incremental=True, poll_interval=POLL_INTERVAL):
+    warm_up(harmony_path)
+    print(f"Watching {melody_path} and {harmony_path}, press Ctrl+C to stop.")
+    stamps = None
+    try:
+        while True:
+            new_stamps = (file_stamp(melody_path), file_stamp(harmony_path))
+            if new_stamps != stamps and None not in new_stamps:
+                stamps = new_stamps
+                render_once(melody_path, harmony_path, output_path_midi, seed, incremental)
+            time.sleep(poll_interval)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
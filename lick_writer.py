@@ -1,526 +1,703 @@
-# Copyright (c) 2025, Michael Žutić, Oliver Köll
-# All rights reserved.
-#
-# This source code is licensed under the
-# MIT License found in the LICENSE.txt file 
-# in the root directory of this source tree.
-
-import pretty_midi
-import random
-from itertools import combinations_with_replacement
-import lick_reader as lr
-import re
-
-
-scales = {"ionian":         {   1:0,    2:2,    3:4,    4:5,    5:7,    6:9,    7:11    },
-          "dorian":         {   1:0,    2:2,    3:3,    4:5,    5:7,    6:9,    7:10    },
-          "phrygian":       {   1:0,    2:1,    3:3,    4:5,    5:7,    6:8,    7:10    },
-          "lydian":         {   1:0,    2:2,    3:4,    4:6,    5:7,    6:9,    7:11    },
-          "mixolydian":     {   1:0,    2:2,    3:4,    4:5,    5:7,    6:9,    7:10    },
-          "aeolian":        {   1:0,    2:2,    3:3,    4:5,    5:7,    6:8,    7:10    },
-          "locrian":        {   1:0,    2:1,    3:3,    4:5,    5:6,    6:8,    7:10    },
-
-          "major":          {   1:0,    2:2,    3:4,    4:5,    5:7,    6:9,    7:11    },
-          "harmonic_minor": {   1:0,    2:2,    3:3,    4:5,    5:7,    6:8,    7:11    },
-          "melodic_minor":  {   1:0,    2:2,    3:3,    4:5,    5:7,    6:9,    7:11    },
-
-          "chromatic":       {   1:0,    2:1,    3:2,    4:3,    5:4,    6:5,    7:6,    8:7,    9:8,    10:9,   11:10   },
-          "whole_half_diminished":  {   1:0,    2:2,    3:3,    4:5,    5:6,    6:8,    7:9,    8:11    },
-          "half_whole_diminished":  {   1:0,    2:1,    3:3,    4:4,    5:6,    6:7,    7:9,    8:10    },
-          "whole_tone":     {   1:0,    2:2,    3:4,    4:6,    5:8,    6:10,   7:12    },
-          "minor_blues":    {   1:0,    2:3,    3:5,    4:6,    5:7,    6:10,   7:12    },
-          "major_blues":    {   1:0,    2:2,    3:3,    4:4,    5:7,    6:9,    7:12    },
-          "altered":        {   1:0,    2:1,    3:3,    4:4,    5:6,    6:8,    7:10    },
-          }
-
-
-# Transform-Functions:
-#   - Functions for taking defined input for rhythm, degrees, ect. and creating a note dictonary
-#   
-#   - takes "string-rhythm" and duration and converts it to the dictonary note format used in the whole backend
-def rhythm_to_time(rhythm, temp_duration):
-    duration = temp_duration*0.5
-    notes = []
-    rhythm_dict = { "time": [], "note_duration": []}
-    counter = 0
-    hold_parm = False
-
-    note_amount = rhythm.count(":") + rhythm.count(".") + rhythm.count("_")
-    note_lenght = duration/note_amount
-    rounded_note_lenght = round(note_lenght, 4)
-
-    for note_value in rhythm:
-        if note_value == ":":
-            note_time = counter * note_lenght
-            rounded_note_time = round(note_time,4)
-            rhythm_dict["time"].append(rounded_note_time)
-            rhythm_dict["note_duration"].append(rounded_note_lenght)
-            hold_parm = True
-        elif note_value == "_":
-            if hold_parm == True:
-                rhythm_dict["note_duration"][-1] += rounded_note_lenght
-        elif note_value == ".":
-            hold_parm = False
-        counter +=1  
-    return rhythm_dict
-
-
-#   - helper for degree_to_note
-#   - takes char degree input and converts it to midi note value
-#   - also reads the microtonal information and puts it into midi pitch wheel format
-def degree_function(degree, scale):
-    val = float(degree)
-    if (val - int(val)) == 0:
-        return (scales[scale][int(val)], 0)
-    elif (val - int(val)) == 0.5:
-        return (scales[scale][int(val)] + 1, 0)
-    else:
-        pitch_val = int(8192 * round(val - int(val), 4))
-        return (scales[scale][int(val)], pitch_val)
-
-
-#   - takes list of notes and creats tuple of a midi note list and pitch value list
-def degree_to_note(degree_list, scale):
-    notes = []
-    pitch_values = []
-    for degree in degree_list:
-        if degree.find("va") != -1:
-            note_value, pitch_value = degree_function(degree[:degree.find("va")], scale)
-            notes.append(note_value + 12)       
-            pitch_values.append(pitch_value)
-        elif degree.find("vb") != -1:
-            note_value, pitch_value = degree_function(abs(float(degree[:degree.find("vb")])), scale)
-            notes.append(note_value  - 24)       
-            pitch_values.append(pitch_value)
-        elif float(degree) > 0:
-            note_value, pitch_value = degree_function(degree, scale)
-            notes.append(note_value)       
-            pitch_values.append(pitch_value)
-        elif float(degree) < 0:
-            note_value, pitch_value =  degree_function(abs(float(degree)), scale)
-            notes.append(note_value - 12)       
-            pitch_values.append(pitch_value)
-        else:
-            print(f"Note Parameter Error! Check your entert note - {degree}")
-    return notes,pitch_values
-
-
-#   - helper
-#   - takes a notes string inptut and puts it into a list of string notes
-def string_to_list(note_str):
-    note_str = note_str.strip("[]")
-    return re.split(r',\s*(?=[^,])', note_str)
-
-#   - helper for create_lick function
-#   - checks if entered lists have the same length
-def list_length_check(*lists):
-    return len(set(len(list) for list in lists)) == 1
-
-#   - takes funtion input parameters and creates solo part in used dictonary format
-def create_lick(rhythm, duration, degree_str, scale, volume_list, midi_root_note, time_offset):
-    note_dict = {"pitch" : [], "time" : [], "note_duration" : [], "volume" : [], "chord" : [], "pitchWheelValue" : []}
-
-    degree_list = string_to_list(degree_str)
-
-    notes, pitch_values = degree_to_note(degree_list, scale)
-    rhythm_dict = rhythm_to_time(rhythm, duration)
-
-    if list_length_check(notes, pitch_values, rhythm_dict["time"], rhythm_dict["note_duration"], volume_list) == False:
-        print("Something went wrong! Check your entered values in creatLick function.")
-        return -1
-
-    for note in notes:
-        note_dict["pitch"].append(note + midi_root_note)
-    for time in rhythm_dict["time"]:
-        note_dict["time"].append(time + time_offset)
-
-    note_dict["note_duration"] = rhythm_dict["note_duration"]
-    note_dict["volume"] = volume_list
-    note_dict["pitchWheelValue"] = pitch_values
-
-    for i in range(0,len(note_dict["pitch"])):
-        note_dict["chord"].append("")
-
-    return note_dict
-
-#   - helper for create_rand_degrees
-#   - handels upper and lower boundary problems of a random lick
-def randomnote_to_degree(note, scale, updown_flag):
-    range_boundary = 7
-    match scale:
-        case "chromatic":
-            range_boundary = 11
-        case "whole_half_diminished":
-            range_boundary = 8        
-        case "half_whole_diminished":
-            range_boundary = 8
-    if note <= 0:
-        if note > -(range_boundary):
-            return f"-{abs(abs(note)-range_boundary)}", updown_flag
-        elif note > -(range_boundary * 2):
-            return f"-{abs(abs(note+range_boundary)-range_boundary)}vb", updown_flag
-        else:
-            return "-1vb", 1   
-    else:
-        if note <= range_boundary:
-            return f"{note}", updown_flag
-        elif note <= (range_boundary * 2):
-            return f"{note - range_boundary}va", updown_flag
-        else:
-            return f"{range_boundary}va", -1
-   
-#   - creates pseudo random degree list
-def create_rand_degrees(length, jump_prop, up_down_prop, scale):
-    updown_flag = 1
-    notes = [1]
-    notes_char = ["1"]
-    for i in range(1,length):
-        if random.random() < (1-jump_prop):
-            if updown_flag == 1:
-                if random.random() < up_down_prop:
-                    updown_flag = 1
-                    new_note = notes[-1] + 1
-                    new_degree, updown_flag = randomnote_to_degree(new_note, scale, updown_flag)
-                    notes_char.append(new_degree)
-                    notes.append(new_note)
-                else:
-                    updown_flag = -1
-                    new_note = notes[-1] - 1
-                    new_degree, updown_flag = randomnote_to_degree(new_note, scale, updown_flag)
-                    notes_char.append(new_degree)
-                    notes.append(new_note)
-            elif updown_flag == -1:
-                if random.random() < 1-up_down_prop:
-                    updown_flag = 1
-                    new_note = notes[-1] + 1
-                    new_degree, updown_flag = randomnote_to_degree(new_note, scale, updown_flag)
-                    notes_char.append(new_degree)
-                    notes.append(new_note)
-                else:
-                    updown_flag = -1
-                    new_note = notes[-1] - 1
-                    new_degree, updown_flag = randomnote_to_degree(new_note, scale, updown_flag)
-                    notes_char.append(new_degree)
-                    notes.append(new_note)
-        else:
-            if random.random() < 0.33:
-                new_note = notes[-1] + random.choice([-3,3])
-                new_degree, updown_flag = randomnote_to_degree(new_note, scale, updown_flag)
-                notes_char.append(new_degree)
-                notes.append(new_note)
-            elif  random.random() > 0.66:
-                new_note = notes[-1] + random.choice([-4,4])
-                new_degree, updown_flag = randomnote_to_degree(new_note, scale, updown_flag)
-                notes_char.append(new_degree)
-                notes.append(new_note)
-            else:
-                new_note = notes[-1] + random.choice([-5,5])
-                new_degree, updown_flag = randomnote_to_degree(new_note, scale, updown_flag)
-                notes_char.append(new_degree)
-                notes.append(new_note)
-        i += 1
-
-    return notes_char
-
-
-#   - creates a random solo 
-def create_rand_lick(rhythm, duration, scale, volume_list, jump_prop, up_down_prop, midi_root_note, time_offset):
-    note_dict = {"pitch" : [], "time" : [], "note_duration" : [], "volume" : [], "pitchWheelValue" : []}
-
-    rhythm_dict = rhythm_to_time(rhythm, duration)
-    degree_list = create_rand_degrees(len(rhythm_dict["time"]), jump_prop, up_down_prop, scale)
-    notes, pitch_values = degree_to_note(degree_list, scale)
-
-    if list_length_check(notes, pitch_values, rhythm_dict["time"], rhythm_dict["note_duration"], volume_list) == False:
-        print("Something went wrong! Check your entered values in creatLick function.")
-        return -1
-
-    for note in notes:
-        note_dict["pitch"].append(note + midi_root_note)
-    for time in rhythm_dict["time"]:
-        note_dict["time"].append(time + time_offset)
-
-    note_dict["note_duration"] = rhythm_dict["note_duration"]
-    note_dict["volume"] = volume_list
-    note_dict["pitchWheelValue"] = pitch_values
-
-    return note_dict
-
-
-#   - splits a number into a list of elements out of an provided values list
-def split_number_into_list(target, values):
-    values = sorted(values, reverse=True)
-    
-    for r in range(1, target // min(values) + 1):
-        for combination in combinations_with_replacement(values, r):
-            if sum(combination) == target:
-                return list(combination)
-    return [] 
-
-
-#   - function for finding the right random lick in database                                                                                            schöner!!!
-def create_shred(style_tag, chord_list, midi_root_list, time_offset):
-    lick_database = lr.load_database()
-    new_lick = {"pitch" : [], "time" : [], "note_duration" : [], "volume" : [],"chord" :  [], "pitchWheelValue" : []}
-
-    if style_tag not in lick_database:
-        print(f"The given style {style_tag} was not found in our database!")
-
-    database_lick_lengths = {"min" : {}, "maj" : {}, "dom" : {}}
-
-    for chord_type in lick_database[style_tag]:
-        for lick in lick_database[style_tag][chord_type]:
-        
-            if lick["length"] in database_lick_lengths[chord_type]:
-                database_lick_lengths[chord_type][lick["length"]] += 1
-            else:
-                database_lick_lengths[chord_type][lick["length"]] = 1
-
-    old_chord = chord_list[0]
-    length = 0
-    chord_lentghs = []
-    chords = [chord_list[0]]
-    
-    for chord in chord_list:
-        if chord != old_chord:
-            chord_lentghs.append(length)
-            chords.append(chord)
-            length = 1
-        else:
-            length += 1
-        old_chord = chord
-
-    chord_lentghs.append(length)
-
-    lick_lengths = []
-
-    for i in range(0,len(chord_lentghs)):
-        lick_lengths.extend(split_number_into_list(chord_lentghs[i], list(database_lick_lengths[chords[i]].keys())))
-
-    new_chord_list = []
-    counter = 0
-    for length in lick_lengths:
-        new_chord_list.append(chord_list[counter])
-        counter += length
-
-    final_lick_list = []
-    for i in range(0,len(lick_lengths)):
-        possible_licks = []
-        for lick in lick_database[style_tag][new_chord_list[i]]:
-            if lick["length"] == lick_lengths[i]:
-                possible_licks.append(lick)
-        final_lick_list.append(possible_licks)
-            
-    itt = 0
-    beat = 0
-    start_note = midi_root_list[0]
-
-    for length in lick_lengths:
-        upper_boundary = 1
-        lower_boundary = -1
-        while(True):
-            rand_index = random.randint(0,(len(final_lick_list[itt])-1))
-            if len(final_lick_list[itt][rand_index]["pitch"]) != 0:
-                if (final_lick_list[itt][rand_index]["pitch"][0] + midi_root_list[beat] - start_note) < upper_boundary and (final_lick_list[itt][rand_index]["pitch"][0] + midi_root_list[beat] - start_note) > lower_boundary:
-                    break
-                else:
-                    upper_boundary +=1
-                    lower_boundary -=1
-            else:
-                pass
-
-        new_lick["pitch"].extend(final_lick_list[itt][rand_index]["pitch"])
-        new_lick["time"].extend(final_lick_list[itt][rand_index]["time"])
-        new_lick["note_duration"].extend(final_lick_list[itt][rand_index]["note_duration"])
-        new_lick["volume"].extend(final_lick_list[itt][rand_index]["volume"])
-
-        for i in range(len(new_lick["pitch"])-len(final_lick_list[itt][rand_index]["pitch"]),len(new_lick["pitch"])):
-            new_lick["pitch"][i] += midi_root_list[beat]
-            new_lick["time"][i] += beat/2 + time_offset
-            new_lick["pitchWheelValue"].append(0)
-
-        start_note = final_lick_list[itt][rand_index]["pitch"][-1] + midi_root_list[beat]
-        beat += length
-        itt += 1
-
-    return new_lick
-
-#   - name_changes for transparser
-#   - deterministic functions:
-def ionian(rhythm, duration, notes, volume, midi_root_note, time_offset):
-    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="ionian", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def dorian(rhythm, duration, notes, volume, midi_root_note, time_offset):
-    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="dorian", volume_list=volume,  midi_root_note=midi_root_note, time_offset=time_offset)
-
-def phrygian(rhythm, duration, notes, volume, midi_root_note, time_offset):
-    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="phrygian", volume_list=volume,  midi_root_note=midi_root_note, time_offset=time_offset)
-
-def lydian(rhythm, duration, notes, volume, midi_root_note, time_offset):
-    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="lydian", volume_list=volume,  midi_root_note=midi_root_note, time_offset=time_offset)
-
-def mixolydian(rhythm, duration, notes, volume, midi_root_note, time_offset):
-    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="mixolydian", volume_list=volume,  midi_root_note=midi_root_note, time_offset=time_offset)
-
-def aeolian(rhythm, duration, notes, volume, midi_root_note, time_offset):
-    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="aeolian", volume_list=volume,  midi_root_note=midi_root_note, time_offset=time_offset)
-
-def locrian(rhythm, duration, notes, volume, midi_root_note, time_offset):
-    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="locrian", volume_list=volume,  midi_root_note=midi_root_note, time_offset=time_offset)
-
-def major(rhythm, duration, notes, volume, midi_root_note, time_offset):
-    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="major", volume_list=volume,  midi_root_note=midi_root_note, time_offset=time_offset)
-
-def harmonicMinor(rhythm, duration, notes, volume, midi_root_note, time_offset):
-    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="harmonic_minor", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def melodicMinor(rhythm, duration, notes, volume, midi_root_note, time_offset):
-    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="melodic_minor", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def cromatic(rhythm, duration, notes, volume, midi_root_note, time_offset):
-    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="cromatic", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def wholeHalfDiminished(rhythm, duration, notes, volume, midi_root_note, time_offset):
-    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="whole_half_diminished", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def halfWholeDiminished(rhythm, duration, notes, volume, midi_root_note, time_offset):
-    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="half_whole_diminished", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def wholeTone(rhythm, duration, notes, volume, midi_root_note, time_offset):
-    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="whole_tone", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def minorBlues(rhythm, duration, notes, volume, midi_root_note, time_offset):
-    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="minor_blues", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def majorBlues(rhythm, duration, notes, volume, midi_root_note, time_offset):
-    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="major_blues", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def altered(rhythm, duration, notes, volume, midi_root_note, time_offset):
-    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="altered", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
-
-#   - random functions:
-def randomIonian(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset):
-    return create_rand_lick(rhythm=rhythm, duration=duration, scale="ionian", volume_list=volume, jump_prop=jump_prop, 
-                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def randomDorian(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset):
-    return create_rand_lick(rhythm=rhythm, duration=duration, scale="dorian", volume_list=volume, jump_prop=jump_prop, 
-                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def randomPhrygian(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset):
-    return create_rand_lick(rhythm=rhythm, duration=duration, scale="phrygian", volume_list=volume, jump_prop=jump_prop, 
-                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def randomLydian(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset):
-    return create_rand_lick(rhythm=rhythm, duration=duration, scale="lydian", volume_list=volume, jump_prop=jump_prop, 
-                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def randomMixolydian(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset):
-    return create_rand_lick(rhythm=rhythm, duration=duration, scale="mixolydian", volume_list=volume, jump_prop=jump_prop, 
-                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def randomAeolian(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset):
-    return create_rand_lick(rhythm=rhythm, duration=duration, scale="aeolian", volume_list=volume, jump_prop=jump_prop, 
-                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def randomLocrian(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset):
-    return create_rand_lick(rhythm=rhythm, duration=duration, scale="locrian", volume_list=volume, jump_prop=jump_prop, 
-                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def randomMajor(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset):
-    return create_rand_lick(rhythm=rhythm, duration=duration, scale="major", volume_list=volume, jump_prop=jump_prop, 
-                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def randomHarmonicMinor(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset):
-    return create_rand_lick(rhythm=rhythm, duration=duration, scale="harmonic_minor", volume_list=volume, jump_prop=jump_prop, 
-                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def randomMelodicMinor(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset):
-    return create_rand_lick(rhythm=rhythm, duration=duration, scale="melodic_minor", volume_list=volume, jump_prop=jump_prop, 
-                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def randomCromatic(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset):
-    return create_rand_lick(rhythm=rhythm, duration=duration, scale="cromatic", volume_list=volume, jump_prop=jump_prop, 
-                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def randomWholeHalfDiminished(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset):
-    return create_rand_lick(rhythm=rhythm, duration=duration, scale="whole_half_diminished", volume_list=volume, jump_prop=jump_prop, 
-                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def randomHalfWholeDiminished(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset):
-    return create_rand_lick(rhythm=rhythm, duration=duration, scale="half_whole_diminished", volume_list=volume, jump_prop=jump_prop, 
-                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def randomWholeTone(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset):
-    return create_rand_lick(rhythm=rhythm, duration=duration, scale="whole_tone", volume_list=volume, jump_prop=jump_prop, 
-                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def randomMinorBlues(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset):
-    return create_rand_lick(rhythm=rhythm, duration=duration, scale="minor_blues", volume_list=volume, jump_prop=jump_prop, 
-                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def randomMajorBlues(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset):
-    return create_rand_lick(rhythm=rhythm, duration=duration, scale="major_blues", volume_list=volume, jump_prop=jump_prop, 
-                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset)
-
-def randomAltered(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset):
-    return create_rand_lick(rhythm=rhythm, duration=duration, scale="altered", volume_list=volume, jump_prop=jump_prop, 
-                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset)
-
-
-#   - shred mode:
-def shredMode(style, duration, chords, midi_root_notes, time_offset):
-    return create_shred(style_tag=style, chord_list=chords[time_offset:time_offset+duration], midi_root_list=midi_root_notes[time_offset:time_offset+duration], time_offset=time_offset/2)
-
-#   - pause function:
-def pause(duration):
-    return duration
-
-#           - specials:
-def transposeHarmony(transpose_by,midi_root_notes):
-    transposed_midi_root_notes = []
-    for note in midi_root_notes:
-        transposed_midi_root_notes.append(note + transpose_by)
-    return transposed_midi_root_notes
-
-def enablePracticeMode(midi_root_notes, chord_list):
-    practice_midi_root_notes = []
-    practice_chord_list = []
-    for i in range(0,12):
-        practice_chord_list.extend(chord_list)
-        for note in midi_root_notes:
-            practice_midi_root_notes.append(note + i)
-    return practice_midi_root_notes, practice_chord_list
-
-
-# Midi-Creator Functions:
-#
-#   - merges a reference new dictionary to a reference dictonary 
-def merge_note_dicts(ref_dict, new_dict):
-    for key in new_dict.keys():
-        ref_dict[key].extend(new_dict[key])
-    return ref_dict
-
-#   - writes note dictonary to a midi file
-def write_midi_from_dict(note_dict, output_filename, tempo=120, time_signature=(4, 4)):
-    
-    midi = pretty_midi.PrettyMIDI()
-
-    midi._initial_tempo = tempo
-    numerator, denominator = time_signature
-    midi.time_signature_changes.append(pretty_midi.TimeSignature(numerator, denominator, time=0.0))
-
-    instrument = pretty_midi.Instrument(program=0)
-
-    for beat_nr in range(0,len(note_dict["pitch"])):
-        note = pretty_midi.Note(velocity=note_dict["volume"][beat_nr], pitch=note_dict["pitch"][beat_nr], start=note_dict["time"][beat_nr], 
-                                end=note_dict["time"][beat_nr] + note_dict["note_duration"][beat_nr])
-        instrument.notes.append(note)
-
-        pitch_bend_event = pretty_midi.PitchBend(note_dict["pitchWheelValue"][beat_nr], note_dict["time"][beat_nr])
-        instrument.pitch_bends.append(pitch_bend_event)
-
-    midi.instruments.append(instrument)
-
-    midi.write(output_filename)
-
+# Copyright (c) 2025, Michael Žutić, Oliver Köll
+# All rights reserved.
+#
+# This source code is licensed under the
+# MIT License found in the LICENSE.txt file 
+# in the root directory of this source tree.
+
+import random
+import lick_reader as lr
+from lick_buffer import NoteBuffer
+import lick_midi as lm
+import lick_profile as lprof
+import re
+import numpy as np
+from functools import lru_cache
+from bisect import bisect_left, bisect_right
+
+
+scales = {"ionian":         {   1:0,    2:2,    3:4,    4:5,    5:7,    6:9,    7:11    },
+          "dorian":         {   1:0,    2:2,    3:3,    4:5,    5:7,    6:9,    7:10    },
+          "phrygian":       {   1:0,    2:1,    3:3,    4:5,    5:7,    6:8,    7:10    },
+          "lydian":         {   1:0,    2:2,    3:4,    4:6,    5:7,    6:9,    7:11    },
+          "mixolydian":     {   1:0,    2:2,    3:4,    4:5,    5:7,    6:9,    7:10    },
+          "aeolian":        {   1:0,    2:2,    3:3,    4:5,    5:7,    6:8,    7:10    },
+          "locrian":        {   1:0,    2:1,    3:3,    4:5,    5:6,    6:8,    7:10    },
+
+          "major":          {   1:0,    2:2,    3:4,    4:5,    5:7,    6:9,    7:11    },
+          "harmonic_minor": {   1:0,    2:2,    3:3,    4:5,    5:7,    6:8,    7:11    },
+          "melodic_minor":  {   1:0,    2:2,    3:3,    4:5,    5:7,    6:9,    7:11    },
+
+          "chromatic":       {   1:0,    2:1,    3:2,    4:3,    5:4,    6:5,    7:6,    8:7,    9:8,    10:9,   11:10   },
+          "whole_half_diminished":  {   1:0,    2:2,    3:3,    4:5,    5:6,    6:8,    7:9,    8:11    },
+          "half_whole_diminished":  {   1:0,    2:1,    3:3,    4:4,    5:6,    6:7,    7:9,    8:10    },
+          "whole_tone":     {   1:0,    2:2,    3:4,    4:6,    5:8,    6:10,   7:12    },
+          "minor_blues":    {   1:0,    2:3,    3:5,    4:6,    5:7,    6:10,   7:12    },
+          "major_blues":    {   1:0,    2:2,    3:3,    4:4,    5:7,    6:9,    7:12    },
+          "altered":        {   1:0,    2:1,    3:3,    4:4,    5:6,    6:8,    7:10    },
+          }
+
+
+# Transform-Functions:
+#   - Functions for taking defined input for rhythm, degrees, ect. and creating a note dictonary
+#   
+#   - takes "string-rhythm" and duration and converts it to the dictonary note format used in the whole backend
+def rhythm_to_time(rhythm, temp_duration):
+    template = rhythm_template(rhythm, temp_duration)
+    return { "time": list(template.time), "note_duration": list(template.note_duration)}
+
+
+# Rhythm Template:
+#   - onsets and note durations of a rhythm string, compiled once and shared by every call with the same rhythm and duration
+#   - the template is immutable, shifted returns the onsets for a time offset with a single vectorized add
+class RhythmTemplate:
+
+    def __init__(self, time, note_duration):
+        self.time = tuple(time)
+        self.note_duration = tuple(note_duration)
+        self.time_array = np.array(self.time, dtype=np.float64)
+        self.time_array.flags.writeable = False
+
+    def __len__(self):
+        return len(self.time)
+
+    #   - returns the onsets shifted by time_offset as numpy array
+    def shifted(self, time_offset):
+        return self.time_array + time_offset
+
+#   - compiles a rhythm string and duration to a rhythm template
+#   - the templates are cached, melody files reuse a few rhythms in every bar and practice key
+@lru_cache(maxsize=1024)
+def rhythm_template(rhythm, temp_duration):
+    duration = temp_duration*0.5
+    times = []
+    note_durations = []
+    hold_parm = False
+
+    note_amount = sum(1 for note_value in rhythm if note_value in ":._")
+    note_lenght = duration/note_amount
+    rounded_note_lenght = round(note_lenght, 4)
+
+    for counter, note_value in enumerate(rhythm):
+        if note_value == ":":
+            times.append(round(counter * note_lenght, 4))
+            note_durations.append(rounded_note_lenght)
+            hold_parm = True
+        elif note_value == "_":
+            if hold_parm == True:
+                note_durations[-1] += rounded_note_lenght
+        elif note_value == ".":
+            hold_parm = False
+    return RhythmTemplate(times, note_durations)
+
+
+#   - helper for degree_to_note
+#   - takes char degree input and converts it to midi note value
+#   - also reads the microtonal information and puts it into midi pitch wheel format
+def degree_function(degree, scale):
+    val = float(degree)
+    if (val - int(val)) == 0:
+        return (scales[scale][int(val)], 0)
+    elif (val - int(val)) == 0.5:
+        return (scales[scale][int(val)] + 1, 0)
+    else:
+        pitch_val = int(8192 * round(val - int(val), 4))
+        return (scales[scale][int(val)], pitch_val)
+
+
+#   - resolves one degree of a scale to its semitone offset and pitch wheel value, e.g. ("dorian", "3va") -> (15, 0)
+#   - results are kept in a lookup table, so every (scale, degree) pair is only parsed once
+#   - returns None if the degree is no valid note
+@lru_cache(maxsize=4096)
+def resolve_degree(scale, degree):
+    if degree.find("va") != -1:
+        note_value, pitch_value = degree_function(degree[:degree.find("va")], scale)
+        return (note_value + 12, pitch_value)
+    elif degree.find("vb") != -1:
+        note_value, pitch_value = degree_function(abs(float(degree[:degree.find("vb")])), scale)
+        return (note_value - 24, pitch_value)
+    elif float(degree) > 0:
+        return degree_function(degree, scale)
+    elif float(degree) < 0:
+        note_value, pitch_value = degree_function(abs(float(degree)), scale)
+        return (note_value - 12, pitch_value)
+    else:
+        return None
+
+
+#   - helper
+#   - reports a degree that is no valid note, the note is left out of the lick
+def note_parameter_error(degree):
+    print(f"Note Parameter Error! Check your entert note - {degree}")
+
+#   - takes list of notes and creats tuple of a midi note list and pitch value list
+def degree_to_note(degree_list, scale):
+    notes = []
+    pitch_values = []
+    for degree in degree_list:
+        resolved_degree = resolve_degree(scale, degree)
+        if resolved_degree is None:
+            note_parameter_error(degree)
+        else:
+            notes.append(resolved_degree[0])
+            pitch_values.append(resolved_degree[1])
+    return notes,pitch_values
+
+
+#   - helper
+#   - takes a notes string inptut and puts it into a tuple of string notes
+@lru_cache(maxsize=1024)
+def string_to_list(note_str):
+    note_str = note_str.strip("[]")
+    return tuple(re.split(r',\s*(?=[^,])', note_str))
+
+#   - helper for create_lick function
+#   - checks if entered lists have the same length
+def list_length_check(*lists):
+    return len(set(len(list) for list in lists)) == 1
+
+#   - takes funtion input parameters and creates solo part in used dictonary format
+#   - the degrees are a notes string (e.g. "[1, 3va]") or a sequence of degrees
+def create_lick(rhythm, duration, degree_str, scale, volume_list, midi_root_note, time_offset):
+    if isinstance(degree_str, str):
+        degree_list = string_to_list(degree_str)
+    else:
+        degree_list = tuple(str(degree) for degree in degree_str)
+
+    notes, pitch_values = degree_to_note(degree_list, scale)
+    return create_lick_from_notes(rhythm, duration, notes, pitch_values, volume_list, midi_root_note, time_offset)
+
+#   - creates a lick from notes that are already resolved to semitones and pitch wheel values (see degree_to_note),
+#     e.g. by the interpreter, which resolves the notes lists of a melody once before it is rendered
+def create_lick_from_notes(rhythm, duration, notes, pitch_values, volume_list, midi_root_note, time_offset):
+    template = rhythm_template(rhythm, duration)
+
+    if list_length_check(notes, pitch_values, template.time, template.note_duration, volume_list) == False:
+        print("Something went wrong! Check your entered values in creatLick function.")
+        return -1
+
+    note_dict = NoteBuffer(notes, template.time, template.note_duration, volume_list, pitch_values)
+    note_dict.transpose(midi_root_note)
+    note_dict.shift(time_offset)
+
+    return note_dict
+
+#   - helper for the random functions
+#   - returns the random generator of a seed: a random.Random instance is used as it is, any other seed creates a new generator
+#   - without a seed the global random module is used
+def get_rng(seed=None):
+    if seed is None:
+        return random
+    if isinstance(seed, random.Random):
+        return seed
+    return random.Random(seed)
+
+#   - derives an independent, reproducible seed for every random call of a render out of one render seed
+#   - the n-th call of a render always gets the same generator, no matter in which thread or process the render runs
+class RandomStreams:
+
+    def __init__(self, render_seed=None):
+        self.render_seed = render_seed
+        self.call_count = 0
+
+    #   - returns the seed of the next call, or None (global random module) if the render has no seed
+    def next(self):
+        self.call_count += 1
+        if self.render_seed is None:
+            return None
+        return f"{self.render_seed}/{self.call_count}"
+
+#   - helper for randomnote_to_degree and create_rand_walks
+#   - number of degrees of a scale before the random walk changes its octave
+def walk_boundary(scale):
+    match scale:
+        case "chromatic":
+            return 11
+        case "whole_half_diminished" | "half_whole_diminished":
+            return 8
+    return 7
+
+#   - helper for create_rand_degrees
+#   - handels upper and lower boundary problems of a random lick
+def randomnote_to_degree(note, scale, updown_flag):
+    range_boundary = walk_boundary(scale)
+    if note <= 0:
+        if note > -(range_boundary):
+            return f"-{abs(abs(note)-range_boundary)}", updown_flag
+        elif note > -(range_boundary * 2):
+            return f"-{abs(abs(note+range_boundary)-range_boundary)}vb", updown_flag
+        else:
+            return "-1vb", 1   
+    else:
+        if note <= range_boundary:
+            return f"{note}", updown_flag
+        elif note <= (range_boundary * 2):
+            return f"{note - range_boundary}va", updown_flag
+        else:
+            return f"{range_boundary}va", -1
+   
+#   - creates pseudo random degree list
+def create_rand_degrees(length, jump_prop, up_down_prop, scale, rng=random):
+    updown_flag = 1
+    notes = [1]
+    notes_char = ["1"]
+    for i in range(1,length):
+        if rng.random() < (1-jump_prop):
+            if updown_flag == 1:
+                if rng.random() < up_down_prop:
+                    updown_flag = 1
+                    new_note = notes[-1] + 1
+                    new_degree, updown_flag = randomnote_to_degree(new_note, scale, updown_flag)
+                    notes_char.append(new_degree)
+                    notes.append(new_note)
+                else:
+                    updown_flag = -1
+                    new_note = notes[-1] - 1
+                    new_degree, updown_flag = randomnote_to_degree(new_note, scale, updown_flag)
+                    notes_char.append(new_degree)
+                    notes.append(new_note)
+            elif updown_flag == -1:
+                if rng.random() < 1-up_down_prop:
+                    updown_flag = 1
+                    new_note = notes[-1] + 1
+                    new_degree, updown_flag = randomnote_to_degree(new_note, scale, updown_flag)
+                    notes_char.append(new_degree)
+                    notes.append(new_note)
+                else:
+                    updown_flag = -1
+                    new_note = notes[-1] - 1
+                    new_degree, updown_flag = randomnote_to_degree(new_note, scale, updown_flag)
+                    notes_char.append(new_degree)
+                    notes.append(new_note)
+        else:
+            if rng.random() < 0.33:
+                new_note = notes[-1] + rng.choice([-3,3])
+                new_degree, updown_flag = randomnote_to_degree(new_note, scale, updown_flag)
+                notes_char.append(new_degree)
+                notes.append(new_note)
+            elif  rng.random() > 0.66:
+                new_note = notes[-1] + rng.choice([-4,4])
+                new_degree, updown_flag = randomnote_to_degree(new_note, scale, updown_flag)
+                notes_char.append(new_degree)
+                notes.append(new_note)
+            else:
+                new_note = notes[-1] + rng.choice([-5,5])
+                new_degree, updown_flag = randomnote_to_degree(new_note, scale, updown_flag)
+                notes_char.append(new_degree)
+                notes.append(new_note)
+        i += 1
+
+    return notes_char
+
+
+#   - creates a random solo 
+def create_rand_lick(rhythm, duration, scale, volume_list, jump_prop, up_down_prop, midi_root_note, time_offset, seed=None):
+    template = rhythm_template(rhythm, duration)
+    degree_list = create_rand_degrees(len(template), jump_prop, up_down_prop, scale, get_rng(seed))
+    notes, pitch_values = degree_to_note(degree_list, scale)
+
+    if list_length_check(notes, pitch_values, template.time, template.note_duration, volume_list) == False:
+        print("Something went wrong! Check your entered values in creatLick function.")
+        return -1
+
+    note_dict = NoteBuffer(notes, template.time, template.note_duration, volume_list, pitch_values)
+    note_dict.transpose(midi_root_note)
+    note_dict.shift(time_offset)
+
+    return note_dict
+
+
+# Bulk Random Licks:
+#   - creates many random licks of the same rhythm and scale at once
+#   - the random walk of create_rand_degrees runs on numpy arrays with one row per lick, directly in semitones
+#
+#   - helper for the bulk random functions
+#   - returns the numpy generator of a seed, seeds are handled like in get_rng
+def get_numpy_rng(seed=None):
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(get_rng(seed).getrandbits(128))
+
+#   - helper for create_rand_walks
+#   - semitone and pitch wheel value of every walk position between the boundaries of randomnote_to_degree
+#   - returns (lowest position, semitones, pitch wheel values), positions outside the table are clipped to its ends
+@lru_cache(maxsize=64)
+def walk_table(scale):
+    range_boundary, updown_flag = walk_boundary(scale), 1
+    positions = range(-2 * range_boundary, 2 * range_boundary + 2)
+    resolved = [resolve_degree(scale, randomnote_to_degree(position, scale, updown_flag)[0]) for position in positions]
+    return -2 * range_boundary, np.array([semitone for semitone, wheel in resolved]), np.array([wheel for semitone, wheel in resolved])
+
+#   - creates count random walks of length notes with the rules of create_rand_degrees
+#   - returns (semitones, pitch wheel values) as numpy arrays of shape (count, length)
+def create_rand_walks(count, length, jump_prop, up_down_prop, scale, seed=None):
+    rng = get_numpy_rng(seed)
+    range_boundary = walk_boundary(scale)
+    lowest_position, semitones, wheels = walk_table(scale)
+
+    positions = np.ones((count, length), dtype=np.int64)
+    position = positions[:, 0].copy()
+    updown_flag = np.ones(count, dtype=np.int64)
+    for i in range(1, length):
+        step = rng.random(count) < (1-jump_prop)
+        up = rng.random(count) < np.where(updown_flag == 1, up_down_prop, 1-up_down_prop)
+        step_direction = np.where(up, 1, -1)
+
+        jump_choice = rng.random((2, count))
+        jump_size = np.where(jump_choice[0] < 0.33, 3, np.where(jump_choice[1] > 0.66, 4, 5))
+        jump = jump_size * rng.choice(np.array([-1, 1]), count)
+
+        position += np.where(step, step_direction, jump)
+        updown_flag = np.where(step, step_direction, updown_flag)
+        # the walk turns around when it leaves the lowest and highest octave
+        updown_flag[position <= -2 * range_boundary] = 1
+        updown_flag[position > 2 * range_boundary] = -1
+        positions[:, i] = position
+
+    table_index = np.clip(positions, lowest_position, 2 * range_boundary + 1) - lowest_position
+    return semitones[table_index], wheels[table_index]
+
+#   - creates count random solos of the same rhythm and scale, see create_rand_lick
+#   - returns a list of note buffers
+def create_rand_licks(count, rhythm, duration, scale, volume_list, jump_prop, up_down_prop, midi_root_note=0, time_offset=0, seed=None):
+    template = rhythm_template(rhythm, duration)
+    length = len(template)
+    if list_length_check(template.time, template.note_duration, volume_list) == False:
+        print("Something went wrong! Check your entered values in creatLick function.")
+        return -1
+
+    semitones, wheels = create_rand_walks(count, length, jump_prop, up_down_prop, scale, seed)
+    times = template.shifted(time_offset).tolist()
+    return [NoteBuffer(notes, times, template.note_duration, volume_list, pitch_values)
+            for notes, pitch_values in zip((semitones + midi_root_note).tolist(), wheels.tolist())]
+
+
+#   - helper for split_number_into_list
+#   - coin change table of all lick lengths of a style tag and chord vibe, cached in the lick index of the tag (see lick_reader.get_tag_index)
+#   - ways[i][t] is the summed weight of all partitions of t into the lengths values[i:], every used lick length
+#     is weighted with its share of the licks, so partitions into well stocked lengths and into few licks are preferred
+def partition_table(tag_index, chord_type, target):
+    tables = tag_index.setdefault("partitions", {})
+    if chord_type not in tables or len(tables[chord_type]["ways"][0]) <= target:
+        lick_lengths = tag_index["lengths"].get(chord_type, {})
+        lick_count = sum(lick_lengths.values())
+        values = sorted(lick_lengths.keys(), reverse=True)
+        weights = [lick_lengths[value] / lick_count for value in values]
+        size = max(target + 1, 2 * len(tables[chord_type]["ways"][0]) if chord_type in tables else 0)
+
+        ways = [[0.0] * size for i in range(0, len(values) + 1)]
+        ways[len(values)][0] = 1.0
+        for i in range(len(values) - 1, -1, -1):
+            for t in range(0, size):
+                ways[i][t] = ways[i + 1][t]
+                if t >= values[i]:
+                    ways[i][t] += weights[i] * ways[i][t - values[i]]
+        tables[chord_type] = {"values" : values, "ways" : ways}
+        lprof.count("shred_partition_tables")
+    return tables[chord_type]
+
+#   - splits a number of beats into lick lengths of the database
+#   - picks one of all valid partitions at random, weighted as described in partition_table
+def split_number_into_list(target, tag_index, chord_type, rng=random):
+    table = partition_table(tag_index, chord_type, target)
+    values = table["values"]
+    ways = table["ways"]
+    if len(values) == 0 or ways[0][target] == 0:
+        return []
+
+    lick_lengths = []
+    i = 0
+    while target > 0:
+        if rng.random() * ways[i][target] < ways[i + 1][target]:
+            i += 1
+        else:
+            lick_lengths.append(values[i])
+            target -= values[i]
+    # every skipped lick length is one draw that was rejected
+    lprof.count("shred_rejected_lengths", i)
+    return lick_lengths
+
+
+#   - helper for create_shred
+#   - picks the lick whose first note is nearest to the target pitch (relative to the chord root), ties are broken at random
+#   - returns None if no lick of the bucket has notes
+def pick_lick(tag_index, chord_type, length, target_pitch, rng=random):
+    first_pitches, licks = tag_index["pitch_index"].get((chord_type, length), ([], []))
+    if len(licks) == 0:
+        return None
+
+    index = bisect_left(first_pitches, target_pitch)
+    distance = min(abs(first_pitches[i] - target_pitch) for i in (index - 1, index) if 0 <= i < len(licks))
+    candidates = []
+    for pitch in sorted(set((target_pitch - distance, target_pitch + distance))):
+        candidates.append((bisect_left(first_pitches, pitch), bisect_right(first_pitches, pitch)))
+    candidate_count = sum(stop - start for start, stop in candidates)
+    lprof.count("shred_candidates", candidate_count)
+
+    rand_index = rng.randrange(candidate_count)
+    for start, stop in candidates:
+        if rand_index < stop - start:
+            return licks[start + rand_index]
+        rand_index -= stop - start
+
+
+#   - function for finding the right random lick in database                                                                                            schöner!!!
+def create_shred(style_tag, chord_list, midi_root_list, time_offset, seed=None):
+    harmony = lr.Harmony(midi_root_list, chord_list)
+    return shred_harmony(style_tag, harmony, 0, len(harmony), time_offset, seed)
+
+#   - creates a solo out of database licks for the beats start to stop of a harmony
+#   - the chord runs come from the run index of the harmony, so the beats before start are never looked at
+def shred_harmony(style_tag, harmony, start, stop, time_offset, seed=None):
+    with lprof.span("shred", style=style_tag, beats=stop - start):
+        return shred_beats(style_tag, harmony, start, stop, time_offset, seed)
+
+#   - helper for shred_harmony
+#   - the lick index of the style tag is checked against the shards once and then used for every lick of the solo
+def shred_beats(style_tag, harmony, start, stop, time_offset, seed=None):
+    new_lick = NoteBuffer()
+    rng = get_rng(seed)
+
+    if not lr.has_style_tag(style_tag):
+        print(f"The given style {style_tag} was not found in our database!")
+        return new_lick
+    tag_index = lr.get_tag_index(style_tag)
+
+    lick_lengths = []
+    for chord, length in harmony.chord_runs(start, stop):
+        lick_lengths.extend(split_number_into_list(length, tag_index, chord, rng))
+
+    beat = start
+    start_note = harmony.midi_roots[start] if start < stop else 0
+
+    for length in lick_lengths:
+        chord = harmony.vibes[beat]
+        midi_root_note = harmony.midi_roots[beat]
+        lick = pick_lick(tag_index, chord, length, start_note - midi_root_note, rng)
+        if lick is None:
+            print(f"No lick with notes of length {length} on {chord} chords was found for the style {style_tag}!")
+            return -1
+
+        new_lick.extend(lick, pitch_offset=midi_root_note, time_offset=(beat - start)/2 + time_offset)
+        lprof.count("shred_licks")
+
+        start_note = lick["pitch"][-1] + midi_root_note
+        beat += length
+
+    return new_lick
+
+#   - name_changes for transparser
+#   - deterministic functions:
+def ionian(rhythm, duration, notes, volume, midi_root_note, time_offset):
+    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="ionian", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
+
+def dorian(rhythm, duration, notes, volume, midi_root_note, time_offset):
+    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="dorian", volume_list=volume,  midi_root_note=midi_root_note, time_offset=time_offset)
+
+def phrygian(rhythm, duration, notes, volume, midi_root_note, time_offset):
+    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="phrygian", volume_list=volume,  midi_root_note=midi_root_note, time_offset=time_offset)
+
+def lydian(rhythm, duration, notes, volume, midi_root_note, time_offset):
+    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="lydian", volume_list=volume,  midi_root_note=midi_root_note, time_offset=time_offset)
+
+def mixolydian(rhythm, duration, notes, volume, midi_root_note, time_offset):
+    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="mixolydian", volume_list=volume,  midi_root_note=midi_root_note, time_offset=time_offset)
+
+def aeolian(rhythm, duration, notes, volume, midi_root_note, time_offset):
+    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="aeolian", volume_list=volume,  midi_root_note=midi_root_note, time_offset=time_offset)
+
+def locrian(rhythm, duration, notes, volume, midi_root_note, time_offset):
+    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="locrian", volume_list=volume,  midi_root_note=midi_root_note, time_offset=time_offset)
+
+def major(rhythm, duration, notes, volume, midi_root_note, time_offset):
+    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="major", volume_list=volume,  midi_root_note=midi_root_note, time_offset=time_offset)
+
+def harmonicMinor(rhythm, duration, notes, volume, midi_root_note, time_offset):
+    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="harmonic_minor", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
+
+def melodicMinor(rhythm, duration, notes, volume, midi_root_note, time_offset):
+    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="melodic_minor", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
+
+def cromatic(rhythm, duration, notes, volume, midi_root_note, time_offset):
+    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="cromatic", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
+
+def wholeHalfDiminished(rhythm, duration, notes, volume, midi_root_note, time_offset):
+    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="whole_half_diminished", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
+
+def halfWholeDiminished(rhythm, duration, notes, volume, midi_root_note, time_offset):
+    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="half_whole_diminished", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
+
+def wholeTone(rhythm, duration, notes, volume, midi_root_note, time_offset):
+    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="whole_tone", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
+
+def minorBlues(rhythm, duration, notes, volume, midi_root_note, time_offset):
+    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="minor_blues", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
+
+def majorBlues(rhythm, duration, notes, volume, midi_root_note, time_offset):
+    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="major_blues", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
+
+def altered(rhythm, duration, notes, volume, midi_root_note, time_offset):
+    return create_lick(rhythm=rhythm, duration=duration, degree_str=notes, scale="altered", volume_list=volume, midi_root_note=midi_root_note, time_offset=time_offset)
+
+#   - random functions:
+def randomIonian(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset, seed=None):
+    return create_rand_lick(rhythm=rhythm, duration=duration, scale="ionian", volume_list=volume, jump_prop=jump_prop, 
+                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset, seed=seed)
+
+def randomDorian(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset, seed=None):
+    return create_rand_lick(rhythm=rhythm, duration=duration, scale="dorian", volume_list=volume, jump_prop=jump_prop, 
+                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset, seed=seed)
+
+def randomPhrygian(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset, seed=None):
+    return create_rand_lick(rhythm=rhythm, duration=duration, scale="phrygian", volume_list=volume, jump_prop=jump_prop, 
+                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset, seed=seed)
+
+def randomLydian(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset, seed=None):
+    return create_rand_lick(rhythm=rhythm, duration=duration, scale="lydian", volume_list=volume, jump_prop=jump_prop, 
+                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset, seed=seed)
+
+def randomMixolydian(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset, seed=None):
+    return create_rand_lick(rhythm=rhythm, duration=duration, scale="mixolydian", volume_list=volume, jump_prop=jump_prop, 
+                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset, seed=seed)
+
+def randomAeolian(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset, seed=None):
+    return create_rand_lick(rhythm=rhythm, duration=duration, scale="aeolian", volume_list=volume, jump_prop=jump_prop, 
+                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset, seed=seed)
+
+def randomLocrian(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset, seed=None):
+    return create_rand_lick(rhythm=rhythm, duration=duration, scale="locrian", volume_list=volume, jump_prop=jump_prop, 
+                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset, seed=seed)
+
+def randomMajor(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset, seed=None):
+    return create_rand_lick(rhythm=rhythm, duration=duration, scale="major", volume_list=volume, jump_prop=jump_prop, 
+                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset, seed=seed)
+
+def randomHarmonicMinor(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset, seed=None):
+    return create_rand_lick(rhythm=rhythm, duration=duration, scale="harmonic_minor", volume_list=volume, jump_prop=jump_prop, 
+                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset, seed=seed)
+
+def randomMelodicMinor(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset, seed=None):
+    return create_rand_lick(rhythm=rhythm, duration=duration, scale="melodic_minor", volume_list=volume, jump_prop=jump_prop, 
+                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset, seed=seed)
+
+def randomCromatic(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset, seed=None):
+    return create_rand_lick(rhythm=rhythm, duration=duration, scale="cromatic", volume_list=volume, jump_prop=jump_prop, 
+                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset, seed=seed)
+
+def randomWholeHalfDiminished(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset, seed=None):
+    return create_rand_lick(rhythm=rhythm, duration=duration, scale="whole_half_diminished", volume_list=volume, jump_prop=jump_prop, 
+                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset, seed=seed)
+
+def randomHalfWholeDiminished(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset, seed=None):
+    return create_rand_lick(rhythm=rhythm, duration=duration, scale="half_whole_diminished", volume_list=volume, jump_prop=jump_prop, 
+                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset, seed=seed)
+
+def randomWholeTone(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset, seed=None):
+    return create_rand_lick(rhythm=rhythm, duration=duration, scale="whole_tone", volume_list=volume, jump_prop=jump_prop, 
+                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset, seed=seed)
+
+def randomMinorBlues(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset, seed=None):
+    return create_rand_lick(rhythm=rhythm, duration=duration, scale="minor_blues", volume_list=volume, jump_prop=jump_prop, 
+                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset, seed=seed)
+
+def randomMajorBlues(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset, seed=None):
+    return create_rand_lick(rhythm=rhythm, duration=duration, scale="major_blues", volume_list=volume, jump_prop=jump_prop, 
+                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset, seed=seed)
+
+def randomAltered(rhythm, duration, volume, jump_prop, up_down_prop, midi_root_note, time_offset, seed=None):
+    return create_rand_lick(rhythm=rhythm, duration=duration, scale="altered", volume_list=volume, jump_prop=jump_prop, 
+                            up_down_prop=up_down_prop, midi_root_note=midi_root_note, time_offset=time_offset, seed=seed)
+
+
+#   - shred mode:
+#   - the harmony of the melody is passed by the interpreter, without it one is built from chords and midi_root_notes
+def shredMode(style, duration, chords, midi_root_notes, time_offset, seed=None, harmony=None):
+    if harmony is None:
+        harmony = lr.Harmony(midi_root_notes, chords)
+    return shred_harmony(style_tag=style, harmony=harmony, start=time_offset, stop=min(time_offset+duration, len(harmony)), time_offset=time_offset/2, seed=seed)
+
+#   - pause function:
+def pause(duration):
+    return duration
+
+#           - specials:
+def transposeHarmony(transpose_by,midi_root_notes):
+    transposed_midi_root_notes = []
+    for note in midi_root_notes:
+        transposed_midi_root_notes.append(note + transpose_by)
+    return transposed_midi_root_notes
+
+def enablePracticeMode(midi_root_notes, chord_list):
+    practice_midi_root_notes = []
+    practice_chord_list = []
+    for i in range(0,12):
+        practice_chord_list.extend(chord_list)
+        for note in midi_root_notes:
+            practice_midi_root_notes.append(note + i)
+    return practice_midi_root_notes, practice_chord_list
+
+
+# Midi-Creator Functions:
+#
+#   - merges a reference new dictionary to a reference dictonary 
+def merge_note_dicts(ref_dict, new_dict):
+    # functions that failed already printed their error and returned -1
+    if isinstance(new_dict, int):
+        return ref_dict
+    return ref_dict.extend(new_dict)
+
+#   - writes note dictonary to a midi file, played by the midi program (instrument) on the channel
+#   - pitch bends are only written when the pitch wheel value changes
+def write_midi_from_dict(note_dict, output_filename, tempo=120, time_signature=(4, 4), program=0, channel=0):
+    with lprof.span("write_midi", notes=len(note_dict)):
+        lm.write_midi(note_dict, output_filename, time_signature=time_signature, channel=channel, program=program)
+
+#   - a named part of a lick (e.g. lead, comping or bass) with its own midi program and channel
+#   - every voice is written as its own track
+class Voice:
+
+    def __init__(self, name, program=0, channel=0, notes=None):
+        if not 0 <= program <= 127:
+            raise ValueError(f"The midi program of voice '{name}' must be between 0 and 127, not {program}!")
+        if not 0 <= channel <= 15:
+            raise ValueError(f"The midi channel of voice '{name}' must be between 0 and 15, not {channel}!")
+        self.name = name
+        self.program = program
+        self.channel = channel
+        self.notes = NoteBuffer() if notes is None else notes
+
+#   - writes the notes of all voices as tracks of one midi file
+def write_midi_from_voices(voices, output_filename, tempo=120, time_signature=(4, 4)):
+    with lprof.span("write_midi", notes=sum(len(voice.notes) for voice in voices), tracks=len(voices)):
+        lm.write_midi_tracks([(voice.notes, voice.channel, voice.program, voice.name) for voice in voices], output_filename, time_signature=time_signature)
+
+#   - opens a midi stream, the created licks are pushed into it and written while the lick is created
+#   - voices are added to the stream with add_track, see lick_midi.MidiStreamWriter
+def open_midi_stream(output_filename, tempo=120, time_signature=(4, 4)):
+    return lm.MidiStreamWriter(output_filename, time_signature=time_signature)
+
+#   - writes note dictonary to a midi file through pretty_midi, with one pitch bend per note
+#   - kept as reference for the direct encoder in lick_midi
+def write_midi_with_pretty_midi(note_dict, output_filename, tempo=120, time_signature=(4, 4)):
+    import pretty_midi
+    
+    midi = pretty_midi.PrettyMIDI()
+
+    midi._initial_tempo = tempo
+    numerator, denominator = time_signature
+    midi.time_signature_changes.append(pretty_midi.TimeSignature(numerator, denominator, time=0.0))
+
+    instrument = pretty_midi.Instrument(program=0)
+
+    for pitch, time, note_duration, volume, pitch_wheel_value in zip(note_dict["pitch"], note_dict["time"], note_dict["note_duration"],
+                                                                     note_dict["volume"], note_dict["pitchWheelValue"]):
+        note = pretty_midi.Note(velocity=volume, pitch=pitch, start=time, end=time + note_duration)
+        instrument.notes.append(note)
+
+        pitch_bend_event = pretty_midi.PitchBend(pitch_wheel_value, time)
+        instrument.pitch_bends.append(pitch_bend_event)
+
+    midi.instruments.append(instrument)
+
+    midi.write(output_filename)
+